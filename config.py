@@ -44,6 +44,54 @@ class Settings:
     # Firebase Configuration
     GOOGLE_CLOUD_PROJECT: str = os.getenv("GOOGLE_CLOUD_PROJECT", "")
     FIREBASE_CREDENTIALS_PATH: str = os.getenv("FIREBASE_CREDENTIALS_PATH", "")
+    # 멀티캐스트 배치(최대 500개 토큰)를 동시에 보낼 최대 스레드 수
+    FCM_FANOUT_WORKERS: int = int(os.getenv("FCM_FANOUT_WORKERS", "4"))
+    
+    # Notification Outbox (알림 발송 대기열)
+    # 전송 방식 (fcm | fake: 실제 전송 없이 메모리에 기록, 로컬/테스트용)
+    NOTIFICATION_SENDER: str = os.getenv("NOTIFICATION_SENDER", "fcm")
+    NOTIFICATION_OUTBOX_INTERVAL_SECONDS: int = int(os.getenv("NOTIFICATION_OUTBOX_INTERVAL_SECONDS", "5"))
+    NOTIFICATION_OUTBOX_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", "100"))
+    NOTIFICATION_OUTBOX_MAX_ATTEMPTS: int = int(os.getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", "5"))
+    # 재시도 간격: BACKOFF * 2^(시도 횟수-1)초, 최대 MAX_BACKOFF초
+    NOTIFICATION_OUTBOX_BACKOFF_SECONDS: int = int(os.getenv("NOTIFICATION_OUTBOX_BACKOFF_SECONDS", "30"))
+    NOTIFICATION_OUTBOX_MAX_BACKOFF_SECONDS: int = int(os.getenv("NOTIFICATION_OUTBOX_MAX_BACKOFF_SECONDS", "3600"))
+    
+    # Scheduler (여러 워커 중 DB 잠금을 가진 리더 한 곳에서만 스케줄러 실행)
+    SCHEDULER_LEADER_ELECTION: bool = os.getenv("SCHEDULER_LEADER_ELECTION", "True").lower() == "true"
+    SCHEDULER_LEASE_TTL_SECONDS: int = int(os.getenv("SCHEDULER_LEASE_TTL_SECONDS", "60"))
+    # 마감일 알림 실행 잠금 유지 시간 (실행 중에는 계속 연장, 비정상 종료 시 이 시간이 지나면 다시 실행 가능)
+    DEADLINE_REMINDER_LOCK_TTL_SECONDS: int = int(os.getenv("DEADLINE_REMINDER_LOCK_TTL_SECONDS", "1800"))
+    
+    # Synergy Cache Configuration
+    SYNERGY_MEMBER_CACHE_SIZE: int = int(os.getenv("SYNERGY_MEMBER_CACHE_SIZE", "5000"))
+    SYNERGY_MEMBER_CACHE_TTL_SECONDS: int = int(os.getenv("SYNERGY_MEMBER_CACHE_TTL_SECONDS", "600"))
+    SYNERGY_RESULT_CACHE_SIZE: int = int(os.getenv("SYNERGY_RESULT_CACHE_SIZE", "2000"))
+    SYNERGY_RESULT_CACHE_TTL_SECONDS: int = int(os.getenv("SYNERGY_RESULT_CACHE_TTL_SECONDS", "1800"))
+    
+    # Synergy Inference Worker Pool (thread | process)
+    SYNERGY_WORKER_MODE: str = os.getenv("SYNERGY_WORKER_MODE", "thread")
+    SYNERGY_WORKERS: int = int(os.getenv("SYNERGY_WORKERS", "2"))
+    SYNERGY_QUEUE_SIZE: int = int(os.getenv("SYNERGY_QUEUE_SIZE", "8"))
+    SYNERGY_TIMEOUT_SECONDS: float = float(os.getenv("SYNERGY_TIMEOUT_SECONDS", "10"))
+    
+    # SHAP 설명 모드 (exact | approximate | off)
+    SYNERGY_SHAP_MODE: str = os.getenv("SYNERGY_SHAP_MODE", "exact")
+    # 트리 모델을 NumPy 배열로 변환한 경량 추론기 사용 여부 (지원하지 않으면 원본 모델 사용)
+    SYNERGY_COMPILED_MODEL: bool = os.getenv("SYNERGY_COMPILED_MODEL", "True").lower() == "true"
+    
+    # Profile Cache (마이페이지 프로필)
+    PROFILE_CACHE_SIZE: int = int(os.getenv("PROFILE_CACHE_SIZE", "5000"))
+    PROFILE_CACHE_TTL_SECONDS: int = int(os.getenv("PROFILE_CACHE_TTL_SECONDS", "300"))
+    
+    # Reference Data Cache (스킬/역할/필터/성향 질문/프로필 규칙)
+    REFERENCE_DATA_TTL_SECONDS: int = int(os.getenv("REFERENCE_DATA_TTL_SECONDS", "600"))
+    
+    # Contest Catalog Cache (공모전 목록 인메모리 캐시)
+    CONTEST_CATALOG_ENABLED: bool = os.getenv("CONTEST_CATALOG_ENABLED", "True").lower() == "true"
+    CONTEST_CATALOG_TTL_SECONDS: int = int(os.getenv("CONTEST_CATALOG_TTL_SECONDS", "300"))
+    # 크롤러가 올린 버전을 확인하는 주기
+    CONTEST_CATALOG_VERSION_CHECK_SECONDS: int = int(os.getenv("CONTEST_CATALOG_VERSION_CHECK_SECONDS", "10"))
 
 # 설정 인스턴스 생성
 settings = Settings() 
\ No newline at end of file
@@ -23,6 +23,7 @@ try:
 
     from database import SessionLocal
     from models.contest import Contest, Tag, ContestTag, Filter, ContestFilter
+    from utils.contest_catalog import bump_contest_catalog_version
     DB_AVAILABLE = True
 except ImportError as e:
     print(f"데이터베이스 모듈 import 실패: {e}")
@@ -185,17 +186,20 @@ class TagGenerator:
                     continue
 
             if inserted > 0:
-                session.commit()
-                print(f"DB 저장 완료: {inserted}개 추가, {skipped}개 건너뜀")
-                
-                # 새로 추가된 공모전들에 대해 스킬 매칭 알림 전송
-                try:
-                    from utils.notification_service import NotificationService
+                # 새로 추가된 공모전들의 스킬 매칭 알림을 같은 트랜잭션에서 대기열에 추가
+                # (전송은 API 서버의 알림 디스패처가 처리하므로 크롤러가 FCM 응답을 기다리지 않음)
+                # 알림 등록에 실패해도 새 공모전은 저장되도록 세이브포인트 안에서 처리
+                from utils.notification_service import NotificationService
+                from utils.notification_outbox import notification_savepoint
+                with notification_savepoint(session):
                     for contest in newly_inserted_contests:
                         sent_count = NotificationService.notify_new_contest_with_skill_matching(session, contest)
-                        print(f"  - '{contest.name}' 공모전 스킬 매칭 알림: {sent_count}명에게 전송")
-                except Exception as e:
-                    print(f"  - 스킬 매칭 알림 전송 중 오류: {e}")
+                        print(f"  - '{contest.name}' 공모전 스킬 매칭 알림: {sent_count}명 대기열 등록")
+                
+                # API 서버의 공모전 카탈로그 캐시가 다시 로드되도록 같은 트랜잭션에서 버전 증가
+                bump_contest_catalog_version(session)
+                session.commit()
+                print(f"DB 저장 완료: {inserted}개 추가, {skipped}개 건너뜀")
             else:
                 session.rollback()
                 print("저장할 데이터가 없어 롤백")
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from database import engine, Base
 from config import settings
@@ -7,8 +8,9 @@ from models import *
 from routers import users, registration
 from routers import profile, contests, recruitments, applications, comments, personality, synergy, notifications
 
-# ML 모델 초기화
+# ML 모델 서비스 (모델은 서버 시작 후 백그라운드에서 로드)
 from ml.synergy_service import synergy_service
+from utils.reference_data import reference_data
 import asyncio
 import threading
 import time
@@ -16,6 +18,7 @@ import logging
 from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -30,6 +33,12 @@ def init_database():
         if engine:
             Base.metadata.create_all(bind=engine)
             print("✅ Database tables created successfully")
+            
+            # create_all은 기존 테이블을 바꾸지 않으므로 나중에 추가된 컬럼/인덱스를 보강
+            from utils.schema_upgrade import upgrade_schema
+            upgraded = upgrade_schema(engine)
+            if upgraded["columns"] or upgraded["indexes"]:
+                print(f"✅ Database schema upgraded: {upgraded}")
             return True
         else:
             print("⚠️ Database engine not available")
@@ -54,6 +63,42 @@ def run_deadline_reminders():
     except Exception as e:
         logger.error(f"마감일 알림 스케줄러 실행 중 오류: {e}")
 
+def run_accepted_count_reconcile():
+    """모집 게시글 승인된 지원자 수 카운터 보정"""
+    try:
+        from database import SessionLocal
+        from utils.recruitment_counter import reconcile_accepted_counts
+        
+        db = SessionLocal()
+        try:
+            fixed = reconcile_accepted_counts(db)
+            logger.info(f"✅ 승인된 지원자 수 보정 완료: {fixed}개 게시글 수정")
+        finally:
+            db.close()
+        
+    except Exception as e:
+        logger.error(f"승인된 지원자 수 보정 중 오류: {e}")
+
+def run_notification_outbox():
+    """알림 발송 대기열 전송"""
+    try:
+        from database import SessionLocal
+        from utils.notification_outbox import get_outbox_dispatcher
+        
+        db = SessionLocal()
+        try:
+            stats = get_outbox_dispatcher().dispatch_pending(db)
+            if stats["claimed"]:
+                logger.info(
+                    f"📨 알림 대기열 전송: 성공 {stats['sent']}건, 재시도 예정 {stats['retried']}건, 실패 {stats['failed']}건 "
+                    f"(토큰 전송 성공 {stats['delivered']}건, 실패 {stats['undelivered']}건, 만료 토큰 정리 {stats['pruned']}건)"
+                )
+        finally:
+            db.close()
+        
+    except Exception as e:
+        logger.error(f"알림 대기열 전송 중 오류: {e}")
+
 def init_scheduler():
     """스케줄러 초기화 및 설정"""
     global scheduler
@@ -67,6 +112,40 @@ def init_scheduler():
             trigger=CronTrigger(hour=0, minute=0),
             id='deadline_reminders',
             name='공모전 마감일 알림',
+            misfire_grace_time=3600,
+            coalesce=True,
+            replace_existing=True
+        )
+        
+        # 자정 실행에서 FCM 오류 등으로 보내지 못한(pending) 마감일 알림을 매시 다시 전송
+        scheduler.add_job(
+            func=run_deadline_reminders,
+            trigger=CronTrigger(hour='1-23', minute=0),
+            id='deadline_reminders_retry',
+            name='공모전 마감일 알림 재시도',
+            misfire_grace_time=3600,
+            coalesce=True,
+            replace_existing=True
+        )
+        
+        # 서버 시작 직후 + 매일 새벽 4시에 승인된 지원자 수 카운터 보정
+        scheduler.add_job(
+            func=run_accepted_count_reconcile,
+            trigger=CronTrigger(hour=4, minute=0),
+            id='accepted_count_reconcile',
+            name='승인된 지원자 수 보정',
+            next_run_time=datetime.now(),
+            replace_existing=True
+        )
+        
+        # 알림 발송 대기열을 짧은 주기로 전송 (이전 실행이 끝나지 않았으면 건너뜀)
+        scheduler.add_job(
+            func=run_notification_outbox,
+            trigger=IntervalTrigger(seconds=settings.NOTIFICATION_OUTBOX_INTERVAL_SECONDS),
+            id='notification_outbox',
+            name='알림 발송 대기열 전송',
+            max_instances=1,
+            coalesce=True,
             replace_existing=True
         )
         
@@ -81,21 +160,28 @@ def init_scheduler():
         logger.error(f"스케줄러 초기화 실패: {e}")
         return False
 
-# 데이터베이스 초기화 시도 (실패해도 앱은 계속 실행)
-database_initialized = init_database()
+def shutdown_scheduler():
+    """스케줄러 종료 (리더 잠금을 잃었을 때)"""
+    global scheduler
+    
+    if scheduler and scheduler.running:
+        scheduler.shutdown(wait=False)
+        logger.info("🛑 스케줄러가 종료되었습니다.")
+    scheduler = None
 
-# ML 모델 초기화 상태 확인
-def check_ml_model_status():
-    """ML 모델 로드 상태 확인"""
-    if synergy_service.is_ready():
-        print("🤖 ML 시너지 예측 모델이 성공적으로 로드되었습니다!")
-        return True
-    else:
-        print("⚠️ ML 시너지 예측 모델 로드에 실패했습니다.")
-        print("📝 시너지 분석 기능은 사용할 수 없습니다.")
-        return False
+# 여러 uvicorn 워커 중 DB 잠금을 가진 리더 한 곳에서만 스케줄러 실행
+scheduler_leader = None
+if settings.SCHEDULER_LEADER_ELECTION:
+    from utils.db_lock import LeaderLease
+    scheduler_leader = LeaderLease(
+        name="scheduler",
+        ttl_seconds=settings.SCHEDULER_LEASE_TTL_SECONDS,
+        on_acquired=init_scheduler,
+        on_lost=shutdown_scheduler
+    )
 
-ml_model_ready = check_ml_model_status()
+# 데이터베이스 초기화 시도 (실패해도 앱은 계속 실행)
+database_initialized = init_database()
 
 # FastAPI 앱 객체 생성
 app = FastAPI(
@@ -119,16 +205,35 @@ async def startup_event():
     """서버 시작 시 실행되는 이벤트"""
     logger.info("🚀 TeamUp API 서버가 시작되었습니다.")
     
-    # 백그라운드 스케줄러 시작
-    init_scheduler()
+    # 백그라운드 스케줄러 시작 (리더 선출을 쓰면 리더가 되었을 때 시작)
+    if scheduler_leader:
+        scheduler_leader.start()
+    else:
+        init_scheduler()
+    
+    # 스킬/역할/필터/성향 질문/프로필 규칙 참조 데이터 미리 로드
+    try:
+        reference_data.refresh()
+        logger.info("📚 참조 데이터를 로드했습니다.")
+    except Exception as e:
+        logger.error(f"참조 데이터 로드 실패 (첫 요청 시 다시 시도): {e}")
+    
+    # ML 시너지 예측 모델 워밍업 (요청 처리를 막지 않도록 백그라운드에서 로드)
+    synergy_service.start_loading()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """서버 종료 시 실행되는 이벤트"""
     global scheduler
+    if scheduler_leader:
+        # 스케줄러를 멈추고 리더 잠금을 해제해 다른 워커가 바로 이어받을 수 있도록 함
+        scheduler_leader.stop()
     if scheduler:
         scheduler.shutdown()
         logger.info("🛑 스케줄러가 종료되었습니다.")
+    
+    # 시너지 추론 워커 풀 종료
+    synergy_service.shutdown()
 
 @app.get("/")
 def read_root():
@@ -138,6 +243,18 @@ def read_root():
 def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/ready")
+def readiness_check():
+    """ML 모델 로딩 상태 확인 (준비되지 않았으면 503)"""
+    model_status = synergy_service.status()
+    return JSONResponse(
+        status_code=200 if model_status["ready"] else 503,
+        content={
+            "status": "ready" if model_status["ready"] else "not_ready",
+            "synergy_model": model_status
+        }
+    )
+
 @app.get("/scheduler/status")
 def scheduler_status():
     """스케줄러 상태 확인 엔드포인트"""
@@ -155,12 +272,14 @@ def scheduler_status():
         return {
             "status": "running",
             "message": "백그라운드 스케줄러가 실행 중입니다.",
+            "leader": scheduler_leader.is_leader if scheduler_leader else None,
             "jobs": jobs
         }
     else:
         return {
             "status": "stopped",
-            "message": "스케줄러가 실행되지 않고 있습니다."
+            "message": "스케줄러가 실행되지 않고 있습니다.",
+            "leader": scheduler_leader.is_leader if scheduler_leader else None
         }
 
 @app.post("/scheduler/run-now")
@@ -185,6 +304,13 @@ def restart_scheduler():
     global scheduler
     
     try:
+        # 리더가 아닌 워커에서 스케줄러를 띄우면 알림이 중복 실행되므로 거부
+        if scheduler_leader and not scheduler_leader.is_leader:
+            return {
+                "status": "error",
+                "message": "이 워커는 스케줄러 리더가 아닙니다."
+            }
+        
         if scheduler:
             scheduler.shutdown()
         
@@ -206,6 +332,28 @@ def restart_scheduler():
             "message": f"스케줄러 재시작 실패: {str(e)}"
         }
 
+@app.post("/reference-data/refresh")
+def refresh_reference_data():
+    """참조 데이터(스킬/역할/필터/성향 질문/프로필 규칙) 캐시 수동 갱신"""
+    try:
+        data = reference_data.refresh()
+        return {
+            "status": "success",
+            "message": "참조 데이터를 다시 로드했습니다.",
+            "counts": {
+                "skills": len(data.skills),
+                "roles": len(data.roles),
+                "filters": len(data.filters),
+                "questions": len(data.questions),
+                "profile_rules": len(data.profile_rules)
+            }
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"참조 데이터 갱신 실패: {str(e)}"
+        }
+
 # 라우터들을 여기에 추가할 예정
 app.include_router(users.router, prefix="/api/v1")
 app.include_router(registration.router, prefix="/api/v1")
@@ -1,7 +1,25 @@
 # ML 모듈 초기화
-from .predict import SynergyPredictor
-from .preprocessing import TeamFeatureGenerator
-from .synergy_service import SynergyService, synergy_service
-from .message_generator import SynergyMessageGenerator
+# pandas/sklearn/shap을 사용하는 모듈은 실제로 접근할 때 불러옵니다 (서버 시작 시간 단축)
+import importlib
 
-__all__ = ['SynergyPredictor', 'TeamFeatureGenerator', 'SynergyService', 'synergy_service', 'SynergyMessageGenerator']
+_LAZY_ATTRIBUTES = {
+    'SynergyPredictor': '.predict',
+    'TeamFeatureGenerator': '.preprocessing',
+    'SynergyService': '.synergy_service',
+    'synergy_service': '.synergy_service',
+    'SynergyMessageGenerator': '.message_generator',
+    'TeamSearchEngine': '.team_search',
+    'SynergyExplainer': '.explainer',
+    'CompiledTreeModel': '.compiled_model',
+    'InferencePool': '.inference_pool',
+    'InferenceBusyError': '.inference_pool',
+    'InferenceTimeoutError': '.inference_pool',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = list(_LAZY_ATTRIBUTES)
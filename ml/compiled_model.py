@@ -0,0 +1,222 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+class CompiledTreeModel:
+    """
+    트리 앙상블 분류 모델을 평면 NumPy 배열(분기 피처/임계값/자식/리프 값)로 한 번 변환해
+    DataFrame 없이 float32 피처 행렬에서 바로 양성 클래스 확률을 계산하는 경량 추론기입니다.
+
+    지원 모델
+    - scikit-learn DecisionTreeClassifier, RandomForestClassifier, ExtraTreesClassifier
+    - scikit-learn GradientBoostingClassifier (이진 분류)
+    - XGBoost XGBClassifier (이진 분류, binary:logistic)
+    지원하지 않는 모델이거나 원본 predict_proba와 결과가 다르면 compile()이 None을 반환하고
+    호출 측은 원본 모델을 그대로 사용합니다.
+    """
+
+    PARITY_SAMPLES = 512  # 로드 시 predict_proba와 비교할 샘플 수
+
+    def __init__(self, trees, combine, learning_rate=1.0, offset=0.0, tolerance=1e-9):
+        """
+        trees: [(feature, threshold, left, right, value, missing_left)] 트리별 배열
+               (리프는 left == -1, missing_left는 결측값(NaN)이 왼쪽 자식으로 가는 분기)
+        combine: "mean_proba" (트리별 확률 평균) 또는 "logit" (offset + learning_rate * 리프 합의 시그모이드)
+        tolerance: 원본 predict_proba와 허용하는 최대 오차 (float32로 누적하는 XGBoost는 1e-6)
+        """
+        self.combine = combine
+        self.tolerance = tolerance
+        self.learning_rate = learning_rate
+        self.offset = offset
+        self.n_trees = len(trees)
+
+        # 모든 트리를 하나의 평면 배열로 합치고 트리별 루트 위치를 기록
+        sizes = [len(tree[0]) for tree in trees]
+        self.roots = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.intp)
+        self.feature = np.concatenate([tree[0] for tree in trees]).astype(np.intp)
+        self.threshold = np.concatenate([tree[1] for tree in trees]).astype(np.float64)
+        self.left = np.concatenate([
+            np.where(tree[2] >= 0, tree[2] + root, -1) for tree, root in zip(trees, self.roots)
+        ]).astype(np.intp)
+        self.right = np.concatenate([
+            np.where(tree[3] >= 0, tree[3] + root, -1) for tree, root in zip(trees, self.roots)
+        ]).astype(np.intp)
+        self.value = np.concatenate([tree[4] for tree in trees]).astype(np.float64)
+        self.missing_left = np.concatenate([tree[5] for tree in trees]).astype(bool)
+        self.is_leaf = self.left < 0
+        # 리프 노드는 자기 자신을 가리키게 해서 깊이가 다른 트리도 같은 횟수만큼 내려가도록 함
+        node_ids = np.arange(len(self.feature), dtype=np.intp)
+        self.left = np.where(self.is_leaf, node_ids, self.left)
+        self.right = np.where(self.is_leaf, node_ids, self.right)
+        self.feature = np.where(self.is_leaf, 0, self.feature)
+        self.max_depth = self._max_depth()
+
+    def _max_depth(self):
+        """가장 깊은 리프까지의 분기 횟수"""
+        depth = 0
+        nodes = self.roots[~self.is_leaf[self.roots]]
+        while len(nodes):
+            children = np.concatenate([self.left[nodes], self.right[nodes]])
+            nodes = np.unique(children[~self.is_leaf[children]])
+            depth += 1
+        return depth
+
+    def leaf_values(self, X):
+        """(샘플 수, 트리 수) 리프 값 행렬"""
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], self.n_trees)).copy()
+        for _ in range(self.max_depth):
+            x = X[rows, self.feature[nodes]]
+            go_left = np.where(np.isnan(x), self.missing_left[nodes], x <= self.threshold[nodes])
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes]
+
+    def predict_positive_proba(self, X):
+        """양성 클래스(1) 확률"""
+        values = self.leaf_values(X)
+        if self.combine == "mean_proba":
+            # scikit-learn과 같은 순서로 트리별 확률을 누적
+            total = np.zeros(values.shape[0])
+            for column in range(self.n_trees):
+                total += values[:, column]
+            return total / self.n_trees
+
+        raw = np.full(values.shape[0], self.offset)
+        for column in range(self.n_trees):
+            raw += self.learning_rate * values[:, column]
+        return 1.0 / (1.0 + np.exp(-raw))
+
+    # --- 모델 변환 ---
+    @classmethod
+    def compile(cls, model, feature_names):
+        """모델을 변환하고 predict_proba와 결과가 같은지 확인 (실패하면 None)"""
+        try:
+            compiled = cls._from_model(model)
+        except Exception as e:
+            print(f"트리 모델 변환 실패: {e}")
+            return None
+        if compiled is None:
+            print(f"경량 추론을 지원하지 않는 모델입니다: {type(model).__name__}")
+            return None
+
+        if compiled.combine == "logit":
+            # 초기 예측값(사전 확률 등)은 원본 모델의 margin과 리프 합의 차이로 맞춤
+            probe = np.zeros((1, len(feature_names)), dtype=np.float32)
+            margin = cls._raw_margin(model, pd.DataFrame(probe, columns=feature_names))
+            compiled.offset = float(np.ravel(margin)[0] - compiled.learning_rate * compiled.leaf_values(probe).sum())
+
+        if not compiled._check_parity(model, feature_names):
+            print("경량 추론 결과가 원본 모델과 달라 원본 모델을 사용합니다.")
+            return None
+        return compiled
+
+    def _check_parity(self, model, feature_names):
+        """0~1, 0~100 범위의 무작위 피처로 원본 predict_proba와 비교"""
+        n_features = len(feature_names)
+        rng = np.random.default_rng(0)
+        samples = np.vstack([
+            np.zeros((1, n_features)),
+            rng.random((self.PARITY_SAMPLES, n_features)) * 100,
+            rng.random((self.PARITY_SAMPLES, n_features))
+        ]).astype(np.float32)
+        expected = model.predict_proba(pd.DataFrame(samples, columns=feature_names))[:, 1]
+        return bool(np.allclose(self.predict_positive_proba(samples), expected, rtol=0, atol=self.tolerance))
+
+    @staticmethod
+    def _raw_margin(model, X):
+        if hasattr(model, 'get_booster'):
+            return model.predict(X, output_margin=True)
+        return model.decision_function(X)
+
+    @classmethod
+    def _from_model(cls, model):
+        if getattr(model, 'classes_', None) is not None and len(model.classes_) != 2:
+            return None
+
+        if hasattr(model, 'get_booster'):
+            return cls._from_xgboost(model)
+
+        name = type(model).__name__
+        if name == 'DecisionTreeClassifier':
+            return cls([cls._sklearn_tree(model.tree_, proba=True)], "mean_proba")
+        if name in ('RandomForestClassifier', 'ExtraTreesClassifier'):
+            return cls([cls._sklearn_tree(tree.tree_, proba=True) for tree in model.estimators_], "mean_proba")
+        if name == 'GradientBoostingClassifier':
+            if model.estimators_.shape[1] != 1:
+                return None
+            return cls(
+                [cls._sklearn_tree(tree.tree_, proba=False) for tree in model.estimators_[:, 0]],
+                "logit",
+                learning_rate=model.learning_rate
+            )
+        return None
+
+    @staticmethod
+    def _sklearn_tree(tree, proba):
+        """
+        sklearn Tree 구조를 배열로 변환 (분류 트리는 양성 클래스 비율, 회귀 트리는 리프 값)
+        결측값 방향은 missing_go_to_left를 따르며, 이 속성이 없는 버전은 결측값을 지원하지 않으므로 오른쪽으로 둠
+        """
+        if proba:
+            value = tree.value[:, 0, :]
+            value = value[:, 1] / value.sum(axis=1)
+        else:
+            value = tree.value[:, 0, 0]
+        return (
+            tree.feature.copy(),
+            tree.threshold.copy(),
+            tree.children_left.copy(),
+            tree.children_right.copy(),
+            value,
+            np.asarray(getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count)), dtype=bool)
+        )
+
+    @classmethod
+    def _from_xgboost(cls, model):
+        booster = model.get_booster()
+        objective = json.loads(booster.save_config())['learner']['objective']['name']
+        if objective != 'binary:logistic':
+            return None
+
+        feature_names = booster.feature_names
+        feature_index = {name: i for i, name in enumerate(feature_names)} if feature_names else None
+        trees = [
+            cls._xgboost_tree(json.loads(dump), feature_index)
+            for dump in booster.get_dump(dump_format='json')
+        ]
+        return cls(trees, "logit", tolerance=1e-6)
+
+    @staticmethod
+    def _xgboost_tree(root, feature_index):
+        """
+        XGBoost JSON 덤프 트리를 배열로 변환 (x < 임계값 분기를 x <= 직전 float32 값으로 변환)
+        결측값은 덤프의 missing 자식 방향을 따름
+        """
+        nodes = {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            nodes[node['nodeid']] = node
+            stack.extend(node.get('children', []))
+
+        size = max(nodes) + 1
+        feature = np.zeros(size, dtype=np.intp)
+        threshold = np.zeros(size, dtype=np.float64)
+        left = np.full(size, -1, dtype=np.intp)
+        right = np.full(size, -1, dtype=np.intp)
+        value = np.zeros(size, dtype=np.float64)
+        missing_left = np.zeros(size, dtype=bool)
+        for node_id, node in nodes.items():
+            if 'leaf' in node:
+                value[node_id] = node['leaf']
+                continue
+            split = node['split']
+            feature[node_id] = feature_index[split] if feature_index else int(split.lstrip('f'))
+            threshold[node_id] = np.nextafter(np.float32(node['split_condition']), np.float32(-np.inf))
+            left[node_id] = node['yes']
+            right[node_id] = node['no']
+            missing_left[node_id] = node.get('missing', node['no']) == node['yes']
+        return feature, threshold, left, right, value, missing_left
@@ -0,0 +1,104 @@
+import numpy as np
+
+
+def team_size_issue(team_size):
+    """팀원 수 부족 문제를 나타내는 bad_point (1~3명 팀 모두 같은 페널티)"""
+    return {
+        "feature": "team_size_limitation",
+        "value": team_size if team_size in (1, 2) else 3,
+        "contribution": -0.5
+    }
+
+
+class SynergyExplainer:
+    """
+    예측 행렬 전체에 대한 SHAP 기여도를 배치로 계산하고, 팀별로 상위/하위 k개 피처만 설명으로 만듭니다.
+
+    mode
+    - exact: TreeExplainer의 정확한 tree-path SHAP (기본값)
+    - approximate: Saabas 근사 (shap_values(approximate=True)), 정확도를 약간 낮추고 속도를 높임
+    - off: SHAP을 계산하지 않음 (호출 측에서 fallback 설명 사용)
+    """
+    MODES = ("exact", "approximate", "off")
+
+    def __init__(self, model, shap_explainer=None, mode="exact", top_k=2):
+        if mode not in self.MODES:
+            raise ValueError(f"지원하지 않는 SHAP 모드입니다: {mode}")
+
+        self.mode = mode
+        self.top_k = top_k
+        self.shap_explainer = shap_explainer
+        if self.shap_explainer is None and mode != "off" and model is not None:
+            # 저장된 Explainer가 없으면 트리 모델로 한 번만 생성
+            try:
+                import shap
+                self.shap_explainer = shap.TreeExplainer(model)
+                print("저장된 SHAP Explainer가 없어 TreeExplainer를 생성했습니다.")
+            except Exception as e:
+                print(f"TreeExplainer 생성 실패, fallback 설명을 사용합니다: {e}")
+
+        # 양성 클래스의 expected value는 요청마다 변하지 않으므로 한 번만 계산
+        # (list/ndarray로 반환되면 마지막 값이 양성 클래스)
+        self.baseline = None
+        if self.shap_explainer is not None:
+            self.baseline = round(float(np.ravel(self.shap_explainer.expected_value)[-1]), 4)
+
+    @property
+    def enabled(self):
+        return self.mode != "off" and self.shap_explainer is not None
+
+    def shap_matrix(self, predict_df):
+        """(팀 수, 피처 수) 양성 클래스 SHAP 행렬"""
+        shap_values = self.shap_explainer.shap_values(predict_df, approximate=self.mode == "approximate")
+
+        if isinstance(shap_values, list):
+            # 이진 분류의 경우 SHAP 값이 리스트로 반환됨
+            shap_values = shap_values[1]  # 양성 클래스(1)에 대한 SHAP 값
+        elif shap_values.ndim == 3:
+            shap_values = shap_values[:, :, 1]  # (샘플, 피처, 클래스) 형태
+        return np.asarray(shap_values)
+
+    def explain(self, predict_df, team_sizes):
+        """SHAP 기여도 기준 팀별 설명 생성"""
+        contributions = np.round(self.shap_matrix(predict_df), 4)
+        values = np.round(predict_df.to_numpy(dtype=float), 2)
+        # 기여도 내림차순 (동점이면 피처 순서 유지)
+        order = np.argsort(-contributions, axis=1, kind='stable')
+        return self._build(order, values, contributions, list(predict_df.columns), team_sizes, self.baseline)
+
+    def fallback(self, predict_df, team_sizes):
+        """SHAP을 사용할 수 없을 때 피처 값 크기로 만드는 설명 (기여도 = 값 / 100, baseline 0.5)"""
+        raw = predict_df.to_numpy(dtype=float)
+        rows = raw.tolist()
+        values = [[round(value, 2) for value in row] for row in rows]
+        contributions = [[round(value / 100, 4) for value in row] for row in rows]
+        # 값 내림차순 (동점이면 피처 순서 유지)
+        order = np.argsort(-raw, axis=1, kind='stable')
+        return self._build(order, values, contributions, list(predict_df.columns), team_sizes, 0.5)
+
+    def _build(self, order, values, contributions, columns, team_sizes, baseline):
+        """정렬 순서에서 상위 k개(good_points)와 하위 k개(bad_points)만 골라 설명 생성"""
+        feature_count = order.shape[1]
+
+        explanations = []
+        for row, team_size in enumerate(team_sizes):
+            def point(index):
+                return {
+                    "feature": columns[index],
+                    "value": values[row][index],
+                    "contribution": contributions[row][index]
+                }
+
+            good_points = [point(index) for index in order[row, :self.top_k]]
+            if team_size <= 3:
+                # 팀원 수 부족 문제를 가장 큰 문제로 추가 + 가장 작은 값
+                bad_points = [team_size_issue(team_size)] + [point(index) for index in order[row, feature_count - (self.top_k - 1):]]
+            else:
+                bad_points = [point(index) for index in order[row, feature_count - self.top_k:]]
+
+            explanations.append({
+                "baseline": baseline,
+                "good_points": good_points,
+                "bad_points": bad_points
+            })
+        return explanations
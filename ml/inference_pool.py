@@ -0,0 +1,110 @@
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+
+class InferenceBusyError(RuntimeError):
+    """추론 대기열이 가득 차 요청을 받을 수 없음"""
+
+
+class InferenceTimeoutError(RuntimeError):
+    """추론이 제한 시간 안에 끝나지 않음"""
+
+
+# 프로세스 모드에서 워커 프로세스마다 한 번 로드되는 예측기
+_worker_predictor = None
+
+def _init_worker(model_path, predictor_options):
+    """워커 프로세스 시작 시 모델을 미리 로드"""
+    from .predict import SynergyPredictor
+
+    global _worker_predictor
+    _worker_predictor = SynergyPredictor(model_path, **predictor_options)
+
+
+def run_task(predictor, task, *args):
+    """예측기로 작업 실행 (스레드/프로세스 워커 공통)"""
+    if task == "predict":
+        member_teams, filtering_id = args
+        return predictor.predict_member_batch(member_teams, filtering_id)
+
+    if task == "search":
+        from .team_search import TeamSearchEngine
+
+        fixed_members, candidates, max_new_members, filtering_id, top_k, time_budget = args
+        engine = TeamSearchEngine(predictor, filtering_id, time_budget=time_budget)
+        search_result = engine.search(fixed_members, candidates, max_new_members, top_k=top_k)
+
+        # SHAP 설명은 최종 top-k 팀에 대해서만 한 번에 계산
+        explained = predictor.predict_member_batch(
+            [list(fixed_members) + [candidates[user_id] for user_id in team['user_ids']] for team in search_result['teams']],
+            filtering_id
+        )
+        for team, result in zip(search_result['teams'], explained):
+            team['result'] = result
+        return search_result
+
+    raise ValueError(f"알 수 없는 추론 작업입니다: {task}")
+
+
+def _run_in_process(task, *args):
+    return run_task(_worker_predictor, task, *args)
+
+
+class InferencePool:
+    """
+    시너지 추론 전용 워커 풀
+    - thread: 전용 스레드 풀에서 메인 프로세스의 예측기를 사용 (동시에 실행되는 추론 수를 제한)
+    - process: 모델을 미리 로드한 워커 프로세스에서 실행 (GIL을 API 요청 처리와 공유하지 않음)
+      워커는 spawn으로 새로 시작합니다. 풀은 uvicorn/스케줄러/모델 로딩 스레드가 실행 중인 프로세스에서 만들어지므로
+      fork하면 다른 스레드가 잡고 있던 잠금이 복사되어 워커가 멈출 수 있습니다.
+    실행 중 + 대기 중인 작업이 workers + queue_size를 넘으면 InferenceBusyError,
+    timeout 안에 끝나지 않으면 InferenceTimeoutError를 발생시킵니다.
+    """
+
+    def __init__(self, predictor, model_path, mode="thread", workers=2, queue_size=8, timeout=10.0,
+                 predictor_options=None):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 워커 모드입니다: {mode}")
+
+        self.predictor = predictor
+        self.mode = mode
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+
+        if mode == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(model_path, predictor_options or {})
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="synergy-inference")
+
+    def run(self, task, *args, timeout=None):
+        """작업을 풀에 넣고 결과를 기다림"""
+        if not self._slots.acquire(blocking=False):
+            raise InferenceBusyError("시너지 분석 요청이 많아 잠시 후 다시 시도해주세요.")
+
+        try:
+            if self.mode == "process":
+                future = self._executor.submit(_run_in_process, task, *args)
+            else:
+                future = self._executor.submit(run_task, self.predictor, task, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        # 작업이 실제로 끝나야 자리를 반환 (시간 초과된 작업도 끝날 때까지 자리를 차지)
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise InferenceTimeoutError("시너지 분석 시간이 초과되었습니다.")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,11 +1,55 @@
+import hashlib
 import pandas as pd
 import numpy as np
-from scipy.stats import entropy
+
+class MemberRecord:
+    """
+    팀원 한 명의 역할/스킬/경험 문자열을 매트릭스 인덱스 배열로 한 번만 파싱해 둔 레코드입니다.
+    공모전 분야와 무관한 정보만 담고 있으므로 여러 팀/분야 계산에 그대로 재사용할 수 있습니다.
+    """
+    __slots__ = (
+        'role_skill_rows', 'role_skill_cols', 'skill_contest_rows', 'role_contest_rows',
+        'exp_filter_ids', 'exp_award_status', 'tendency_type', 'goal', 'time', 'problem', '_fingerprint'
+    )
+
+    def __init__(self, role_skill_rows, role_skill_cols, skill_contest_rows, role_contest_rows,
+                 exp_filter_ids, exp_award_status, tendency_type, goal, time, problem):
+        # (역할, 스킬) 모든 조합의 role_skill 매트릭스 좌표 (매트릭스에 없으면 0으로 채운 패딩 인덱스)
+        self.role_skill_rows = role_skill_rows
+        self.role_skill_cols = role_skill_cols
+        # skill_contest / role_contest 매트릭스에 존재하는 스킬/역할의 행 인덱스
+        self.skill_contest_rows = skill_contest_rows
+        self.role_contest_rows = role_contest_rows
+        # "filter_id:award_status" 경험 목록
+        self.exp_filter_ids = exp_filter_ids
+        self.exp_award_status = exp_award_status
+        # 성향 정보
+        self.tendency_type = tendency_type
+        self.goal = goal
+        self.time = time
+        self.problem = problem
+        self._fingerprint = None
+
+    def fingerprint(self):
+        """피처 계산에 쓰이는 모든 값의 해시 (같은 해시면 같은 피처 기여를 가짐, 결과 캐시 키로 사용)"""
+        if self._fingerprint is None:
+            payload = repr((
+                self.role_skill_rows.tolist(), self.role_skill_cols.tolist(),
+                self.skill_contest_rows.tolist(), self.role_contest_rows.tolist(),
+                self.exp_filter_ids.tolist(), self.exp_award_status.tolist(),
+                self.tendency_type, self.goal, self.time, self.problem
+            ))
+            self._fingerprint = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+        return self._fingerprint
+
 
 class TeamFeatureGenerator:
     """
     팀 데이터를 기반으로 머신러닝 모델 학습에 사용할
     팀 벡터(feature vector)를 생성하는 전처리 클래스입니다.
+
+    팀원 정보는 parse_member()로 한 번만 정수 인덱스 배열로 변환하고,
+    피처 계산은 dense 매트릭스에 대한 NumPy gather로 처리합니다.
     """
     def __init__(self, role_skill_matrix_path, skill_contest_matrix_path, role_contest_matrix_path):
         """클래스 초기화 시점에 모든 매트릭스 파일을 한 번만 로드합니다."""
@@ -16,6 +60,7 @@ class TeamFeatureGenerator:
             1: '웹/앱', 2: 'AI/데이터 사이언스', 3: '아이디어/기획',
             4: 'IoT/임베디드', 5: '게임', 6: '정보보안/블록체인'
         }
+        self._build_dense_matrices()
 
     def _load_matrix(self, filepath):
         """CSV 파일을 로드하고 첫 번째 열을 인덱스로 설정합니다."""
@@ -24,29 +69,143 @@ class TeamFeatureGenerator:
         except FileNotFoundError:
             print(f"Error: Matrix file not found at {filepath}.")
             return None
-    
-            
-    def create_team_vector(self, team_df, contest_id):
-        """하나의 팀 데이터에 대해 6가지 기준의 피처 벡터를 생성합니다."""
-        if any(matrix is None for matrix in [self.role_skill_matrix, self.skill_contest_matrix, self.role_contest_matrix]):
+
+    def _build_dense_matrices(self):
+        """매트릭스를 dense NumPy 배열과 이름 -> 인덱스 맵으로 변환합니다."""
+        self.matrices_loaded = not any(
+            matrix is None for matrix in [self.role_skill_matrix, self.skill_contest_matrix, self.role_contest_matrix]
+        )
+        if not self.matrices_loaded:
+            return
+
+        # role_skill 매트릭스는 마지막에 0으로 채운 행/열을 추가해 없는 역할/스킬 조회를 0으로 처리
+        role_skill_values = self.role_skill_matrix.to_numpy(dtype=float)
+        self._role_skill_values = np.pad(role_skill_values, ((0, 1), (0, 1)))
+        self._role_skill_role_index = self._index_map(self.role_skill_matrix.index)
+        self._role_skill_skill_index = self._index_map(self.role_skill_matrix.columns)
+        self._role_skill_missing_row = role_skill_values.shape[0]
+        self._role_skill_missing_col = role_skill_values.shape[1]
+
+        self._skill_contest_values = self.skill_contest_matrix.to_numpy(dtype=float)
+        self._skill_contest_index = self._index_map(self.skill_contest_matrix.index)
+        self._skill_contest_columns = self._index_map(self.skill_contest_matrix.columns)
+
+        self._role_contest_values = self.role_contest_matrix.to_numpy(dtype=float)
+        self._role_contest_index = self._index_map(self.role_contest_matrix.index)
+        self._role_contest_columns = self._index_map(self.role_contest_matrix.columns)
+
+    @staticmethod
+    def _index_map(labels):
+        """라벨 -> 위치 딕셔너리 (중복 라벨은 첫 번째 위치 사용)"""
+        index_map = {}
+        for position, label in enumerate(labels):
+            index_map.setdefault(label, position)
+        return index_map
+
+    def _ensure_matrices(self):
+        if not self.matrices_loaded:
             raise ValueError("매트릭스 파일이 제대로 로드되지 않았습니다.")
 
+    # --- 팀원 파싱 ---
+    def parse_member(self, member):
+        """팀원 딕셔너리(role, skill, experience, tendency_type, goal, time, problem)를 MemberRecord로 변환"""
+        self._ensure_matrices()
+
+        # 역할과 스킬을 쉼표(,) 기준으로 분리하여 리스트로 만듭니다.
+        roles = [r.strip() for r in str(member.get('role', '')).split(',')]
+        skills = [s.strip() for s in str(member.get('skill', '')).split(',')]
+
+        # 역할 x 스킬 조합의 좌표 (평가 기준표에 없는 역할/스킬은 0점 패딩 좌표)
+        rows = np.array(
+            [self._role_skill_role_index.get(role, self._role_skill_missing_row) for role in roles],
+            dtype=np.intp
+        )
+        cols = np.array(
+            [self._role_skill_skill_index.get(skill, self._role_skill_missing_col) for skill in skills],
+            dtype=np.intp
+        )
+        role_skill_rows = np.repeat(rows, len(cols))
+        role_skill_cols = np.tile(cols, len(rows))
+
+        # 공모전 관련성 매트릭스에 존재하는 스킬/역할만 평균에 포함됩니다.
+        skill_contest_rows = np.array(
+            [self._skill_contest_index[skill] for skill in skills if skill in self._skill_contest_index],
+            dtype=np.intp
+        )
+        role_contest_rows = np.array(
+            [self._role_contest_index[role] for role in roles if role in self._role_contest_index],
+            dtype=np.intp
+        )
+
+        exp_filter_ids, exp_award_status = self._parse_experiences(str(member.get('experience', '')))
+
+        return MemberRecord(
+            role_skill_rows=role_skill_rows,
+            role_skill_cols=role_skill_cols,
+            skill_contest_rows=skill_contest_rows,
+            role_contest_rows=role_contest_rows,
+            exp_filter_ids=exp_filter_ids,
+            exp_award_status=exp_award_status,
+            tendency_type=member.get('tendency_type', ''),
+            goal=member.get('goal', ''),
+            time=member.get('time', ''),
+            problem=member.get('problem', '')
+        )
+
+    def parse_members(self, team):
+        """팀 데이터(DataFrame 또는 딕셔너리 리스트)를 MemberRecord 리스트로 변환"""
+        if isinstance(team, pd.DataFrame):
+            team = team.to_dict('records')
+        return [self.parse_member(member) for member in team]
+
+    @staticmethod
+    def _parse_experiences(experience_str):
+        """경험 데이터 파싱: "filter_id:award_status" 형태"""
+        filter_ids = []
+        award_status_list = []
+        if experience_str:
+            for exp in experience_str.split(','):
+                exp = exp.strip()
+                if ':' in exp:
+                    try:
+                        filter_id, award_status = exp.split(':')
+                        filter_id = int(filter_id.strip())
+                        award_status = int(award_status.strip())
+                    except ValueError:
+                        continue
+                    filter_ids.append(filter_id)
+                    award_status_list.append(award_status)
+        return np.array(filter_ids, dtype=np.int64), np.array(award_status_list, dtype=np.int64)
+
+    # --- 팀 벡터 생성 ---
+    def create_team_vector(self, team_df, contest_id):
+        """하나의 팀 데이터(DataFrame 또는 딕셔너리 리스트)에 대해 피처 벡터를 생성합니다."""
+        self._ensure_matrices()
+        return self.create_team_vector_from_members(self.parse_members(team_df), contest_id)
+
+    def create_team_vector_from_members(self, members, contest_id):
+        """미리 파싱된 MemberRecord 리스트로 피처 벡터를 생성합니다."""
+        self._ensure_matrices()
+
         contest_name = self.contest_map.get(contest_id)
         if not contest_name:
             raise ValueError(f"유효하지 않은 공모전 ID입니다: {contest_id}")
 
+        # 팀 크기 페널티는 모든 피처에 공통으로 적용
+        penalty_factor = self._get_small_team_penalty_factor(len(members))
+
         vector = {
-            'role_skill_match_score': self._calculate_role_skill_match(team_df),
-            'contest_skill_relevance_score': self._calculate_contest_skill_relevance(team_df, contest_name),
-            'contest_role_relevance_score': self._calculate_contest_role_relevance(team_df, contest_name),
-            'experience_relevance_score': self._calculate_experience_relevance(team_df, contest_id),
-            'tendency_alignment_score': self._calculate_tendency_alignment(team_df),
-            'leadership_distribution_score': self._calculate_leadership_distribution(team_df),
-            'style_diversity_score': self._calculate_style_diversity_score(team_df),
-            'team_size_factor': self._get_small_team_penalty_factor(len(team_df))
+            'role_skill_match_score': self._calculate_role_skill_match(members) * penalty_factor,
+            'contest_skill_relevance_score': self._calculate_contest_skill_relevance(members, contest_name) * penalty_factor,
+            'contest_role_relevance_score': self._calculate_contest_role_relevance(members, contest_name) * penalty_factor,
+            'experience_relevance_score': self._calculate_experience_relevance(members, contest_id) * penalty_factor,
+            'tendency_alignment_score': self._calculate_tendency_alignment(members) * penalty_factor,
+            'leadership_distribution_score': self._calculate_leadership_distribution(members) * penalty_factor,
+            'style_diversity_score': self._calculate_style_diversity_score(members) * penalty_factor,
+            'team_size_factor': penalty_factor
         }
-        return {k: round(v, 2) for k, v in vector.items()}
-    
+        return {k: round(float(v), 2) for k, v in vector.items()}
+
     def _get_small_team_penalty_factor(self, team_size):
         """팀 규모가 작을 경우 페널티 팩터를 반환하는 함수"""
         if team_size == 1:
@@ -59,222 +218,141 @@ class TeamFeatureGenerator:
             return 0.85 # 4명 팀은 매우 약한 페널티 (85% 반영)
         else: # 5명 이상
             return 1.0  # 페널티 없음
-    
-    # --- 각 피처 계산 메서드 ---
-    def _calculate_role_skill_match(self, team_df):
+
+    @staticmethod
+    def _segment_means(values, segment_ids, member_count):
+        """팀원별로 이어붙인 값 배열을 팀원 단위 평균으로 환원 (값이 없는 팀원은 0)"""
+        sums = np.bincount(segment_ids, weights=values, minlength=member_count)
+        counts = np.bincount(segment_ids, minlength=member_count)
+        return np.divide(sums, counts, out=np.zeros(member_count), where=counts > 0)
+
+    @staticmethod
+    def _concat_indices(members, attribute):
+        """팀원들의 인덱스 배열을 이어붙이고 팀원 번호(segment id) 배열을 함께 반환"""
+        arrays = [getattr(member, attribute) for member in members]
+        lengths = [len(array) for array in arrays]
+        segment_ids = np.repeat(np.arange(len(arrays)), lengths)
+        return np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.intp), segment_ids
+
+    # --- 팀원별 점수 계산 (NumPy gather) ---
+    def member_relevance_scores(self, members, contest_id):
+        """
+        팀원별 평균형 피처 점수 (팀원 수 x 4, 팀 크기 페널티 적용 전)
+        열 순서: role_skill_match, contest_skill_relevance, contest_role_relevance, experience_relevance
+        팀 피처는 이 값들의 팀원 평균이므로 팀 조합 탐색에서 팀원별 기여도/상한 계산에 사용합니다.
+        """
+        self._ensure_matrices()
+
+        contest_name = self.contest_map.get(contest_id)
+        if not contest_name:
+            raise ValueError(f"유효하지 않은 공모전 ID입니다: {contest_id}")
+        if not members:
+            return np.zeros((0, 4))
+
+        return np.column_stack([
+            self._member_role_skill_scores(members) * 100,
+            self._member_contest_skill_scores(members, contest_name) * 100,
+            self._member_contest_role_scores(members, contest_name) * 100,
+            self._member_experience_scores(members, contest_id),
+        ])
+
+    def _member_role_skill_scores(self, members):
+        rows, segment_ids = self._concat_indices(members, 'role_skill_rows')
+        cols, _ = self._concat_indices(members, 'role_skill_cols')
+        # 역할별 스킬 평균의 평균 == 모든 (역할, 스킬) 조합의 평균 (역할마다 스킬 수가 같으므로)
+        return self._segment_means(self._role_skill_values[rows, cols], segment_ids, len(members))
+
+    def _member_contest_skill_scores(self, members, contest_name):
+        column = self._skill_contest_columns.get(contest_name)
+        if column is None:
+            return np.zeros(len(members))
+        rows, segment_ids = self._concat_indices(members, 'skill_contest_rows')
+        return self._segment_means(self._skill_contest_values[rows, column], segment_ids, len(members))
+
+    def _member_contest_role_scores(self, members, contest_name):
+        column = self._role_contest_columns.get(contest_name)
+        if column is None:
+            return np.zeros(len(members))
+        rows, segment_ids = self._concat_indices(members, 'role_contest_rows')
+        return self._segment_means(self._role_contest_values[rows, column], segment_ids, len(members))
+
+    def _member_experience_scores(self, members, contest_id):
+        filter_ids, segment_ids = self._concat_indices(members, 'exp_filter_ids')
+        award_status, _ = self._concat_indices(members, 'exp_award_status')
+        # 같은 분야의 공모전 경험만 반영 (수상 100점, 참가 50점)
+        same_field = filter_ids == contest_id
+        scores = np.where(award_status[same_field] == 1, 100.0, 50.0)
+        return self._segment_means(scores, segment_ids[same_field], len(members))
+
+    # --- 각 피처 계산 메서드 (팀 크기 페널티 적용 전 점수) ---
+    def _calculate_role_skill_match(self, members):
         """팀원이 맡은 여러 역할과 보유 스킬의 적합도를 평가"""
-        member_scores = []
-        for _, member in team_df.iterrows():
-            # 역할과 스킬을 쉼표(,) 기준으로 분리하여 리스트로 만듭니다.
-            roles = [r.strip() for r in str(member.get('role', '')).split(',')]
-            skills = [s.strip() for s in str(member.get('skill', '')).split(',')]
-            
-            if not roles or not skills:
-                member_scores.append(0)
-                continue
-                
-            # 한 사람이 가진 여러 역할에 대한 점수를 저장할 리스트
-            individual_role_scores = []
-            for role in roles:
-                # 현재 역할이 평가 기준표에 없으면 건너뜁니다.
-                if role not in self.role_skill_matrix.index:
-                    individual_role_scores.append(0)
-                    continue
-                
-                # 현재 역할과 스킬들의 적합도 점수를 계산합니다.
-                skill_scores = [self.role_skill_matrix.loc[role].get(skill, 0) for skill in skills]
-                avg_skill_score_for_role = np.mean(skill_scores) if skill_scores else 0
-                individual_role_scores.append(avg_skill_score_for_role)
-            
-            # 한 사람의 최종 점수는 각 역할 점수들의 평균입니다.
-            final_member_score = np.mean(individual_role_scores) if individual_role_scores else 0
-            member_scores.append(final_member_score)
-            
-        # 팀 전체의 최종 점수는 모든 팀원 점수들의 평균입니다.
-        base_score = (np.mean(member_scores) * 100) if member_scores else 0
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return base_score * penalty_factor
-
-    def _calculate_contest_skill_relevance(self, team_df, contest_name):
+        if not members:
+            return 0
+        return np.mean(self._member_role_skill_scores(members)) * 100
+
+    def _calculate_contest_skill_relevance(self, members, contest_name):
         """팀원들의 스킬이 해당 공모전 분야와 얼마나 관련있는지 평가"""
-        if contest_name not in self.skill_contest_matrix.columns:
+        if contest_name not in self._skill_contest_columns or not members:
             return 0
-            
-        member_scores = []
-        for _, member in team_df.iterrows():
-            skills = [s.strip() for s in str(member.get('skill', '')).split(',')]
-            
-            if not skills:
-                member_scores.append(0)
-                continue
-                
-            # 각 스킬의 공모전 관련성 점수를 계산합니다.
-            skill_scores = []
-            for skill in skills:
-                if skill in self.skill_contest_matrix.index:
-                    score = self.skill_contest_matrix.loc[skill, contest_name]
-                    skill_scores.append(score)
-            
-            # 한 사람의 최종 점수는 모든 스킬 점수들의 평균입니다.
-            member_score = np.mean(skill_scores) if skill_scores else 0
-            member_scores.append(member_score)
-            
-        # 팀 전체의 최종 점수는 모든 팀원 점수들의 평균입니다.
-        base_score = (np.mean(member_scores) * 100) if member_scores else 0
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return base_score * penalty_factor
-
-    def _calculate_contest_role_relevance(self, team_df, contest_name):
+        return np.mean(self._member_contest_skill_scores(members, contest_name)) * 100
+
+    def _calculate_contest_role_relevance(self, members, contest_name):
         """팀원들의 역할이 해당 공모전 분야와 얼마나 관련있는지 평가"""
-        if contest_name not in self.role_contest_matrix.columns:
+        if contest_name not in self._role_contest_columns or not members:
             return 0
-            
-        member_scores = []
-        for _, member in team_df.iterrows():
-            roles = [r.strip() for r in str(member.get('role', '')).split(',')]
-            
-            if not roles:
-                member_scores.append(0)
-                continue
-                
-            # 각 역할의 공모전 관련성 점수를 계산합니다.
-            role_scores = []
-            for role in roles:
-                if role in self.role_contest_matrix.index:
-                    score = self.role_contest_matrix.loc[role, contest_name]
-                    role_scores.append(score)
-            
-            # 한 사람의 최종 점수는 모든 역할 점수들의 평균입니다.
-            member_score = np.mean(role_scores) if role_scores else 0
-            member_scores.append(member_score)
-            
-        # 팀 전체의 최종 점수는 모든 팀원 점수들의 평균입니다.
-        base_score = (np.mean(member_scores) * 100) if member_scores else 0
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return base_score * penalty_factor
-
-    def _calculate_experience_relevance(self, team_df, contest_id):
+        return np.mean(self._member_contest_role_scores(members, contest_name)) * 100
+
+    def _calculate_experience_relevance(self, members, contest_id):
         """팀원들의 경험이 해당 공모전 분야와 얼마나 관련있는지 평가"""
-        member_scores = []
-        for _, member in team_df.iterrows():
-            experience_str = str(member.get('experience', ''))
-            
-            if not experience_str:
-                member_scores.append(0)
-                continue
-                
-            # 경험 데이터 파싱: "filter_id:award_status" 형태
-            experiences = []
-            for exp in experience_str.split(','):
-                exp = exp.strip()
-                if ':' in exp:
-                    try:
-                        filter_id, award_status = exp.split(':')
-                        filter_id = int(filter_id.strip())
-                        award_status = int(award_status.strip())
-                        
-                        # 같은 분야의 공모전 경험이 있는지 확인
-                        if filter_id == contest_id:
-                            # 수상 여부에 따라 점수 차등 부여
-                            if award_status == 1:  # 수상
-                                experiences.append(100)
-                            else:  # 참가
-                                experiences.append(50)
-                    except ValueError:
-                        continue
-            
-            # 한 사람의 최종 점수는 모든 경험 점수들의 평균입니다.
-            member_score = np.mean(experiences) if experiences else 0
-            member_scores.append(member_score)
-            
-        # 팀 전체의 최종 점수는 모든 팀원 점수들의 평균입니다.
-        base_score = np.mean(member_scores) if member_scores else 0
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return base_score * penalty_factor
-
-    def _calculate_tendency_alignment(self, team_df):
+        if not members:
+            return 0
+        return np.mean(self._member_experience_scores(members, contest_id))
+
+    def _calculate_tendency_alignment(self, members):
         """팀원들의 성향이 서로 잘 맞는지 평가"""
-        tendency_types = []
-        goals = []
-        times = []
-        problems = []
-        
-        for _, member in team_df.iterrows():
-            tendency_types.append(member.get('tendency_type', ''))
-            goals.append(member.get('goal', ''))
-            times.append(member.get('time', ''))
-            problems.append(member.get('problem', ''))
-        
         # 각 성향 차원별로 다양성 점수 계산
-        tendency_diversity = self._calculate_diversity_score(tendency_types)
-        goal_diversity = self._calculate_diversity_score(goals)
-        time_diversity = self._calculate_diversity_score(times)
-        problem_diversity = self._calculate_diversity_score(problems)
-        
+        tendency_diversity = self._calculate_diversity_score([m.tendency_type for m in members])
+        goal_diversity = self._calculate_diversity_score([m.goal for m in members])
+        time_diversity = self._calculate_diversity_score([m.time for m in members])
+        problem_diversity = self._calculate_diversity_score([m.problem for m in members])
+
         # 전체 성향 정렬 점수 (다양성이 적절할수록 높은 점수)
-        alignment_score = (tendency_diversity + goal_diversity + time_diversity + problem_diversity) / 4
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return alignment_score * penalty_factor
+        return (tendency_diversity + goal_diversity + time_diversity + problem_diversity) / 4
 
-    def _calculate_leadership_distribution(self, team_df):
+    def _calculate_leadership_distribution(self, members):
         """리더십 분포가 적절한지 평가"""
-        leader_count = 0
-        total_members = len(team_df)
-        
-        for _, member in team_df.iterrows():
-            if member.get('tendency_type') == 'LEADER':
-                leader_count += 1
-        
+        total_members = len(members)
+        leader_count = sum(1 for member in members if member.tendency_type == 'LEADER')
+
         # 리더 비율 계산
         leader_ratio = leader_count / total_members if total_members > 0 else 0
-        
+
         # 적절한 리더 비율 (20-40%)일 때 높은 점수
         if 0.2 <= leader_ratio <= 0.4:
-            distribution_score = 100
+            return 100
         elif 0.1 <= leader_ratio <= 0.5:
-            distribution_score = 80
+            return 80
         elif 0.05 <= leader_ratio <= 0.6:
-            distribution_score = 60
+            return 60
         else:
-            distribution_score = 30
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return distribution_score * penalty_factor
+            return 30
 
-    def _calculate_style_diversity_score(self, team_df):
+    def _calculate_style_diversity_score(self, members):
         """팀의 스타일 다양성을 평가"""
-        styles = []
-        for _, member in team_df.iterrows():
-            # 각 팀원의 스타일을 조합하여 고유한 스타일 생성
-            style = f"{member.get('goal', '')}_{member.get('problem', '')}"
-            styles.append(style)
-        
-        diversity_score = self._calculate_diversity_score(styles)
-        
-        # 팀 크기 페널티 적용
-        penalty_factor = self._get_small_team_penalty_factor(len(team_df))
-        return diversity_score * penalty_factor
+        # 각 팀원의 스타일을 조합하여 고유한 스타일 생성
+        styles = [f"{member.goal}_{member.problem}" for member in members]
+        return self._calculate_diversity_score(styles)
 
     def _calculate_diversity_score(self, values):
         """값들의 다양성을 계산하는 헬퍼 함수"""
         if not values:
             return 0
-        
+
         # 고유한 값들의 개수
         unique_count = len(set(values))
         total_count = len(values)
-        
+
         # 다양성 점수 계산 (고유한 값이 많을수록 높은 점수, 단 너무 극단적이면 감점)
         if total_count == 1:
             return 30  # 1명 팀은 낮은 점수
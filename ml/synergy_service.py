@@ -1,14 +1,24 @@
 import os
+import threading
+import time
 from typing import Optional
-from .predict import SynergyPredictor
-from .message_generator import SynergyMessageGenerator
+from config import settings
 
 class SynergyService:
     """
     시너지 예측 서비스 - 싱글톤 패턴으로 모델과 CSV를 한 번만 로드
+    모델은 서버 시작 후 start_loading()으로 백그라운드 스레드에서 로드되며,
+    로드가 끝나기 전까지 is_ready()는 False를 반환합니다.
     """
+    # 로딩 상태
+    NOT_STARTED = "not_started"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+    
     _instance: Optional['SynergyService'] = None
-    _predictor: Optional[SynergyPredictor] = None
+    _predictor = None
+    _pool = None
     _initialized: bool = False
     
     def __new__(cls):
@@ -19,37 +29,140 @@ class SynergyService:
     def __init__(self):
         if not self._initialized:
             self._initialized = True
-            self._load_predictor()
+            self._state = self.NOT_STARTED
+            self._error = None
+            self._load_seconds = None
+            self._state_lock = threading.Lock()
+    
+    def start_loading(self):
+        """백그라운드 스레드에서 모델 로딩 시작 (이미 시작했으면 무시)"""
+        with self._state_lock:
+            if self._state in (self.LOADING, self.READY):
+                return
+            self._state = self.LOADING
+            self._error = None
+        
+        threading.Thread(target=self._load_predictor, name="synergy-model-loader", daemon=True).start()
     
     def _load_predictor(self):
         """모델과 CSV 파일들을 한 번만 로드"""
+        started = time.monotonic()
         try:
+            # pandas/sklearn/shap은 로딩 스레드에서만 import
+            from .predict import SynergyPredictor
+            from .inference_pool import InferencePool
+            
             # 모델 파일 경로
             model_path = os.path.join(os.path.dirname(__file__), '..', 'artifacts', 'predictor.joblib')
             
             print("🔄 시너지 예측 모델 로딩 중...")
-            self._predictor = SynergyPredictor(model_path)
-            print("✅ 시너지 예측 모델 로딩 완료!")
+            predictor_options = {
+                "shap_mode": settings.SYNERGY_SHAP_MODE,
+                "compiled": settings.SYNERGY_COMPILED_MODEL
+            }
+            predictor = SynergyPredictor(model_path, **predictor_options)
+            if not predictor.model:
+                raise RuntimeError("모델 파일을 불러오지 못했습니다.")
+            
+            # 추론은 API 요청 스레드와 분리된 전용 워커 풀에서 실행
+            pool = InferencePool(
+                predictor,
+                model_path,
+                predictor_options=predictor_options,
+                mode=settings.SYNERGY_WORKER_MODE,
+                workers=settings.SYNERGY_WORKERS,
+                queue_size=settings.SYNERGY_QUEUE_SIZE,
+                timeout=settings.SYNERGY_TIMEOUT_SECONDS
+            )
+            print(f"🧵 시너지 추론 워커 풀 시작 (모드: {pool.mode}, 워커: {pool.workers})")
+            
+            with self._state_lock:
+                self._predictor = predictor
+                self._pool = pool
+                self._state = self.READY
+                self._load_seconds = round(time.monotonic() - started, 2)
+            print(f"✅ 시너지 예측 모델 로딩 완료! ({self._load_seconds}초)")
             
         except Exception as e:
             print(f"❌ 시너지 예측 모델 로딩 실패: {e}")
-            self._predictor = None
+            with self._state_lock:
+                self._predictor = None
+                self._pool = None
+                self._state = self.FAILED
+                self._error = str(e)
+    
+    def status(self) -> dict:
+        """모델 로딩 상태 (readiness 확인용)"""
+        return {
+            "state": self._state,
+            "ready": self.is_ready(),
+            "model_version": self.model_version,
+            "load_seconds": self._load_seconds,
+            "error": self._error
+        }
     
     @property
-    def predictor(self) -> Optional[SynergyPredictor]:
+    def predictor(self):
         """예측기 인스턴스 반환"""
         return self._predictor
     
+    @property
+    def model_version(self) -> Optional[str]:
+        """로드된 모델 버전 (결과 캐시 키에 포함)"""
+        return self._predictor.model_version if self._predictor else None
+    
     def is_ready(self) -> bool:
         """모델이 준비되었는지 확인"""
-        return self._predictor is not None
+        return self._state == self.READY
     
     def predict_synergy(self, team_data_list, filtering_id):
         """시너지 예측 실행"""
+        return self.predict_batch([team_data_list], filtering_id)[0]
+    
+    def predict_batch(self, teams, filtering_id):
+        """여러 팀 시너지 일괄 예측 (모델/SHAP 호출 1회)"""
         if not self.is_ready():
             raise RuntimeError("시너지 예측 모델이 로드되지 않았습니다.")
         
-        return self._predictor.predict_and_explain(team_data_list, filtering_id)
+        feature_generator = self._predictor.feature_generator
+        return self.predict_member_batch(
+            [feature_generator.parse_members(team) for team in teams],
+            filtering_id
+        )
+    
+    def predict_member_batch(self, member_teams, filtering_id):
+        """미리 파싱된 MemberRecord 팀 목록 일괄 예측 (파싱 생략)"""
+        if not self.is_ready():
+            raise RuntimeError("시너지 예측 모델이 로드되지 않았습니다.")
+        
+        return self._pool.run("predict", member_teams, filtering_id)
+    
+    def parse_member(self, member_data):
+        """팀원 딕셔너리를 MemberRecord로 파싱 (결과는 호출 측에서 캐시해 재사용)"""
+        if not self.is_ready():
+            raise RuntimeError("시너지 예측 모델이 로드되지 않았습니다.")
+        
+        return self._predictor.feature_generator.parse_member(member_data)
+    
+    def search_best_teams(self, fixed_members, candidates, max_new_members, filtering_id,
+                          top_k=5, time_budget=2.0):
+        """
+        고정 팀원 + 후보 지원자 조합 중 예측 시너지 top-k 팀 탐색
+        fixed_members: MemberRecord 리스트, candidates: {user_id: MemberRecord}
+        """
+        if not self.is_ready():
+            raise RuntimeError("시너지 예측 모델이 로드되지 않았습니다.")
+        
+        # 탐색 시간만큼 대기 제한 시간을 늘려줌
+        return self._pool.run(
+            "search", fixed_members, candidates, max_new_members, filtering_id, top_k, time_budget,
+            timeout=self._pool.timeout + time_budget
+        )
+    
+    def shutdown(self):
+        """추론 워커 풀 종료"""
+        if self._pool:
+            self._pool.shutdown()
 
 # 전역 인스턴스
 synergy_service = SynergyService()
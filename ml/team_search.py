@@ -0,0 +1,201 @@
+import heapq
+import itertools
+import time
+from math import comb
+
+import numpy as np
+
+
+class TeamSearchEngine:
+    """
+    모집글의 지원자 조합 중 예측 시너지가 가장 높은 팀 top-k를 찾는 탐색기입니다.
+
+    - 고정 팀원(작성자, 이미 수락된 지원자)에 대기 중인 지원자를 최대 max_new_members명까지 추가한 조합을 평가합니다.
+    - 조합 수가 적으면 전수 조사, 많으면 팀 크기를 한 명씩 늘려가는 빔 서치를 사용합니다.
+    - 빔 서치에서는 팀원별 평균형 피처 기여도(역할-스킬, 공모전 관련성, 경험)로 만든 잠재 점수를 휴리스틱 필터로 사용합니다.
+      모델 점수의 상한이 아니므로(팀 크기 패널티, 성향/리더십/다양성 피처 미반영) 결과를 보장하지는 않으며,
+      단계마다 잠재 점수 순으로 빔 너비만큼은 항상 평가하고 그보다 많은 확장 조합에만 적용합니다.
+    - 모든 평가는 predict_member_batch로 묶어서 실행하며, time_budget을 넘기면 그때까지의 결과를 반환합니다.
+    """
+
+    EXHAUSTIVE_LIMIT = 2000  # 이 수 이하의 조합은 전수 조사
+    BEAM_WIDTH = 32  # 빔 서치에서 단계별로 유지할 부분 조합 수
+    BATCH_SIZE = 512  # 한 번의 모델 호출로 평가할 최대 팀 수
+
+    def __init__(self, predictor, filtering_id, time_budget=2.0):
+        self.predictor = predictor
+        self.feature_generator = predictor.feature_generator
+        self.filtering_id = filtering_id
+        self.time_budget = time_budget
+
+    def search(self, fixed_members, candidates, max_new_members, top_k=5):
+        """
+        fixed_members: 항상 포함되는 팀원 MemberRecord 리스트
+        candidates: {user_id: MemberRecord} 추가 후보 지원자
+        반환: {"teams": [{"user_ids": [...], "synergy_score": float}], "evaluated_count", "search_mode", "truncated"}
+        """
+        self._deadline = time.monotonic() + self.time_budget
+        self._fixed_members = list(fixed_members)
+        self._candidate_ids = list(candidates.keys())
+        self._candidate_members = [candidates[user_id] for user_id in self._candidate_ids]
+        self._top = []  # (점수, 조합) 최소 힙
+        self._top_k = top_k
+        self._evaluated = 0
+        self._truncated = False
+
+        max_new_members = min(max_new_members, len(self._candidate_ids))
+        if max_new_members <= 0 or top_k <= 0:
+            return self._result("none")
+
+        self._build_bounds()
+
+        total = sum(comb(len(self._candidate_ids), size) for size in range(1, max_new_members + 1))
+        if total <= self.EXHAUSTIVE_LIMIT:
+            mode = "exhaustive"
+            self._search_exhaustive(max_new_members)
+        else:
+            mode = "beam"
+            self._search_beam(max_new_members)
+
+        return self._result(mode)
+
+    # --- 잠재 점수 (빔 서치 휴리스틱) ---
+    def _build_bounds(self):
+        """팀원별 평균형 피처 기여도 합(잠재 점수)을 계산해 빔 서치 후보 정렬/필터에 사용"""
+        all_members = self._fixed_members + self._candidate_members
+        relevance = self.feature_generator.member_relevance_scores(all_members, self.filtering_id)
+        potential = relevance.sum(axis=1)
+        self._fixed_potential_sum = float(potential[:len(self._fixed_members)].sum())
+        self._candidate_potential = potential[len(self._fixed_members):]
+        # 잠재 점수가 높은 후보부터 탐색
+        self._candidate_order = np.argsort(-self._candidate_potential, kind='stable')
+
+    def _potential(self, combo):
+        """조합의 팀원 평균 잠재 점수"""
+        size = len(self._fixed_members) + len(combo)
+        if size == 0:
+            return 0.0
+        return (self._fixed_potential_sum + float(self._candidate_potential[list(combo)].sum())) / size
+
+    def _optimistic_potential(self, combo, remaining_slots):
+        """
+        남은 자리에 잠재 점수가 높은 후보를 채웠을 때의 최대 평균 잠재 점수
+        평균형 피처에 대한 낙관적 추정일 뿐 모델 점수의 상한은 아닙니다.
+        """
+        total = self._fixed_potential_sum + float(self._candidate_potential[list(combo)].sum())
+        size = len(self._fixed_members) + len(combo)
+        best = total / size if size else 0.0
+        added = 0
+        for index in self._candidate_order:
+            if added >= remaining_slots:
+                break
+            if index in combo:
+                continue
+            total += self._candidate_potential[index]
+            size += 1
+            added += 1
+            best = max(best, total / size)
+        return best
+
+    def _kth_best_potential(self):
+        """현재 top-k의 가장 낮은 팀 잠재 점수 (top-k가 다 차지 않았으면 None)"""
+        if len(self._top) < self._top_k:
+            return None
+        return min(self._potential(combo) for _, combo in self._top)
+
+    # --- 탐색 ---
+    def _search_exhaustive(self, max_new_members):
+        combos = (
+            combo
+            for size in range(1, max_new_members + 1)
+            for combo in itertools.combinations(range(len(self._candidate_ids)), size)
+        )
+        while True:
+            chunk = list(itertools.islice(combos, self.BATCH_SIZE))
+            if not chunk:
+                break
+            if self._out_of_time():
+                break
+            self._evaluate(chunk)
+
+    def _search_beam(self, max_new_members):
+        beam = [()]
+        seen = set()
+        for size in range(1, max_new_members + 1):
+            remaining_slots = max_new_members - size
+            threshold = self._kth_best_potential()
+            expansions = []
+            for combo in beam:
+                for index in self._candidate_order:
+                    index = int(index)
+                    if index in combo:
+                        continue
+                    expanded = tuple(sorted(combo + (index,)))
+                    if expanded in seen:
+                        continue
+                    seen.add(expanded)
+                    expansions.append(expanded)
+            if not expansions:
+                break
+
+            if threshold is not None and len(expansions) > self.BEAM_WIDTH:
+                # 휴리스틱 필터: 낙관적 잠재 점수 순으로 빔 너비만큼은 항상 평가하고,
+                # 나머지는 잠재 점수가 현재 top-k 팀들의 잠재 점수보다 낮으면 평가하지 않음 (모델 점수 상한이 아님)
+                optimistic = [self._optimistic_potential(combo, remaining_slots) for combo in expansions]
+                order = sorted(range(len(expansions)), key=lambda i: (-optimistic[i], expansions[i]))
+                expansions = [
+                    expansions[i] for rank, i in enumerate(order)
+                    if rank < self.BEAM_WIDTH or optimistic[i] >= threshold
+                ]
+
+            scored = []
+            for start in range(0, len(expansions), self.BATCH_SIZE):
+                if self._out_of_time():
+                    break
+                chunk = expansions[start:start + self.BATCH_SIZE]
+                scored.extend(zip(self._evaluate(chunk), chunk))
+            if not scored:
+                break
+
+            scored.sort(key=lambda item: item[0], reverse=True)
+            beam = [combo for _, combo in scored[:self.BEAM_WIDTH]]
+            if self._truncated:
+                break
+
+    def _evaluate(self, combos):
+        """조합 목록을 한 번의 배치 예측으로 평가하고 top-k를 갱신"""
+        member_teams = [
+            self._fixed_members + [self._candidate_members[index] for index in combo]
+            for combo in combos
+        ]
+        results = self.predictor.predict_member_batch(member_teams, self.filtering_id, explain=False)
+        scores = [result['synergy_score'] for result in results]
+        self._evaluated += len(combos)
+
+        for score, combo in zip(scores, combos):
+            entry = (score, tuple(-index for index in combo))  # 동점이면 먼저 나온 후보 조합 우선
+            if len(self._top) < self._top_k:
+                heapq.heappush(self._top, (entry, combo))
+            elif entry > self._top[0][0]:
+                heapq.heapreplace(self._top, (entry, combo))
+        return scores
+
+    def _out_of_time(self):
+        if time.monotonic() >= self._deadline:
+            self._truncated = True
+        return self._truncated
+
+    def _result(self, mode):
+        ranked = sorted(self._top, reverse=True)
+        return {
+            "teams": [
+                {
+                    "user_ids": [self._candidate_ids[index] for index in combo],
+                    "synergy_score": entry[0]
+                }
+                for entry, combo in ranked
+            ],
+            "evaluated_count": self._evaluated,
+            "search_mode": mode,
+            "truncated": self._truncated
+        }
@@ -21,6 +21,16 @@ from .recruitment import (
     RecruitmentPost, Application, ApplicationStatus, Comment
 )
 
+# Cache models
+from .cache_version import CacheVersion
+
+# Notification models
+from .notification_outbox import NotificationOutbox
+from .notification_delivery import DeadlineReminderDelivery
+
+# Scheduler models
+from .db_lock import DbLock
+
 
 
 # Export all models
@@ -43,5 +53,13 @@ __all__ = [
     # Recruitment
     "RecruitmentPost", "Application", "ApplicationStatus", "Comment",
     
+    # Cache
+    "CacheVersion",
+    
+    # Notification
+    "NotificationOutbox", "DeadlineReminderDelivery",
+    
+    # Scheduler
+    "DbLock",
 
 ] 
\ No newline at end of file
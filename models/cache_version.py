@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from database import Base
+
+class CacheVersion(Base):
+    """
+    인메모리 캐시 버전 (크롤러 등 다른 프로세스가 데이터를 바꾸면 버전을 올려 API 서버 캐시를 갱신)
+    """
+    __tablename__ = "cache_versions"
+    
+    name = Column(String(50), primary_key=True)  # 캐시 이름 (예: contests)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
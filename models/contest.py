@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
 
 class Contest(Base):
     __tablename__ = "contests"
+    __table_args__ = (
+        # 마감일 순 커서 페이지네이션용 인덱스
+        Index("ix_contests_due_date_contest_id", "due_date", "contest_id"),
+    )
     
     contest_id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(500), nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from database import Base
+
+class DbLock(Base):
+    """
+    여러 프로세스/워커 사이의 작업 잠금 (임대 방식: locked_until이 지나면 다른 소유자가 가져갈 수 있음)
+    예: 스케줄러 리더 선출, 마감일 알림 실행 잠금
+    """
+    __tablename__ = "db_locks"
+    
+    name = Column(String(50), primary_key=True)  # 잠금 이름 (예: scheduler, deadline_reminders)
+    owner = Column(String(100), nullable=False)  # 호스트:PID:임의값
+    locked_until = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy.sql import func
+from database import Base
+
+class DeadlineReminderDelivery(Base):
+    """
+    공모전 마감일 알림 전송 기록 (사용자, 공모전, 남은 일수당 한 번만 전송)
+    status: pending(전송 예정, 실행이 중단되면 다음 실행에서 이어서 전송) -> sent
+    """
+    __tablename__ = "deadline_reminder_deliveries"
+    __table_args__ = (
+        UniqueConstraint("user_id", "contest_id", "days_remaining", name="uq_deadline_reminder_delivery"),
+        # 실행 시 공모전별 전송 기록 조회용 인덱스
+        Index("ix_deadline_reminder_deliveries_contest_id_days", "contest_id", "days_remaining"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(50), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    contest_id = Column(Integer, ForeignKey("contests.contest_id", ondelete="CASCADE"), nullable=False)
+    days_remaining = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default="pending", server_default="pending")
+    run_date = Column(Date, nullable=False)  # 알림 대상이 된 날짜
+    created_at = Column(DateTime, server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from database import Base
+
+class NotificationOutbox(Base):
+    """
+    푸시 알림 발송 대기열 (업무 트랜잭션 안에서 저장하고 백그라운드 디스패처가 전송)
+    status: pending(대기/재시도 대기) -> processing(전송 중) -> sent | failed
+    """
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        # 디스패처가 전송할 알림을 찾는 조회용 인덱스
+        Index("ix_notification_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    notification_type = Column(String(50), nullable=False)
+    user_ids = Column(JSON, nullable=False)  # 수신자 user_id 목록
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    related_data = Column(JSON, nullable=True)
+    status = Column(String(20), nullable=False, default="pending", server_default="pending")
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = Column(DateTime, nullable=False)  # 이 시각 이후 전송 (재시도 시 백오프만큼 늦춤)
+    claimed_at = Column(DateTime, nullable=True)  # processing으로 가져간 시각 (오래되면 다시 pending)
+    sent_count = Column(Integer, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    sent_at = Column(DateTime, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database import Base
@@ -11,6 +11,10 @@ class ApplicationStatus(enum.Enum):
 
 class RecruitmentPost(Base):
     __tablename__ = "recruitment_posts"
+    __table_args__ = (
+        # 공모전별 최신순 피드 조회용 인덱스
+        Index("ix_recruitment_posts_contest_id_created_at", "contest_id", "created_at"),
+    )
     
     recruitment_post_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(String(50), ForeignKey("users.user_id"), nullable=False)  # 작성자
@@ -18,6 +22,7 @@ class RecruitmentPost(Base):
     title = Column(String(50), nullable=False)
     content = Column(Text, nullable=False)
     recruitment_count = Column(Integer, nullable=False)
+    accepted_count = Column(Integer, nullable=False, default=0, server_default="0")  # 승인된 지원자 수 (지원 상태 변경 시 갱신)
     created_at = Column(DateTime, server_default=func.now())
     
     # Foreign Keys
@@ -30,6 +35,10 @@ class RecruitmentPost(Base):
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # 게시글별 상태(승인된 지원자 수 등) 조회용 인덱스
+        Index("ix_applications_recruitment_post_id_status", "recruitment_post_id", "status"),
+    )
     
     application_id = Column(Integer, primary_key=True, autoincrement=True)
     recruitment_post_id = Column(Integer, ForeignKey("recruitment_posts.recruitment_post_id"), nullable=False)
@@ -14,6 +14,8 @@ from schemas.recruitment import (
     UserActivityApplication
 )
 from utils.notification_service import NotificationService
+from utils.notification_outbox import notification_savepoint
+from utils.recruitment_counter import adjust_accepted_count
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
@@ -46,11 +48,10 @@ def create_application(
     )
     
     db.add(db_application)
-    db.commit()
-    db.refresh(db_application)
     
-    # 게시글 작성자에게 새로운 지원 알림 전송
-    try:
+    # 게시글 작성자에게 보낼 새로운 지원 알림을 같은 트랜잭션에서 대기열에 추가 (전송은 백그라운드 디스패처가 처리)
+    # 알림 등록에 실패해도 지원은 저장되도록 세이브포인트 안에서 처리
+    with notification_savepoint(db):
         # 게시글 정보 가져오기
         recruitment_post = db.query(RecruitmentPost).filter(
             RecruitmentPost.recruitment_post_id == application.recruitment_post_id
@@ -67,8 +68,9 @@ def create_application(
                 recruitment_post_id=recruitment_post.recruitment_post_id,
                 application_message=application.message
             )
-    except Exception as e:
-        print(f"Error sending new application notification: {e}")
+    
+    db.commit()
+    db.refresh(db_application)
     
     return db_application
 
@@ -80,11 +82,11 @@ def accept_applications(
     """
     지원자 수락
     """
-    # 해당 게시글의 지원들을 찾아서 status를 accepted로 변경
+    # 해당 게시글의 지원들을 찾아서 status를 accepted로 변경 (동시 변경 시 카운터가 어긋나지 않도록 잠금)
     applications = db.query(Application).filter(
         Application.recruitment_post_id == status_update.recruitment_post_id,
         Application.user_id.in_(status_update.user_ids)
-    ).all()
+    ).with_for_update().all()
     
     if not applications:
         raise HTTPException(
@@ -97,17 +99,25 @@ def accept_applications(
         RecruitmentPost.recruitment_post_id == status_update.recruitment_post_id
     ).first()
     
+    newly_accepted = 0
     for application in applications:
+        if application.status != ApplicationStatus.accepted:
+            newly_accepted += 1
         application.status = ApplicationStatus.accepted
-        
-        # 지원자에게 수락 알림 전송
-        if recruitment_post:
-            NotificationService.notify_application_response(
-                db=db,
-                application_user_id=application.user_id,
-                recruitment_post_id=status_update.recruitment_post_id,
-                status="accepted"
-            )
+    
+    # 승인된 지원자 수 카운터를 같은 트랜잭션에서 갱신
+    adjust_accepted_count(db, status_update.recruitment_post_id, newly_accepted)
+    
+    # 지원자들에게 보낼 수락 알림을 대기열에 추가 (아래 커밋과 함께 저장, 실패해도 수락은 유지)
+    if recruitment_post:
+        with notification_savepoint(db):
+            for application in applications:
+                NotificationService.notify_application_response(
+                    db=db,
+                    application_user_id=application.user_id,
+                    recruitment_post_id=status_update.recruitment_post_id,
+                    status="accepted"
+                )
     
     db.commit()
     
@@ -124,7 +134,7 @@ def reject_application(
     application = db.query(Application).filter(
         Application.recruitment_post_id == reject_data.recruitment_post_id,
         Application.user_id == reject_data.user_id
-    ).first()
+    ).with_for_update().first()
     
     if not application:
         raise HTTPException(
@@ -137,16 +147,20 @@ def reject_application(
         RecruitmentPost.recruitment_post_id == reject_data.recruitment_post_id
     ).first()
     
+    # 이미 승인된 지원자를 거절하면 승인된 지원자 수 감소
+    if application.status == ApplicationStatus.accepted:
+        adjust_accepted_count(db, reject_data.recruitment_post_id, -1)
     application.status = ApplicationStatus.rejected
     
-    # 지원자에게 거절 알림 전송
+    # 지원자에게 보낼 거절 알림을 대기열에 추가 (아래 커밋과 함께 저장, 실패해도 거절은 유지)
     if recruitment_post:
-        NotificationService.notify_application_response(
-            db=db,
-            application_user_id=application.user_id,
-            recruitment_post_id=reject_data.recruitment_post_id,
-            status="rejected"
-        )
+        with notification_savepoint(db):
+            NotificationService.notify_application_response(
+                db=db,
+                application_user_id=application.user_id,
+                recruitment_post_id=reject_data.recruitment_post_id,
+                status="rejected"
+            )
     
     db.commit()
     
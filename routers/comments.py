@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from database import get_db
 from models.recruitment import Comment, RecruitmentPost
 from models.user import User
@@ -12,6 +12,8 @@ from schemas.recruitment import (
     ReplyCreate
 )
 from utils.notification_service import NotificationService
+from utils.notification_outbox import notification_savepoint
+from utils.comment_query import load_comment_thread
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
@@ -48,11 +50,10 @@ def create_comment(
     )
     
     db.add(db_comment)
-    db.commit()
-    db.refresh(db_comment)
     
-    # 알림 전송
-    try:
+    # 알림을 같은 트랜잭션에서 대기열에 추가 (전송은 백그라운드 디스패처가 처리)
+    # 알림 등록에 실패해도 댓글은 저장되도록 세이브포인트 안에서 처리
+    with notification_savepoint(db):
         # 게시글 정보 가져오기
         recruitment_post = db.query(RecruitmentPost).filter(
             RecruitmentPost.recruitment_post_id == comment.recruitment_post_id
@@ -81,43 +82,35 @@ def create_comment(
                         recruitment_post_id=recruitment_post.recruitment_post_id,
                         comment_content=comment.content
                     )
-    except Exception as e:
-        print(f"Error sending notification: {e}")
+    
+    db.commit()
+    db.refresh(db_comment)
     
     return db_comment
 
 @router.get("/post/{recruitment_post_id}", response_model=List[CommentWithReplies])
 def get_comments_by_post(
     recruitment_post_id: int,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="최상위 댓글 페이지 크기 (없으면 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     db: Session = Depends(get_db)
 ):
     """
     특정 게시글의 모든 댓글 조회 (대댓글 포함)
+    limit을 지정하면 최상위 댓글을 최신순으로 나눠 조회하고, 다음 페이지 커서를 X-Next-Cursor 헤더로 반환합니다.
     """
-    # 최상위 댓글만 조회 (parent_comment_id가 null인 것들)
-    top_level_comments = db.query(Comment).filter(
-        Comment.recruitment_post_id == recruitment_post_id,
-        Comment.parent_comment_id.is_(None)
-    ).order_by(Comment.created_at.desc()).all()
-    
-    # 각 최상위 댓글에 대댓글 정보 추가
-    comments_with_replies = []
-    for comment in top_level_comments:
-        # 해당 댓글의 대댓글들 조회
-        replies = db.query(Comment).filter(
-            Comment.parent_comment_id == comment.comment_id
-        ).order_by(Comment.created_at.asc()).all()
-        
-        comment_with_replies = CommentWithReplies(
-            comment_id=comment.comment_id,
-            recruitment_post_id=comment.recruitment_post_id,
-            user_id=comment.user_id,
-            parent_comment_id=comment.parent_comment_id,
-            content=comment.content,
-            created_at=comment.created_at,
-            replies=replies
+    try:
+        # 댓글 스레드와 작성자 이름을 한 번에 조회해 조립
+        comments_with_replies, next_cursor = load_comment_thread(db, recruitment_post_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        comments_with_replies.append(comment_with_replies)
+    
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     
     return comments_with_replies
 
@@ -1,18 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from database import get_db
-from models.contest import Contest, Tag, ContestTag, Filter, ContestFilter
+from models.contest import Contest, Filter, ContestFilter
 from schemas.contest import ContestListResponse, Contest as ContestSchema
-from typing import List
+from utils.contest_query import (
+    contest_list_query, load_contests, get_contest_with_tags, count_contests, paginate_contests, encode_cursor
+)
+from utils.contest_catalog import contest_catalog, etag_matches
+from utils.reference_data import reference_data
+from typing import List, Optional
 
 router = APIRouter(prefix="/contests", tags=["contests"])
 
+def _catalog_etag(request: Request, response: Response, db: Session):
+    """
+    인메모리 공모전 카탈로그와 304 응답 여부 반환
+    반환: (카탈로그 또는 None, 304 응답 또는 None). 카탈로그가 없으면 호출 측은 DB에서 조회합니다.
+    """
+    catalog = contest_catalog.get(db)
+    if catalog is None:
+        return None, None
+
+    etag = catalog.response_etag()
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return catalog, Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return catalog, None
+
 @router.get("/filters", response_model=List[dict])
-def get_available_filters(db: Session = Depends(get_db)):
+def get_available_filters(request: Request, response: Response, db: Session = Depends(get_db)):
     """필터 목록 조회"""
     try:
-        filters = db.query(Filter).order_by(Filter.filter_id.asc()).all()
+        catalog, not_modified = _catalog_etag(request, response, db)
+        if not_modified:
+            return not_modified
+        if catalog:
+            return catalog.filters
+        
+        filters = reference_data.get(db).filters.values()
         return [
             {
                 "filter_id": filter.filter_id,
@@ -27,35 +53,54 @@ def get_available_filters(db: Session = Depends(get_db)):
         )
 
 @router.get("/", response_model=ContestListResponse)
-def get_contests(db: Session = Depends(get_db)):
-    """공모전 목록 조회"""
+def get_contests(
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="페이지 크기 (없으면 전체 목록)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    active_only: bool = Query(False, description="마감되지 않은 공모전만 조회"),
+    filter_id: Optional[int] = Query(None, description="필터 ID"),
+    tag: Optional[str] = Query(None, description="태그명"),
+    db: Session = Depends(get_db)
+):
+    """공모전 목록 조회 (마감일 순, limit/cursor로 페이지 조회 가능)"""
     try:
-        # 전체 공모전 수 조회
-        total_count = db.query(func.count(Contest.contest_id)).scalar()
-        
-        # 공모전 목록 조회 (마감일 기준 오름차순) - 태그 정보 포함
-        contests = db.query(Contest)\
-            .outerjoin(ContestTag, Contest.contest_id == ContestTag.contest_id)\
-            .outerjoin(Tag, ContestTag.tag_id == Tag.tag_id)\
-            .order_by(Contest.due_date.asc())\
-            .all()
-        
-        # 각 공모전에 태그 정보 추가
-        for contest in contests:
-            contest.tags = []
-            contest_tags = db.query(ContestTag, Tag)\
-                .join(Tag, ContestTag.tag_id == Tag.tag_id)\
-                .filter(ContestTag.contest_id == contest.contest_id)\
-                .all()
-            
-            for contest_tag, tag in contest_tags:
-                contest.tags.append(tag)
+        catalog, not_modified = _catalog_etag(request, response, db)
+        if not_modified:
+            return not_modified
+        if catalog:
+            # 인메모리 카탈로그에서 DB 조회와 같은 조건/순서/커서로 응답
+            matched = catalog.list_contests(filter_id=filter_id, active_only=active_only, tag=tag)
+            contests = catalog.after_cursor(matched, cursor)
+            next_cursor = None
+            if limit is not None:
+                next_cursor = encode_cursor(contests[limit - 1]) if len(contests) > limit else None
+                contests = contests[:limit]
+            return ContestListResponse(
+                contests=contests,
+                total_count=len(matched),
+                next_cursor=next_cursor
+            )
+        
+        query = contest_list_query(db, filter_id=filter_id, active_only=active_only, tag=tag)
+        
+        # 전체 공모전 수 조회 (조건별로 짧은 시간 캐시)
+        total_count = count_contests(query, cache_key=("contests", filter_id, active_only, tag))
+        
+        # 공모전 목록 조회 (마감일 기준 오름차순) - 태그는 한 번에 조회
+        contests, next_cursor = paginate_contests(db, query, limit, cursor)
         
         return ContestListResponse(
             contests=contests,
-            total_count=total_count
+            total_count=total_count,
+            next_cursor=next_cursor
         )
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -63,9 +108,24 @@ def get_contests(db: Session = Depends(get_db)):
         )
 
 @router.get("/filter/{filter_id}", response_model=ContestListResponse)
-def get_contests_by_filter(filter_id: int, db: Session = Depends(get_db)):
+def get_contests_by_filter(filter_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """필터 ID에 따른 공모전 목록 조회"""
     try:
+        catalog, not_modified = _catalog_etag(request, response, db)
+        if catalog and filter_id not in catalog.filter_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Filter with ID {filter_id} not found"
+            )
+        if not_modified:
+            return not_modified
+        if catalog:
+            contests = catalog.list_contests(filter_id=filter_id)
+            return ContestListResponse(
+                contests=contests,
+                total_count=len(contests)
+            )
+        
         # 필터 존재 여부 확인
         filter_exists = db.query(Filter).filter(Filter.filter_id == filter_id).first()
         if not filter_exists:
@@ -80,23 +140,8 @@ def get_contests_by_filter(filter_id: int, db: Session = Depends(get_db)):
             .filter(ContestFilter.filter_id == filter_id)\
             .scalar()
         
-        # 해당 필터의 공모전 목록 조회 (마감일 기준 오름차순)
-        contests = db.query(Contest)\
-            .join(ContestFilter, Contest.contest_id == ContestFilter.contest_id)\
-            .filter(ContestFilter.filter_id == filter_id)\
-            .order_by(Contest.due_date.asc())\
-            .all()
-        
-        # 각 공모전에 태그 정보 추가
-        for contest in contests:
-            contest.tags = []
-            contest_tags = db.query(ContestTag, Tag)\
-                .join(Tag, ContestTag.tag_id == Tag.tag_id)\
-                .filter(ContestTag.contest_id == contest.contest_id)\
-                .all()
-            
-            for contest_tag, tag in contest_tags:
-                contest.tags.append(tag)
+        # 해당 필터의 공모전 목록 조회 (마감일 기준 오름차순) - 태그는 한 번에 조회
+        contests = load_contests(db, contest_list_query(db, filter_id=filter_id))
         
         return ContestListResponse(
             contests=contests,
@@ -116,28 +161,22 @@ def get_contests_by_filter(filter_id: int, db: Session = Depends(get_db)):
 from datetime import date
 
 @router.get("/latest", response_model=List[ContestSchema])
-def get_latest_contests(db: Session = Depends(get_db)):
+def get_latest_contests(request: Request, response: Response, db: Session = Depends(get_db)):
     """D-day 기준 공모전 3개 조회 """
     try:
+        catalog, not_modified = _catalog_etag(request, response, db)
+        if not_modified:
+            return not_modified
+        if catalog:
+            return catalog.list_contests(active_only=True)[:3]
+        
         today = date.today()
         
-        # D-day 기준 공모전 3개 조회
-        latest_contests = db.query(Contest)\
-            .filter(Contest.due_date >= today)\
-            .order_by(Contest.due_date.asc())\
-            .limit(3)\
-            .all()
-        
-        # 각 공모전에 태그 정보 추가
-        for contest in latest_contests:
-            contest.tags = []
-            contest_tags = db.query(ContestTag, Tag)\
-                .join(Tag, ContestTag.tag_id == Tag.tag_id)\
-                .filter(ContestTag.contest_id == contest.contest_id)\
-                .all()
-            
-            for contest_tag, tag in contest_tags:
-                contest.tags.append(tag)
+        # D-day 기준 공모전 3개 조회 (태그 포함)
+        latest_contests = load_contests(
+            db,
+            contest_list_query(db).filter(Contest.due_date >= today).limit(3)
+        )
         
         return latest_contests
         
@@ -148,26 +187,27 @@ def get_latest_contests(db: Session = Depends(get_db)):
         )
 
 @router.get("/{contest_id}", response_model=ContestSchema)
-def get_contest_detail(contest_id: int, db: Session = Depends(get_db)):
+def get_contest_detail(contest_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     """공모전 상세 정보 조회"""
     try:
-        contest = db.query(Contest).filter(Contest.contest_id == contest_id).first()
+        catalog, not_modified = _catalog_etag(request, response, db)
+        if catalog:
+            contest = catalog.contests_by_id.get(contest_id)
+            if not contest:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Contest not found"
+                )
+            return not_modified or contest
+        
+        # 공모전과 태그 정보 조회
+        contest = get_contest_with_tags(db, contest_id)
         if not contest:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Contest not found"
             )
         
-        # 태그 정보 추가
-        contest.tags = []
-        contest_tags = db.query(ContestTag, Tag)\
-            .join(Tag, ContestTag.tag_id == Tag.tag_id)\
-            .filter(ContestTag.contest_id == contest.contest_id)\
-            .all()
-        
-        for contest_tag, tag in contest_tags:
-            contest.tags.append(tag)
-        
         return contest
         
     except HTTPException:
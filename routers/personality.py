@@ -2,20 +2,16 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from database import get_db
-from models.personality import (
-    Question as QuestionModel, 
-    Option as OptionModel, 
-    UserTraitProfile as UserTraitProfileModel, 
-    ProfileRule as ProfileRuleModel
-)
+from models.personality import UserTraitProfile as UserTraitProfileModel
 from schemas.personality import (
     QuestionListResponse, 
     SubmitTestRequest, 
     TestResultResponse, 
     TraitProfile
 )
-from typing import List
-import json
+from utils.cache import invalidate_user_caches
+from utils.reference_data import reference_data, ProfileRuleRef
+from typing import List, Optional
 
 router = APIRouter(prefix="/personality", tags=["personality"])
 
@@ -23,20 +19,14 @@ router = APIRouter(prefix="/personality", tags=["personality"])
 def get_questions(db: Session = Depends(get_db)):
     """모든 질문과 보기 조회"""
     try:
-        questions = db.query(QuestionModel)\
-            .order_by(QuestionModel.order_no)\
-            .all()
-        
-        # 각 질문에 보기 추가
-        for question in questions:
-            
-            options = db.query(OptionModel)\
-                .filter(OptionModel.question_id == question.id)\
-                .order_by(OptionModel.order_no)\
-                .all()
-            
-            
-            question.options = options
+        # 질문과 보기는 참조 데이터 캐시에서 조회 (질문 순서, 보기 순서대로)
+        questions = [
+            {
+                **question._asdict(),
+                "options": [option._asdict() for option in question.options]
+            }
+            for question in reference_data.get(db).questions.values()
+        ]
         
         return QuestionListResponse(
             questions=questions,
@@ -54,15 +44,16 @@ def submit_personality_test(request: SubmitTestRequest, db: Session = Depends(ge
     try:
         # 답변에서 trait_tag 추출
         traits = {}
+        references = reference_data.get(db)
         for answer in request.answers:
-            option = db.query(OptionModel).filter(OptionModel.id == answer.option_id).first()
+            option = references.options.get(answer.option_id)
             if not option:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid option_id: {answer.option_id}"
                 )
             
-            question = db.query(QuestionModel).filter(QuestionModel.id == answer.question_id).first()
+            question = references.questions.get(answer.question_id)
             if not question:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -102,6 +93,9 @@ def submit_personality_test(request: SubmitTestRequest, db: Session = Depends(ge
         db.commit()
         db.refresh(trait_profile)
         
+        # 시너지 분석 등 사용자 캐시 무효화
+        invalidate_user_caches(request.user_id)
+        
         # 결과 응답
         return TestResultResponse(
             profile_code=profile_rule.profile_code,
@@ -120,45 +114,10 @@ def submit_personality_test(request: SubmitTestRequest, db: Session = Depends(ge
             detail=f"Internal server error: {str(e)}"
         )
 
-def find_matching_profile(traits: dict, db: Session) -> ProfileRuleModel:
+def find_matching_profile(traits: dict, db: Session) -> Optional[ProfileRuleRef]:
     """사용자 답변과 ProfileRule을 매칭하여 최적의 성향 찾기"""
-    # 모든 ProfileRule 조회
-    profile_rules = db.query(ProfileRuleModel).all()
-    
-    best_match = None
-    best_score = -1
-    
-    for rule in profile_rules:
-        required_tags = rule.required_tags_json
-        
-        # JSON이 문자열인 경우 파싱
-        if isinstance(required_tags, str):
-            try:
-                required_tags = json.loads(required_tags)
-            except json.JSONDecodeError:
-                continue
-        
-        # required_tags가 리스트가 아닌 경우 처리
-        if not isinstance(required_tags, list): 
-            continue
-        
-        # 일치하는 태그 개수 계산
-        match_count = 0
-        for tag in required_tags:
-            if tag in traits.values():
-                match_count += 1
-        
-        # 매칭 점수 계산 (부분 일치도 고려)
-        if match_count > 0:
-            # 매칭 비율과 우선순위를 고려한 점수 계산
-            match_ratio = match_count / len(required_tags)
-            score = (match_ratio * 1000) - rule.priority + match_count
-            
-            if score > best_score:
-                best_score = score
-                best_match = rule
-    
-    return best_match
+    # 참조 데이터 캐시의 규칙으로 미리 만든 역색인 매칭기 사용 (태그를 공유하는 규칙만 점수 계산)
+    return reference_data.get(db).profile_matcher.best_match(traits)
 
 @router.get("/user-profile/{user_id}", response_model=TraitProfile)
 def get_user_profile(user_id: str, db: Session = Depends(get_db)):
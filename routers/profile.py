@@ -12,6 +12,9 @@ from schemas.user import (
     SkillUpdate, RoleUpdate, ExperienceUpdate, ExperienceCreate
 )
 from utils.auth import get_current_user
+from utils.cache import invalidate_user_caches
+from utils.profile_loader import load_user_profile
+from utils.reference_data import reference_data
 from typing import List
 
 router = APIRouter(prefix="/profile", tags=["profile"])
@@ -93,6 +96,13 @@ def update_user_skills(
         # 데이터베이스에 저장
         db.commit()
         
+        # 시너지 분석 등 사용자 캐시 무효화
+        invalidate_user_caches(current_user.user_id)
+        
+        # 사용자 정의 스킬이 추가되었으면 참조 데이터 캐시 갱신
+        if custom_skills_data:
+            reference_data.refresh(db)
+        
         return {
             "message": "스킬이 성공적으로 수정되었습니다.",
             "updated_skills": {
@@ -186,6 +196,13 @@ def update_user_roles(
         # 데이터베이스에 저장
         db.commit()
         
+        # 시너지 분석 등 사용자 캐시 무효화
+        invalidate_user_caches(current_user.user_id)
+        
+        # 사용자 정의 역할이 추가되었으면 참조 데이터 캐시 갱신
+        if custom_roles_data:
+            reference_data.refresh(db)
+        
         return {
             "message": "역할이 성공적으로 수정되었습니다.",
             "updated_roles": {
@@ -238,6 +255,9 @@ def update_user_experiences(
         # 데이터베이스에 저장
         db.commit()
         
+        # 시너지 분석 등 사용자 캐시 무효화
+        invalidate_user_caches(current_user.user_id)
+        
         return {
             "message": "공모전 수상 경험이 성공적으로 수정되었습니다.",
             "updated_experiences_count": len(experience_update.experiences)
@@ -259,18 +279,11 @@ def get_user_skills(
 ):
     """프로필 - 현재 사용자의 스킬 조회"""
     try:
-        # 사용자의 스킬 정보 조회
-        user_skills = db.query(UserSkill).filter(UserSkill.user_id == current_user.user_id).all()
-        
-        skill_ids = []
-        
-        for user_skill in user_skills:
-            skill = db.query(Skill).filter(Skill.skill_id == user_skill.skill_id).first()
-            if skill:
-                skill_ids.append(skill.skill_id)
+        # 사용자의 스킬 정보 조회 (캐시된 프로필 사용)
+        profile = load_user_profile(db, current_user.user_id, user=current_user)
         
         return {
-            "skill_ids": skill_ids
+            "skill_ids": list(profile.skill_ids)
         }
         
     except Exception as e:
@@ -286,18 +299,11 @@ def get_user_roles(
 ):
     """프로필 - 현재 사용자의 역할 조회"""
     try:
-        # 사용자의 역할 정보 조회
-        user_roles = db.query(UserRole).filter(UserRole.user_id == current_user.user_id).all()
-        
-        role_ids = []
-        
-        for user_role in user_roles:
-            role = db.query(Role).filter(Role.role_id == user_role.role_id).first()
-            if role:
-                role_ids.append(role.role_id)
+        # 사용자의 역할 정보 조회 (캐시된 프로필 사용)
+        profile = load_user_profile(db, current_user.user_id, user=current_user)
         
         return {
-            "role_ids": role_ids
+            "role_ids": list(profile.role_ids)
         }
         
     except Exception as e:
@@ -313,20 +319,10 @@ def get_user_experiences(
 ):
     """프로필 - 현재 사용자의 공모전 수상 경험 조회"""
     try:
-        # 사용자의 경험 정보 조회
-        experiences = db.query(Experience).filter(Experience.user_id == current_user.user_id).all()
-        
-        return [
-            {
-                "contest_name": exp.contest_name,
-                "award_date": exp.award_date,
-                "host_organization": exp.host_organization,
-                "award_status": exp.award_status,
-                "description": exp.description,
-                "filter_id": exp.filter_id
-            }
-            for exp in experiences
-        ]
+        # 사용자의 경험 정보 조회 (캐시된 프로필 사용)
+        profile = load_user_profile(db, current_user.user_id, user=current_user)
+        
+        return profile.experience_list()
         
     except Exception as e:
         raise HTTPException(
@@ -341,60 +337,28 @@ def get_user_mypage(
 ):
     """특정 사용자의 프로필 정보 조회"""
     try:
-        # 사용자 조회
-        user = db.query(User).filter(User.user_id == user_id, User.is_deleted == False).first()
-        if not user:
+        # 사용자 프로필 조회 (스킬/역할/경험/성향을 한 번에 조회 후 사용자별 캐시)
+        profile = load_user_profile(db, user_id)
+        if not profile or profile.is_deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="사용자를 찾을 수 없습니다."
             )
         
-        # 사용자의 스킬 정보 조회
-        user_skills = db.query(UserSkill).filter(UserSkill.user_id == user_id).all()
-        skill_ids = []
-        
-        for user_skill in user_skills:
-            skill = db.query(Skill).filter(Skill.skill_id == user_skill.skill_id).first()
-            if skill:
-                skill_ids.append(skill.skill_id)
-        
-        # 사용자의 역할 정보 조회
-        user_roles = db.query(UserRole).filter(UserRole.user_id == user_id).all()
-        role_ids = []
-        
-        for user_role in user_roles:
-            role = db.query(Role).filter(Role.role_id == user_role.role_id).first()
-            if role:
-                role_ids.append(role.role_id)
-        
-        # 사용자의 경험 정보 조회
-        experiences = db.query(Experience).filter(Experience.user_id == user_id).all()
-        experience_list = [
-            {
-                "contest_name": exp.contest_name,
-                "award_date": exp.award_date,
-                "host_organization": exp.host_organization,
-                "award_status": exp.award_status,
-                "description": exp.description,
-                "filter_id": exp.filter_id
-            }
-            for exp in experiences
-        ]
-        
         return {
             "user_info": {
-                "user_id": user.user_id,
-                "name": user.name,
-                "email": user.email,
-                "is_deleted": user.is_deleted
+                "user_id": profile.user_id,
+                "name": profile.name,
+                "email": profile.email,
+                "is_deleted": profile.is_deleted
             },
             "skills": {
-                "skill_ids": skill_ids
+                "skill_ids": list(profile.skill_ids)
             },
             "roles": {
-                "role_ids": role_ids
+                "role_ids": list(profile.role_ids)
             },
-            "experiences": experience_list
+            "experiences": profile.experience_list()
         }
         
     except HTTPException:
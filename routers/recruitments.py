@@ -1,14 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional
 from datetime import date
 from database import get_db
-from models.recruitment import RecruitmentPost, Application, ApplicationStatus
-from models.contest import Contest, ContestFilter
+from models.recruitment import RecruitmentPost
+from models.contest import Contest
 from models.user import User
-from schemas.recruitment import RecruitmentPostCreate, RecruitmentPostResponse, RecruitmentPostUpdate, RecruitmentPostList
+from schemas.recruitment import (
+    RecruitmentPostCreate, RecruitmentPostResponse, RecruitmentPostUpdate, RecruitmentPostList, RecruitmentFeedResponse
+)
 from utils.auth import get_current_user
+from utils.recruitment_query import recruitment_post_query, recruitment_feed_query, paginate_feed, to_post_dict
 
 router = APIRouter(prefix="/recruitments", tags=["recruitments"])
 
@@ -43,34 +46,13 @@ def get_latest_recruitment_posts(
     """
     today = date.today()
     
-    recruitment_posts = db.query(RecruitmentPost, Contest.due_date, Contest.name).join(
-        Contest, RecruitmentPost.contest_id == Contest.contest_id
-    ).filter(Contest.due_date >= today).order_by(RecruitmentPost.created_at.desc()).limit(3).all()
+    # 게시글, 공모전 정보, 승인된 지원자 수, 필터를 한 번에 조회
+    recruitment_posts = recruitment_post_query(db)\
+        .filter(Contest.due_date >= today)\
+        .order_by(RecruitmentPost.created_at.desc())\
+        .limit(3).all()
     
-    # 결과를 RecruitmentPostList 형태로 변환
-    result = []
-    for post, due_date, contest_name in recruitment_posts:
-        # accepted된 지원자 수 계산
-        accepted_count = db.query(Application).filter(
-            Application.recruitment_post_id == post.recruitment_post_id,
-            Application.status == ApplicationStatus.accepted
-        ).count()
-        
-        post_dict = {
-            "recruitment_post_id": post.recruitment_post_id,
-            "title": post.title,
-            "content": post.content,
-            "recruitment_count": post.recruitment_count,
-            "contest_id": post.contest_id,
-            "contest_name": contest_name,
-            "user_id": post.user_id,
-            "created_at": post.created_at,
-            "due_date": due_date,
-            "accepted_count": accepted_count
-        }
-        result.append(RecruitmentPostList(**post_dict))
-    
-    return result
+    return [RecruitmentPostList(**to_post_dict(row)) for row in recruitment_posts]
 
 @router.get("/read", response_model=List[RecruitmentPostList])
 def get_recruitment_posts(
@@ -79,42 +61,40 @@ def get_recruitment_posts(
     """
     모든 모집 게시글 목록 조회 (페이징 없음)
     """
-    # RecruitmentPost와 Contest를 조인하여 due_date와 contest_name 정보를 가져옴
-    recruitment_posts = db.query(RecruitmentPost, Contest.due_date, Contest.name).join(
-        Contest, RecruitmentPost.contest_id == Contest.contest_id
-    ).all()
+    # 게시글, 공모전 정보, 승인된 지원자 수, 필터를 한 번에 조회
+    recruitment_posts = recruitment_post_query(db)\
+        .order_by(RecruitmentPost.recruitment_post_id.asc()).all()
     
-    # 결과를 RecruitmentPostList 형태로 변환
-    result = []
-    for post, due_date, contest_name in recruitment_posts:
-        # accepted된 지원자 수 계산
-        accepted_count = db.query(Application).filter(
-            Application.recruitment_post_id == post.recruitment_post_id,
-            Application.status == ApplicationStatus.accepted
-        ).count()
-        
-        # contest_id에 해당하는 filter_id 조회 (contest당 하나의 filter)
-        filter_result = db.query(ContestFilter.filter_id).filter(
-            ContestFilter.contest_id == post.contest_id
-        ).first()
-        filter_id = filter_result[0] if filter_result else None
-        
-        post_dict = {
-            "recruitment_post_id": post.recruitment_post_id,
-            "title": post.title,
-            "content": post.content,
-            "recruitment_count": post.recruitment_count,
-            "contest_id": post.contest_id,
-            "contest_name": contest_name,
-            "user_id": post.user_id,
-            "created_at": post.created_at,
-            "due_date": due_date,
-            "accepted_count": accepted_count,
-            "filter_id": filter_id
-        }
-        result.append(RecruitmentPostList(**post_dict))
+    return [RecruitmentPostList(**to_post_dict(row)) for row in recruitment_posts]
+
+@router.get("/feed", response_model=RecruitmentFeedResponse)
+def get_recruitment_feed(
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    filter_id: Optional[int] = Query(None, description="공모전 필터 ID"),
+    contest_id: Optional[int] = Query(None, description="공모전 ID"),
+    status_filter: Optional[str] = Query(None, alias="status", description="open: 모집 중, closed: 마감/모집 완료"),
+    author: Optional[str] = Query(None, description="작성자 user_id"),
+    db: Session = Depends(get_db)
+):
+    """
+    모집 게시글 피드 조회 (최신순, limit/cursor로 페이지 조회)
+    """
+    try:
+        query = recruitment_feed_query(
+            db, filter_id=filter_id, contest_id=contest_id, status=status_filter, author=author
+        )
+        rows, next_cursor = paginate_feed(query, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    return result
+    return RecruitmentFeedResponse(
+        posts=[RecruitmentPostList(**to_post_dict(row)) for row in rows],
+        next_cursor=next_cursor
+    )
 
 @router.get("/{recruitment_post_id}", response_model=RecruitmentPostResponse)
 def get_recruitment_post(
@@ -124,10 +104,9 @@ def get_recruitment_post(
     """
     특정 모집 게시글 조회
     """
-    # RecruitmentPost와 Contest를 조인하여 due_date와 contest_name 정보를 가져옴
-    result = db.query(RecruitmentPost, Contest.due_date, Contest.name).join(
-        Contest, RecruitmentPost.contest_id == Contest.contest_id
-    ).filter(RecruitmentPost.recruitment_post_id == recruitment_post_id).first()
+    # 게시글, 공모전 정보, 승인된 지원자 수, 필터를 한 번에 조회
+    result = recruitment_post_query(db)\
+        .filter(RecruitmentPost.recruitment_post_id == recruitment_post_id).first()
     
     if not result:
         raise HTTPException(
@@ -135,36 +114,7 @@ def get_recruitment_post(
             detail="게시글을 찾을 수 없습니다."
         )
     
-    post, due_date, contest_name = result
-    
-    # contest_id에 해당하는 filter_id 조회 
-    filter_result = db.query(ContestFilter.filter_id).filter(
-        ContestFilter.contest_id == post.contest_id
-    ).first()
-    filter_id = filter_result[0] if filter_result else None
-    
-    # accepted된 지원자 수 계산
-    accepted_count = db.query(Application).filter(
-        Application.recruitment_post_id == post.recruitment_post_id,
-        Application.status == ApplicationStatus.accepted
-    ).count()
-    
-    # 결과를 RecruitmentPostResponse 형태로 변환
-    post_dict = {
-        "recruitment_post_id": post.recruitment_post_id,
-        "title": post.title,
-        "content": post.content,
-        "recruitment_count": post.recruitment_count,
-        "contest_id": post.contest_id,
-        "contest_name": contest_name,
-        "user_id": post.user_id,
-        "created_at": post.created_at,
-        "due_date": due_date,
-        "accepted_count": accepted_count,
-        "filter_id": filter_id
-    }
-    
-    return RecruitmentPostResponse(**post_dict)
+    return RecruitmentPostResponse(**to_post_dict(result))
 
 @router.put("/update/{recruitment_post_id}", response_model=RecruitmentPostResponse)
 def update_recruitment_post(
@@ -238,28 +188,12 @@ def get_recruitment_posts_by_contest(
     """
     특정 콘테스트 모집 게시글 목록 조회
     """
-    # RecruitmentPost와 Contest를 조인하여 due_date와 contest_name 정보를 가져옴
-    recruitment_posts = db.query(RecruitmentPost, Contest.due_date, Contest.name).join(
-        Contest, RecruitmentPost.contest_id == Contest.contest_id
-    ).filter(RecruitmentPost.contest_id == contest_id).all()
+    # 게시글, 공모전 정보, 승인된 지원자 수, 필터를 한 번에 조회
+    recruitment_posts = recruitment_post_query(db)\
+        .filter(RecruitmentPost.contest_id == contest_id)\
+        .order_by(RecruitmentPost.recruitment_post_id.asc()).all()
     
-    # 결과를 RecruitmentPostList 형태로 변환
-    result = []
-    for post, due_date, contest_name in recruitment_posts:
-        post_dict = {
-            "recruitment_post_id": post.recruitment_post_id,
-            "title": post.title,
-            "content": post.content,
-            "recruitment_count": post.recruitment_count,
-            "contest_id": post.contest_id,
-            "contest_name": contest_name,
-            "user_id": post.user_id,
-            "created_at": post.created_at,
-            "due_date": due_date
-        }
-        result.append(RecruitmentPostList(**post_dict))
-    
-    return result
+    return [RecruitmentPostList(**to_post_dict(row)) for row in recruitment_posts]
 
 @router.get("/check-author/{recruitment_post_id}")
 def check_post_author(
@@ -296,25 +230,9 @@ def get_written_posts_by_user(
     """
     특정 사용자가 작성한 게시글 목록 조회
     """
-    # RecruitmentPost와 Contest를 조인하여 due_date와 contest_name 정보를 가져옴
-    recruitment_posts = db.query(RecruitmentPost, Contest.due_date, Contest.name).join(
-        Contest, RecruitmentPost.contest_id == Contest.contest_id
-    ).filter(RecruitmentPost.user_id == user_id).all()
-    
-    # 결과를 RecruitmentPostList 형태로 변환
-    result = []
-    for post, due_date, contest_name in recruitment_posts:
-        post_dict = {
-            "recruitment_post_id": post.recruitment_post_id,
-            "title": post.title,
-            "content": post.content,
-            "recruitment_count": post.recruitment_count,
-            "contest_id": post.contest_id,
-            "contest_name": contest_name,
-            "user_id": post.user_id,
-            "created_at": post.created_at,
-            "due_date": due_date
-        }
-        result.append(RecruitmentPostList(**post_dict))
+    # 게시글, 공모전 정보, 승인된 지원자 수, 필터를 한 번에 조회
+    recruitment_posts = recruitment_post_query(db)\
+        .filter(RecruitmentPost.user_id == user_id)\
+        .order_by(RecruitmentPost.recruitment_post_id.asc()).all()
     
-    return result
\ No newline at end of file
+    return [RecruitmentPostList(**to_post_dict(row)) for row in recruitment_posts]
\ No newline at end of file
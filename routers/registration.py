@@ -9,8 +9,6 @@ from models.user_role import UserRole
 from models.experience import Experience
 from models.contest import Filter
 from models.personality import (
-    Question as QuestionModel, 
-    Option as OptionModel, 
     UserTraitProfile as UserTraitProfileModel, 
     ProfileRule as ProfileRuleModel
 )
@@ -25,6 +23,7 @@ from schemas.user import (
 )
 from utils.auth import get_password_hash, create_access_token
 from utils.email_auth import send_verification_email, verify_email_code, mark_email_as_verified, generate_verification_code, store_verification_code, is_email_verified
+from utils.reference_data import reference_data
 from datetime import datetime, timedelta
 from typing import List
 from config import settings 
@@ -181,7 +180,7 @@ def register(user: UserCreateWithVerification, db: Session = Depends(get_db)):
 def get_available_skills(db: Session = Depends(get_db)):
     """사용 가능한 스킬 목록 조회"""
     try:
-        skills = db.query(Skill).all()
+        skills = reference_data.get(db).skills.values()
         return [
             {
                 "skill_id": skill.skill_id,
@@ -199,7 +198,7 @@ def get_available_skills(db: Session = Depends(get_db)):
 def get_available_roles(db: Session = Depends(get_db)):
     """사용 가능한 역할 목록 조회"""
     try:
-        roles = db.query(Role).all()
+        roles = reference_data.get(db).roles.values()
         return [
             {
                 "role_id": role.role_id,
@@ -448,20 +447,18 @@ def complete_step4(step4: RegistrationStep4, db: Session = Depends(get_db)):
             profile_code = step4.personality_result.profile_code
         else:
             traits = {}
+            references = reference_data.get(db)
             for i, answer in enumerate(step4.answers):
                 
                 # option_id를 order_no로 처리 
-                option = db.query(OptionModel).filter(
-                    OptionModel.question_id == answer.question_id,
-                    OptionModel.order_no == answer.option_id
-                ).first()
+                option = references.option_by_order(answer.question_id, answer.option_id)
                 if not option:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Invalid option_id: {answer.option_id} for question_id: {answer.question_id}"
                     )
                 
-                question = db.query(QuestionModel).filter(QuestionModel.id == answer.question_id).first()
+                question = references.questions.get(answer.question_id)
                 if not question:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -615,6 +612,10 @@ def complete_registration(user_id: str, db: Session = Depends(get_db)):
         # 커밋
         db.commit()
         
+        # 사용자 정의 스킬/역할이 추가되었으면 참조 데이터 캐시 갱신
+        if step2_data["custom_skills"] or step2_data["custom_roles"]:
+            reference_data.refresh(db)
+        
         # 세션 정리
         del registration_sessions[user_id]
         
@@ -1,210 +1,174 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
 from database import get_db
-from models.user import User
-from models.user_skill import UserSkill as UserSkillModel
-from models.user_role import UserRole as UserRoleModel
-from models.experience import Experience
-from models.personality import UserTraitProfile, ProfileRule
-from models.skill import Skill
-from models.role import Role
-from models.contest import Filter
+from models.contest import Filter, ContestFilter
+from models.recruitment import RecruitmentPost, Application, ApplicationStatus
 from schemas.synergy import (
-    SynergyRequest, SynergyResponse, SynergyUser, UserSkill, UserRole, 
-    UserTrait, SynergyAnalysisRequest, SynergyAnalysisResponse,
-    ApplicantData
+    SynergyRequest, SynergyResponse, SynergyAnalysisResponse,
+    ApplicantData, SynergyBatchRequest, SynergyBatchItem, SynergyBatchResponse,
+    BestTeam, BestTeamResponse
 )
 from ml.synergy_service import synergy_service
 from ml.message_generator import SynergyMessageGenerator
+from ml.inference_pool import InferenceBusyError, InferenceTimeoutError
+from utils.synergy_loader import SynergyMember, load_synergy_members, synergy_member_cache
+from utils.cache import TTLCache, register_user_invalidator
+from config import settings
 
-from typing import List
-import json
+from typing import List, Optional
 
 router = APIRouter(prefix="/synergy", tags=["synergy"])
 
-# 머신러닝 예측 함수
-def predict_synergy(data: SynergyAnalysisRequest) -> SynergyAnalysisResponse:
-    """
-    실제 머신러닝 모델을 사용한 시너지 예측 함수 (최적화된 버전)
-    """
-    try:
-        # 팀 데이터를 딕셔너리 리스트로 변환
-        team_data_list = []
-        for applicant in data.applicants:
-            team_data_list.append({
-                'role': applicant.role,
-                'skill': applicant.skill,
-                'experience': applicant.experience,
-                'tendency_type': applicant.tendency_type,
-                'goal': applicant.goal,
-                'time': applicant.time,
-                'problem': applicant.problem
-            })
-        
-        # 싱글톤 서비스를 통한 머신러닝 예측 실행
-        result = synergy_service.predict_synergy(team_data_list, data.filtering_id)
-        
-        # 메시지 생성
-        message_generator = SynergyMessageGenerator()
-        description_message = message_generator.generate_messages(result['explanation'])
-        
-        # explanation에 메시지 추가
-        explanation_with_messages = result['explanation'].copy()
-        
-        # 소수점을 일의자리까지 표시 
-        explanation_with_messages['baseline'] = float(f"{explanation_with_messages['baseline']:.1f}")
-        
-        # good_points에 메시지 추가
-        for i, point in enumerate(explanation_with_messages['good_points']):
-            feature = point['feature']
-            if feature in description_message['detailed_analysis']:
-                explanation_with_messages['good_points'][i]['message'] = description_message['detailed_analysis'][feature]['message']
-            # 소수점 조정 
-            explanation_with_messages['good_points'][i]['value'] = float(f"{point['value']:.1f}")
-            explanation_with_messages['good_points'][i]['contribution'] = float(f"{point['contribution']:.1f}")
-        
-        # bad_points에 메시지 추가
-        for i, point in enumerate(explanation_with_messages['bad_points']):
-            feature = point['feature']
-            if feature in description_message['detailed_analysis']:
-                explanation_with_messages['bad_points'][i]['message'] = description_message['detailed_analysis'][feature]['message']
-            # 소수점 조정 
-            explanation_with_messages['bad_points'][i]['value'] = float(f"{point['value']:.1f}")
-            explanation_with_messages['bad_points'][i]['contribution'] = float(f"{point['contribution']:.1f}")
-        
-        # SynergyAnalysisResponse로 변환
-        return SynergyAnalysisResponse(
-            synergy_score=float(f"{result['synergy_score']:.1f}"),
-            explanation=explanation_with_messages
-        )
-        
-    except Exception as e:
-        print(f"머신러닝 예측 중 오류 발생: {e}")
-        # 오류 발생 시 기본 응답 반환
-        return SynergyAnalysisResponse(
-            synergy_score=50.0,
-            explanation={
-                "baseline": 0.5,
-                "good_points": [],
-                "bad_points": []
-            }
-        )
+# 배치 분석 시 한 번에 받을 수 있는 최대 팀 수
+MAX_BATCH_TEAMS = 100
 
-# Synergy용 함수들
-def get_user_skills_detailed(db: Session, user_id: str) -> List[UserSkill]:
-    """사용자의 스킬 정보를 상세하게 가져옵니다."""
-    user_skills = db.query(UserSkillModel).join(Skill).filter(
-        UserSkillModel.user_id == user_id
-    ).all()
-    
-    return [
-        UserSkill(
-            skill_name=user_skill.skill.name
-        ) for user_skill in user_skills
-    ]
+# 팀 시너지 결과 캐시 ((팀원 ID, 팀원 피처 해시, filtering_id, 모델 버전) -> SynergyAnalysisResponse)
+synergy_result_cache = TTLCache(
+    maxsize=settings.SYNERGY_RESULT_CACHE_SIZE,
+    ttl=settings.SYNERGY_RESULT_CACHE_TTL_SECONDS
+)
+# 팀원 중 한 명이라도 프로필이 바뀌면 해당 팀 결과 제거
+register_user_invalidator(
+    lambda user_id: synergy_result_cache.invalidate_where(lambda key: user_id in key[0])
+)
 
-def get_user_roles_detailed(db: Session, user_id: str) -> List[UserRole]:
-    """사용자의 역할 정보를 상세하게 가져옵니다."""
-    user_roles = db.query(UserRoleModel).join(Role).filter(
-        UserRoleModel.user_id == user_id
-    ).all()
-    
+def _to_team_data_list(applicants: List[ApplicantData]) -> List[dict]:
+    """팀 데이터를 딕셔너리 리스트로 변환"""
     return [
-        UserRole(
-            role_name=user_role.role.name
-        ) for user_role in user_roles
+        {
+            'role': applicant.role,
+            'skill': applicant.skill,
+            'experience': applicant.experience,
+            'tendency_type': applicant.tendency_type,
+            'goal': applicant.goal,
+            'time': applicant.time,
+            'problem': applicant.problem
+        }
+        for applicant in applicants
     ]
 
+def _member_records(members: List[SynergyMember]) -> list:
+    """SynergyMember의 MemberRecord 반환 (캐시된 사용자는 파싱을 다시 하지 않음)"""
+    for member in members:
+        if member.record is None:
+            member.record = synergy_service.parse_member(_to_team_data_list([member.applicant])[0])
+    return [member.record for member in members]
 
+def _result_cache_key(filtering_id: int, members: List[SynergyMember]) -> tuple:
+    """팀원 순서와 무관한 결과 캐시 키 (_member_records 호출 이후 사용)"""
+    ordered = sorted(members, key=lambda member: member.user_id)
+    feature_hash = hashlib.sha1(
+        "|".join(member.record.fingerprint() for member in ordered).encode('utf-8')
+    ).hexdigest()
+    return (
+        tuple(member.user_id for member in ordered),
+        feature_hash,
+        filtering_id,
+        synergy_service.model_version
+    )
 
-def get_user_traits_detailed(db: Session, user_id: str) -> UserTrait:
-    """사용자의 성향 정보를 상세하게 가져옵니다."""
-    trait_profile = db.query(UserTraitProfile).filter(
-        UserTraitProfile.user_id == user_id
-    ).first()
-    
-    if trait_profile and trait_profile.profile_code:
-        # profile_rules 테이블에서 display_name 조회
-        profile_rule = db.query(ProfileRule).filter(
-            ProfileRule.profile_code == trait_profile.profile_code
-        ).first()
-        
-        if profile_rule:
-            return UserTrait(
-                profile_code=trait_profile.profile_code,
-                display_name=profile_rule.display_name
-            )
-        else:
-            return UserTrait(
-                profile_code=trait_profile.profile_code,
-                display_name=trait_profile.profile_code
-            )
-    return None
+def require_synergy_ready():
+    """모델 로딩이 끝나지 않았으면 503 반환"""
+    if not synergy_service.is_ready():
+        state = synergy_service.status()["state"]
+        detail = "시너지 예측 모델을 불러오는 중입니다. 잠시 후 다시 시도해주세요." \
+            if state in (synergy_service.NOT_STARTED, synergy_service.LOADING) \
+            else "시너지 예측 모델이 준비되지 않았습니다."
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail
+        )
 
-def create_synergy_user(db: Session, user_id: str) -> SynergyUser:
-    """사용자 정보와 상세 정보를 포함한 SynergyUser 생성"""
-    return SynergyUser(
-        user_id=user_id,
-        skills=get_user_skills_detailed(db, user_id),
-        roles=get_user_roles_detailed(db, user_id),
-        traits=get_user_traits_detailed(db, user_id)
+def _inference_http_error(e: Exception) -> HTTPException:
+    """추론 워커 풀 오류를 HTTP 오류로 변환 (대기열 포화 503, 시간 초과 504)"""
+    if isinstance(e, InferenceTimeoutError):
+        return HTTPException(status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=str(e))
+    return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+def _default_analysis_response() -> SynergyAnalysisResponse:
+    """오류 발생 시 기본 응답"""
+    return SynergyAnalysisResponse(
+        synergy_score=50.0,
+        explanation={
+            "baseline": 0.5,
+            "good_points": [],
+            "bad_points": []
+        }
     )
 
-def get_user_experience_string(db: Session, user_id: str) -> str:
-    """사용자의 경험을 문자열 형태로 변환 (filter_id:award_status 형식)"""
-    experiences = db.query(Experience).filter(
-        Experience.user_id == user_id
-    ).all()
+def format_synergy_result(result: dict, message_generator: SynergyMessageGenerator) -> SynergyAnalysisResponse:
+    """예측 결과에 메시지를 붙이고 소수점을 정리하여 SynergyAnalysisResponse로 변환"""
+    # 메시지 생성
+    description_message = message_generator.generate_messages(result['explanation'])
     
-    if not experiences:
-        return ""
+    # explanation에 메시지 추가
+    explanation_with_messages = result['explanation'].copy()
     
-    experience_parts = []
-    for exp in experiences:
-        experience_parts.append(f"{exp.filter_id}:{exp.award_status}")
+    # 소수점을 일의자리까지 표시 
+    explanation_with_messages['baseline'] = float(f"{explanation_with_messages['baseline']:.1f}")
     
-    return ", ".join(experience_parts)
-
-def get_user_roles_string(db: Session, user_id: str) -> str:
-    """사용자의 역할을 문자열로 변환"""
-    user_roles = db.query(UserRoleModel).join(Role).filter(
-        UserRoleModel.user_id == user_id
-    ).all()
+    # good_points에 메시지 추가
+    for i, point in enumerate(explanation_with_messages['good_points']):
+        feature = point['feature']
+        if feature in description_message['detailed_analysis']:
+            explanation_with_messages['good_points'][i]['message'] = description_message['detailed_analysis'][feature]['message']
+        # 소수점 조정 
+        explanation_with_messages['good_points'][i]['value'] = float(f"{point['value']:.1f}")
+        explanation_with_messages['good_points'][i]['contribution'] = float(f"{point['contribution']:.1f}")
     
-    roles = [user_role.role.name for user_role in user_roles]
-    return ", ".join(roles) if roles else ""
-
-def get_user_skills_string(db: Session, user_id: str) -> str:
-    """사용자의 스킬을 문자열로 변환"""
-    user_skills = db.query(UserSkillModel).join(Skill).filter(
-        UserSkillModel.user_id == user_id
-    ).all()
+    # bad_points에 메시지 추가
+    for i, point in enumerate(explanation_with_messages['bad_points']):
+        feature = point['feature']
+        if feature in description_message['detailed_analysis']:
+            explanation_with_messages['bad_points'][i]['message'] = description_message['detailed_analysis'][feature]['message']
+        # 소수점 조정 
+        explanation_with_messages['bad_points'][i]['value'] = float(f"{point['value']:.1f}")
+        explanation_with_messages['bad_points'][i]['contribution'] = float(f"{point['contribution']:.1f}")
     
-    skills = [user_skill.skill.name for user_skill in user_skills]
-    return ", ".join(skills) if skills else ""
+    # SynergyAnalysisResponse로 변환
+    return SynergyAnalysisResponse(
+        synergy_score=float(f"{result['synergy_score']:.1f}"),
+        explanation=explanation_with_messages
+    )
 
-def map_tags_to_fields(required_tags: List[str]) -> dict:
-    """required_tags_json을 tendency_type, goal, time, problem으로 매핑"""
-    mapping = {
-        'tendency_type': None,
-        'goal': None,
-        'time': None,
-        'problem': None
-    }
-    
-    for tag in required_tags:
-        if tag in ['LEADER', 'SUPPORTER']:
-            mapping['tendency_type'] = tag
-        elif tag in ['QUALITY', 'SCHEDULE']:
-            mapping['goal'] = tag
-        elif tag in ['MORNING', 'NIGHT']:
-            mapping['time'] = tag
-        elif tag in ['ANALYTIC', 'ADHOC']:
-            mapping['problem'] = tag
-    
-    return mapping
+def predict_synergy_batch(filtering_id: int, teams: List[List[SynergyMember]]) -> List[SynergyAnalysisResponse]:
+    """
+    여러 팀의 시너지를 모델 호출 한 번으로 예측
+    같은 팀/필터의 이전 결과가 캐시에 있으면 모델, SHAP, 메시지 생성을 건너뜁니다.
+    """
+    results = [None] * len(teams)
+    try:
+        member_teams = [_member_records(members) for members in teams]
+        
+        keys = [_result_cache_key(filtering_id, members) for members in teams]
+        misses = []
+        for i, key in enumerate(keys):
+            results[i] = synergy_result_cache.get(key)
+            if results[i] is None:
+                misses.append(i)
+        
+        if misses:
+            predicted = synergy_service.predict_member_batch(
+                [member_teams[i] for i in misses],
+                filtering_id
+            )
+            message_generator = SynergyMessageGenerator()
+            for i, result in zip(misses, predicted):
+                results[i] = format_synergy_result(result, message_generator)
+                synergy_result_cache.set(keys[i], results[i])
+        
+        return results
+        
+    except (InferenceBusyError, InferenceTimeoutError):
+        # 과부하/시간 초과는 기본 응답 대신 호출 측에서 503/504로 응답
+        raise
+    except Exception as e:
+        print(f"머신러닝 일괄 예측 중 오류 발생: {e}")
+        # 오류 시 기본 응답은 캐시하지 않음
+        return [result or _default_analysis_response() for result in results]
 
-@router.post("/analyze", response_model=SynergyResponse)
+@router.post("/analyze", response_model=SynergyResponse, dependencies=[Depends(require_synergy_ready)])
 def analyze_synergy(
     request: SynergyRequest,
     db: Session = Depends(get_db)
@@ -213,58 +177,18 @@ def analyze_synergy(
     사용자 리스트를 받아서 시너지 분석을 위한 사용자 정보를 반환합니다.
     """
     try:
-        # 요청된 사용자들 조회
-        users = db.query(User).filter(
-            User.user_id.in_(request.user_ids),
-            User.is_deleted == False
-        ).all()
+        # 요청된 사용자들의 스킬/역할/경험/성향 정보를 일괄 조회
+        members = list(load_synergy_members(db, request.user_ids).values())
         
         # 모든 사용자를 SynergyUser 형태로 변환
-        all_users = [
-            create_synergy_user(db, user.user_id)
-            for user in users
-        ]
-        
-        # 머신러닝 예측을 위한 데이터 준비
-        applicants = []
-        for user in users:
-            # 사용자 정보 가져오기
-            traits = get_user_traits_detailed(db, user.user_id)
-            roles_str = get_user_roles_string(db, user.user_id)
-            skills_str = get_user_skills_string(db, user.user_id)
-            experience_str = get_user_experience_string(db, user.user_id)
-            
-            # 태그 매핑
-            if traits:
-                # profile_rules에서 required_tags_json 가져오기
-                profile_rule = db.query(ProfileRule).filter(
-                    ProfileRule.profile_code == traits.profile_code
-                ).first()
-                required_tags = profile_rule.required_tags_json if profile_rule else []
-            else:
-                required_tags = []
-            
-            tag_mapping = map_tags_to_fields(required_tags)
-            
-            applicant = ApplicantData(
-                role=roles_str,
-                skill=skills_str,
-                experience=experience_str,
-                tendency_type=tag_mapping['tendency_type'] or "UNKNOWN",
-                goal=tag_mapping['goal'] or "UNKNOWN",
-                time=tag_mapping['time'] or "UNKNOWN",
-                problem=tag_mapping['problem'] or "UNKNOWN"
-            )
-            applicants.append(applicant)
-        
-        # 머신러닝 예측 요청 데이터 생성
-        analysis_request = SynergyAnalysisRequest(
-            filtering_id=request.filter_id,
-            applicants=applicants
-        )
+        all_users = [member.user for member in members]
         
-        # 머신러닝 예측 실행
-        synergy_result = predict_synergy(analysis_request)
+        # 머신러닝 예측 실행 (캐시된 사용자는 파싱된 MemberRecord 재사용)
+        # 분석할 사용자가 없으면 모델 호출과 결과 캐시 없이 기본 응답
+        if members:
+            synergy_result = predict_synergy_batch(request.filter_id, [members])[0]
+        else:
+            synergy_result = _default_analysis_response()
         
         # filter_name 조회
         filter_obj = db.query(Filter).filter(Filter.filter_id == request.filter_id).first()
@@ -278,8 +202,185 @@ def analyze_synergy(
         
     except HTTPException:
         raise
+    except (InferenceBusyError, InferenceTimeoutError) as e:
+        raise _inference_http_error(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"시너지 분석 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@router.post("/analyze-batch", response_model=SynergyBatchResponse, dependencies=[Depends(require_synergy_ready)])
+def analyze_synergy_batch(
+    request: SynergyBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    여러 팀(사용자 ID 목록)의 시너지를 한 번에 분석합니다.
+    모든 팀 벡터를 하나의 행렬로 묶어 모델을 한 번만 호출합니다.
+    """
+    if not request.teams:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="분석할 팀을 최소 1개 이상 입력해주세요."
+        )
+    if len(request.teams) > MAX_BATCH_TEAMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {MAX_BATCH_TEAMS}개 팀까지 분석할 수 있습니다."
+        )
+    
+    try:
+        # 여러 팀에 중복으로 등장하는 사용자는 한 번만 조회
+        members = load_synergy_members(db, (user_id for team in request.teams for user_id in team))
+        
+        # 팀별 지원자 데이터 구성 (탈퇴/존재하지 않는 사용자는 제외)
+        team_user_ids = [
+            [user_id for user_id in team if user_id in members]
+            for team in request.teams
+        ]
+        scorable = [i for i, user_ids in enumerate(team_user_ids) if user_ids]
+        
+        synergy_results = predict_synergy_batch(
+            request.filter_id,
+            [[members[user_id] for user_id in team_user_ids[i]] for i in scorable]
+        ) if scorable else []
+        results_by_index = dict(zip(scorable, synergy_results))
+        
+        # filter_name 조회
+        filter_obj = db.query(Filter).filter(Filter.filter_id == request.filter_id).first()
+        filter_name = filter_obj.name if filter_obj else None
+        
+        return SynergyBatchResponse(
+            results=[
+                SynergyBatchItem(
+                    user_ids=user_ids,
+                    synergy_result=results_by_index.get(i)
+                )
+                for i, user_ids in enumerate(team_user_ids)
+            ],
+            filter_name=filter_name
+        )
+        
+    except HTTPException:
+        raise
+    except (InferenceBusyError, InferenceTimeoutError) as e:
+        raise _inference_http_error(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"시너지 일괄 분석 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/best-teams/{recruitment_post_id}", response_model=BestTeamResponse, dependencies=[Depends(require_synergy_ready)])
+def get_best_teams(
+    recruitment_post_id: int,
+    top_k: int = Query(5, ge=1, le=20, description="추천할 팀 수"),
+    filter_id: Optional[int] = Query(None, description="필터링 ID (없으면 공모전 필터 사용)"),
+    time_budget: float = Query(2.0, gt=0, le=10, description="탐색 시간 제한 (초)"),
+    db: Session = Depends(get_db)
+):
+    """
+    모집 게시글의 대기 중인 지원자 조합 중 예측 시너지가 가장 높은 팀 top-k를 추천합니다.
+    작성자와 이미 수락된 지원자는 항상 팀에 포함되고, 남은 모집 인원만큼 지원자를 조합합니다.
+    """
+    recruitment_post = db.query(RecruitmentPost).filter(
+        RecruitmentPost.recruitment_post_id == recruitment_post_id
+    ).first()
+    
+    if not recruitment_post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시글을 찾을 수 없습니다."
+        )
+    
+    # 공모전 필터 조회 (요청에 filter_id가 없으면 공모전의 필터 사용)
+    if filter_id is None:
+        filter_result = db.query(ContestFilter.filter_id).filter(
+            ContestFilter.contest_id == recruitment_post.contest_id
+        ).first()
+        if not filter_result:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="공모전 필터 정보가 없어 filter_id를 지정해야 합니다."
+            )
+        filter_id = filter_result[0]
+    
+    try:
+        applications = db.query(Application).filter(
+            Application.recruitment_post_id == recruitment_post_id,
+            Application.status.in_([ApplicationStatus.accepted, ApplicationStatus.pending])
+        ).all()
+        
+        # 작성자와 수락된 지원자는 고정 팀원, 대기 중인 지원자는 후보
+        accepted_ids = [app.user_id for app in applications if app.status == ApplicationStatus.accepted]
+        pending_ids = [app.user_id for app in applications if app.status == ApplicationStatus.pending]
+        fixed_ids = list(dict.fromkeys([recruitment_post.user_id] + accepted_ids))
+        
+        # 탈퇴 사용자는 load_synergy_members에서 제외됨
+        members = load_synergy_members(db, fixed_ids + pending_ids)
+        fixed_ids = [user_id for user_id in fixed_ids if user_id in members]
+        candidate_ids = [
+            user_id for user_id in dict.fromkeys(pending_ids)
+            if user_id in members and user_id not in fixed_ids
+        ]
+        
+        # 남은 모집 인원만큼 후보를 추가
+        max_new_members = recruitment_post.recruitment_count - len(accepted_ids)
+        
+        search_result = synergy_service.search_best_teams(
+            fixed_members=_member_records([members[user_id] for user_id in fixed_ids]),
+            candidates=dict(zip(candidate_ids, _member_records([members[user_id] for user_id in candidate_ids]))),
+            max_new_members=max_new_members,
+            filtering_id=filter_id,
+            top_k=top_k,
+            time_budget=time_budget
+        )
+        
+        message_generator = SynergyMessageGenerator()
+        teams = [
+            BestTeam(
+                user_ids=fixed_ids + team['user_ids'],
+                recommended_user_ids=team['user_ids'],
+                synergy_result=format_synergy_result(team['result'], message_generator)
+            )
+            for team in search_result['teams']
+        ]
+        
+        # filter_name 조회
+        filter_obj = db.query(Filter).filter(Filter.filter_id == filter_id).first()
+        
+        return BestTeamResponse(
+            recruitment_post_id=recruitment_post_id,
+            filter_id=filter_id,
+            filter_name=filter_obj.name if filter_obj else None,
+            fixed_user_ids=fixed_ids,
+            candidate_count=len(candidate_ids),
+            evaluated_count=search_result['evaluated_count'],
+            search_mode=search_result['search_mode'],
+            truncated=search_result['truncated'],
+            teams=teams
+        )
+        
+    except (InferenceBusyError, InferenceTimeoutError) as e:
+        raise _inference_http_error(e)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"최적 팀 탐색 중 오류가 발생했습니다: {str(e)}"
+        )
+
+@router.get("/cache-stats", response_model=dict)
+def get_synergy_cache_stats():
+    """시너지 사용자/결과 캐시의 크기와 적중률 조회"""
+    return {
+        "member_cache": synergy_member_cache.stats(),
+        "result_cache": synergy_result_cache.stats(),
+        "model_version": synergy_service.model_version
+    }
@@ -9,6 +9,7 @@ from schemas.user import (
 from utils.auth import get_password_hash, verify_password, create_access_token, get_current_user
 from datetime import timedelta
 from utils.notification_service import NotificationService
+from utils.cache import invalidate_user_caches
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -125,6 +126,9 @@ def update_user_profile(
         # 데이터베이스에 저장
         db.commit()
         
+        # 마이페이지 등 사용자 캐시 무효화
+        invalidate_user_caches(current_user.user_id)
+        
         # 변경된 필드 목록 생성
         updated_fields = []
         if profile_update.name is not None:
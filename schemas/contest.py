@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, AnyUrl
-from typing import List
+from typing import List, Optional
 from datetime import date
 
 # 태그 스키마
@@ -27,3 +27,4 @@ class Contest(BaseModel):
 class ContestListResponse(BaseModel):
     contests: List[Contest] = Field(example=[], description="공모전 목록")
     total_count: int = Field(example=10, description="전체 공모전 수")
+    next_cursor: Optional[str] = Field(None, example=None, description="다음 페이지 커서 (limit 사용 시, 마지막 페이지면 null)")
@@ -52,6 +52,11 @@ class RecruitmentPostList(BaseModel):
     class Config:
         from_attributes = True
 
+class RecruitmentFeedResponse(BaseModel):
+    """모집 게시글 피드 (최신순 커서 페이지)"""
+    posts: List[RecruitmentPostList]
+    next_cursor: Optional[str] = None  # 마지막 페이지면 null
+
 # Application Schemas
 class ApplicationBase(BaseModel):
     recruitment_post_id: int
@@ -133,6 +138,7 @@ class CommentResponse(CommentBase):
     comment_id: int
     recruitment_post_id: int
     user_id: str
+    user_name: Optional[str] = None  # 작성자 이름 (댓글 스레드 조회 시)
     parent_comment_id: Optional[int] = None
     created_at: datetime
     
@@ -67,3 +67,39 @@ class SynergyResponse(BaseModel):
     filter_name: Optional[str] = Field(
         default=None, description="필터 이름"
     )
+
+
+class SynergyBatchRequest(BaseModel):
+    filter_id: int = Field(example=1, description="필터링 ID")
+    teams: List[List[str]] = Field(
+        example=[["user1", "user2", "user3"], ["user1", "user2", "user4"]],
+        description="시너지 분석할 팀(사용자 ID 목록) 목록"
+    )
+
+class SynergyBatchItem(BaseModel):
+    user_ids: List[str] = Field(description="분석에 사용된 사용자 ID 목록 (탈퇴/미존재 사용자 제외)")
+    synergy_result: Optional[SynergyAnalysisResponse] = Field(
+        default=None, description="시너지 분석 결과 (분석 가능한 사용자가 없으면 null)"
+    )
+
+class SynergyBatchResponse(BaseModel):
+    results: List[SynergyBatchItem] = Field(description="요청한 팀 순서대로의 분석 결과")
+    filter_name: Optional[str] = Field(
+        default=None, description="필터 이름"
+    )
+
+class BestTeam(BaseModel):
+    user_ids: List[str] = Field(description="팀 전체 구성원 (작성자/수락된 지원자 + 추천 지원자)")
+    recommended_user_ids: List[str] = Field(description="팀에 추가하도록 추천된 대기 중 지원자")
+    synergy_result: SynergyAnalysisResponse = Field(description="시너지 분석 결과")
+
+class BestTeamResponse(BaseModel):
+    recruitment_post_id: int = Field(example=1, description="모집 게시글 ID")
+    filter_id: int = Field(example=1, description="필터링 ID")
+    filter_name: Optional[str] = Field(default=None, description="필터 이름")
+    fixed_user_ids: List[str] = Field(description="항상 포함되는 팀원 (작성자, 수락된 지원자)")
+    candidate_count: int = Field(example=12, description="대기 중인 지원자 수")
+    evaluated_count: int = Field(example=300, description="평가한 팀 조합 수")
+    search_mode: str = Field(example="exhaustive", description="탐색 방식 (exhaustive, beam, none)")
+    truncated: bool = Field(example=False, description="시간 제한으로 탐색이 중단되었는지 여부")
+    teams: List[BestTeam] = Field(description="예측 시너지 순 추천 팀 목록")
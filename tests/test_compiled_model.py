@@ -0,0 +1,90 @@
+"""
+CompiledTreeModel이 원본 모델의 predict_proba와 같은 양성 클래스 확률을 내는지 확인
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ml.compiled_model import CompiledTreeModel
+
+FEATURE_NAMES = [f"feature_{i}" for i in range(5)]
+
+
+def make_data(n_samples=300, with_nan=False, seed=0):
+    rng = np.random.default_rng(seed)
+    X = (rng.random((n_samples, len(FEATURE_NAMES))) * 100).astype(np.float32)
+    y = (X[:, 0] + X[:, 1] * 0.5 - X[:, 2] * 0.3 + rng.normal(0, 10, n_samples) > 50).astype(int)
+    if with_nan:
+        # 학습 데이터 일부에 결측값을 넣어 분기별 결측값 방향을 학습시킴
+        X[rng.random(X.shape) < 0.1] = np.nan
+    return pd.DataFrame(X, columns=FEATURE_NAMES), y
+
+
+def make_eval_data(with_nan):
+    X, _ = make_data(200, seed=1)
+    if with_nan:
+        values = X.to_numpy().copy()
+        rng = np.random.default_rng(2)
+        values[rng.random(values.shape) < 0.2] = np.nan
+        # 학습 때 결측값이 없던 피처에도 결측값이 들어오는 경우
+        values[:10, :] = np.nan
+        X = pd.DataFrame(values, columns=FEATURE_NAMES)
+    return X
+
+
+def assert_parity(model, with_nan):
+    compiled = CompiledTreeModel.compile(model, FEATURE_NAMES)
+    assert compiled is not None
+
+    X = make_eval_data(with_nan)
+    expected = model.predict_proba(X)[:, 1]
+    actual = compiled.predict_positive_proba(X.to_numpy(dtype=np.float32))
+    assert np.allclose(actual, expected)
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+@pytest.mark.parametrize("make_model", [
+    lambda: DecisionTreeClassifier(max_depth=6, random_state=0),
+    lambda: RandomForestClassifier(n_estimators=20, max_depth=6, random_state=0),
+    lambda: ExtraTreesClassifier(n_estimators=20, max_depth=6, random_state=0),
+], ids=["decision_tree", "random_forest", "extra_trees"])
+def test_sklearn_forest_parity(make_model, with_nan):
+    X, y = make_data(with_nan=with_nan)
+    assert_parity(make_model().fit(X, y), with_nan)
+
+
+def test_sklearn_forest_parity_nan_unseen_in_training():
+    """학습 때 결측값이 없었던 모델에 결측값이 들어오면 sklearn은 표본이 많은 쪽 자식으로 보냄"""
+    X, y = make_data()
+    assert_parity(RandomForestClassifier(n_estimators=20, max_depth=6, random_state=0).fit(X, y), with_nan=True)
+
+
+def test_gradient_boosting_parity():
+    # GradientBoostingClassifier는 결측값을 지원하지 않음
+    X, y = make_data()
+    model = GradientBoostingClassifier(n_estimators=30, max_depth=3, learning_rate=0.1, random_state=0).fit(X, y)
+    assert_parity(model, with_nan=False)
+
+
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_xgboost_parity(with_nan):
+    xgboost = pytest.importorskip("xgboost")
+    X, y = make_data(with_nan=with_nan)
+    model = xgboost.XGBClassifier(
+        n_estimators=30, max_depth=4, learning_rate=0.1, objective="binary:logistic", random_state=0
+    ).fit(X, y)
+    assert_parity(model, with_nan)
+
+
+def test_unsupported_model_returns_none():
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = make_data()
+    assert CompiledTreeModel.compile(LogisticRegression(max_iter=500).fit(X, y), FEATURE_NAMES) is None
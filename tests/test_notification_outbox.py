@@ -0,0 +1,154 @@
+"""
+알림 발송 대기열(outbox) 디스패처 테스트 (SQLite 메모리 DB + 가짜 전송기)
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# config는 필수 환경변수가 없으면 import 시 오류가 나므로 테스트용 값을 채움
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+
+from models.notification_outbox import NotificationOutbox
+from utils.notification_outbox import (
+    FakeNotificationSender, OutboxDispatcher, enqueue_notification, notification_savepoint
+)
+
+
+class FailingNotificationSender:
+    """항상 전송에 실패하는 전송기"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def send(self, db, outbox):
+        self.calls += 1
+        raise RuntimeError("FCM unavailable")
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    NotificationOutbox.__table__.create(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def enqueue(db, user_ids=("user1", "user2", "user1")):
+    outbox = enqueue_notification(db, user_ids, "test", "제목", "내용", {"contest_id": 1})
+    db.commit()
+    return outbox
+
+
+def test_enqueue_without_recipients_returns_none(db):
+    assert enqueue_notification(db, [None, ""], "test", "제목", "내용") is None
+    assert db.query(NotificationOutbox).count() == 0
+
+
+def test_dispatch_batch_sends_pending_notifications(db):
+    outbox = enqueue(db)
+    sender = FakeNotificationSender()
+
+    stats = OutboxDispatcher(sender=sender).dispatch_batch(db)
+
+    assert stats["claimed"] == 1
+    assert stats["sent"] == 1
+    assert stats["delivered"] == 2
+    assert stats["retried"] == stats["failed"] == 0
+    assert sender.sent == [{
+        "notification_type": "test",
+        "user_ids": ["user1", "user2"],
+        "title": "제목",
+        "message": "내용",
+        "related_data": {"contest_id": 1}
+    }]
+
+    db.refresh(outbox)
+    assert outbox.status == "sent"
+    assert outbox.sent_count == 2
+    assert outbox.sent_at is not None
+
+    # 이미 보낸 알림은 다시 가져가지 않음
+    assert OutboxDispatcher(sender=sender).dispatch_batch(db)["claimed"] == 0
+    assert len(sender.sent) == 1
+
+
+def test_failed_send_is_retried_with_backoff(db):
+    outbox = enqueue(db)
+    sender = FailingNotificationSender()
+    dispatcher = OutboxDispatcher(sender=sender, max_attempts=3, backoff_seconds=30)
+
+    before = datetime.now()
+    stats = dispatcher.dispatch_batch(db)
+
+    assert stats["retried"] == 1
+    assert stats["sent"] == stats["failed"] == 0
+    db.refresh(outbox)
+    assert outbox.status == "pending"
+    assert outbox.attempts == 1
+    assert outbox.last_error == "FCM unavailable"
+    assert outbox.next_attempt_at >= before + timedelta(seconds=30)
+
+    # 백오프 시간이 지나기 전에는 다시 보내지 않음
+    assert dispatcher.dispatch_batch(db)["claimed"] == 0
+    assert sender.calls == 1
+
+
+def test_notification_fails_after_max_attempts(db):
+    outbox = enqueue(db)
+    sender = FailingNotificationSender()
+    dispatcher = OutboxDispatcher(sender=sender, max_attempts=2, backoff_seconds=30)
+
+    for attempt in range(2):
+        # 백오프가 끝난 것처럼 다음 시도 시각을 앞당김
+        outbox.next_attempt_at = datetime.now() - timedelta(seconds=1)
+        db.commit()
+        stats = dispatcher.dispatch_batch(db)
+
+    assert stats["failed"] == 1
+    db.refresh(outbox)
+    assert outbox.status == "failed"
+    assert outbox.attempts == 2
+    assert sender.calls == 2
+    assert dispatcher.dispatch_batch(db)["claimed"] == 0
+
+
+def test_backoff_doubles_up_to_max():
+    dispatcher = OutboxDispatcher(sender=FakeNotificationSender(), backoff_seconds=30, max_backoff_seconds=100)
+    assert [dispatcher.backoff(attempts).total_seconds() for attempts in (1, 2, 3, 4)] == [30, 60, 100, 100]
+
+
+def test_stale_processing_notification_is_reclaimed(db):
+    outbox = enqueue(db)
+    outbox.status = "processing"
+    outbox.claimed_at = datetime.now() - timedelta(hours=1)
+    db.commit()
+
+    stats = OutboxDispatcher(sender=FakeNotificationSender()).dispatch_batch(db)
+
+    assert stats["sent"] == 1
+    db.refresh(outbox)
+    assert outbox.status == "sent"
+
+
+def test_failed_enqueue_in_savepoint_keeps_caller_changes(db):
+    # 호출 측 업무 데이터 대신 먼저 추가한 대기열 행이 커밋되는지 확인
+    kept = enqueue_notification(db, ["user1"], "test", "유지", "내용")
+
+    with notification_savepoint(db):
+        # 제목이 없으면 NOT NULL 제약 위반으로 저장 실패
+        enqueue_notification(db, ["user2"], "test", None, "내용")
+    db.commit()
+
+    assert [outbox.title for outbox in db.query(NotificationOutbox).all()] == ["유지"]
+    assert kept.id is not None
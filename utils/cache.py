@@ -0,0 +1,89 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, List
+
+class TTLCache:
+    """
+    스레드 안전한 LRU + TTL 인메모리 캐시
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터, ttl(초)이 지나면 조회 시점에 제거합니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료되었거나 없으면 default)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (용량 초과 시 LRU 항목 제거)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """특정 키 제거"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """조건을 만족하는 키를 모두 제거하고 제거된 수를 반환"""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """캐시 크기와 적중률 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0
+            }
+
+
+# 사용자 데이터(스킬/역할/경험/성향)가 바뀌었을 때 호출할 캐시 무효화 함수 목록
+_user_invalidators: List[Callable[[str], None]] = []
+
+def register_user_invalidator(invalidator: Callable[[str], None]) -> None:
+    """사용자 단위 캐시 무효화 함수 등록"""
+    _user_invalidators.append(invalidator)
+
+def invalidate_user_caches(user_ids: Iterable[str]) -> None:
+    """등록된 모든 캐시에서 해당 사용자들의 항목 제거"""
+    if isinstance(user_ids, str):
+        user_ids = [user_ids]
+    for user_id in user_ids:
+        for invalidator in _user_invalidators:
+            try:
+                invalidator(user_id)
+            except Exception as e:
+                print(f"사용자 캐시 무효화 실패 ({user_id}): {e}")
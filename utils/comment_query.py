@@ -0,0 +1,114 @@
+"""
+댓글 조회 공통 로직
+게시글의 댓글 스레드를 댓글마다 대댓글을 따로 조회하지 않고 한 번에 불러와 메모리에서 조립합니다.
+작성자 이름은 사용자 테이블을 한 번만 조회해 채웁니다.
+최상위 댓글은 최신순(같은 시각이면 comment_id 오름차순) 커서 페이지네이션을 지원합니다.
+"""
+import base64
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session
+
+from models.recruitment import Comment
+from models.user import User
+from schemas.recruitment import CommentResponse, CommentWithReplies
+
+
+def encode_comment_cursor(comment: Comment) -> str:
+    """마지막 최상위 댓글의 (created_at, comment_id)를 불투명한 커서 문자열로 변환"""
+    payload = json.dumps([comment.created_at.isoformat(), comment.comment_id])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_comment_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, comment_id)로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        created_at, comment_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(created_at), int(comment_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def load_comment_thread(
+    db: Session,
+    recruitment_post_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Tuple[List[CommentWithReplies], Optional[str]]:
+    """
+    게시글의 최상위 댓글(최신순)과 각 댓글의 대댓글(작성순)을 조립
+    limit이 없으면 댓글 전체를 쿼리 한 번으로, 있으면 최상위 댓글 한 페이지와 그 대댓글을 쿼리 두 번으로 조회합니다.
+    반환: (댓글 목록, 다음 페이지 커서 또는 None)
+    """
+    next_cursor = None
+    if limit is None and not cursor:
+        comments = db.query(Comment).filter(Comment.recruitment_post_id == recruitment_post_id).all()
+        top_level_comments = [comment for comment in comments if comment.parent_comment_id is None]
+        replies = [comment for comment in comments if comment.parent_comment_id is not None]
+        # 최신순, 같은 시각이면 comment_id 오름차순 (페이지 조회와 같은 순서)
+        top_level_comments.sort(key=lambda comment: comment.comment_id)
+        top_level_comments.sort(key=lambda comment: comment.created_at, reverse=True)
+    else:
+        query = db.query(Comment).filter(
+            Comment.recruitment_post_id == recruitment_post_id,
+            Comment.parent_comment_id.is_(None)
+        )
+        if cursor:
+            created_at, comment_id = decode_comment_cursor(cursor)
+            query = query.filter(or_(
+                Comment.created_at < created_at,
+                and_(Comment.created_at == created_at, Comment.comment_id > comment_id)
+            ))
+        query = query.order_by(Comment.created_at.desc(), Comment.comment_id.asc())
+
+        if limit is None:
+            top_level_comments = query.all()
+        else:
+            # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+            top_level_comments = query.limit(limit + 1).all()
+            if len(top_level_comments) > limit:
+                next_cursor = encode_comment_cursor(top_level_comments[limit - 1])
+                top_level_comments = top_level_comments[:limit]
+
+        replies = []
+        if top_level_comments:
+            replies = db.query(Comment).filter(
+                Comment.parent_comment_id.in_([comment.comment_id for comment in top_level_comments])
+            ).all()
+
+    replies_by_parent = defaultdict(list)
+    for reply in sorted(replies, key=lambda comment: (comment.created_at, comment.comment_id)):
+        replies_by_parent[reply.parent_comment_id].append(reply)
+
+    user_names = load_user_names(db, top_level_comments + replies)
+
+    def to_response(comment: Comment) -> dict:
+        return {
+            "comment_id": comment.comment_id,
+            "recruitment_post_id": comment.recruitment_post_id,
+            "user_id": comment.user_id,
+            "user_name": user_names.get(comment.user_id),
+            "parent_comment_id": comment.parent_comment_id,
+            "content": comment.content,
+            "created_at": comment.created_at
+        }
+
+    return [
+        CommentWithReplies(
+            **to_response(comment),
+            replies=[CommentResponse(**to_response(reply)) for reply in replies_by_parent[comment.comment_id]]
+        )
+        for comment in top_level_comments
+    ], next_cursor
+
+
+def load_user_names(db: Session, comments: List[Comment]) -> Dict[str, str]:
+    """댓글 작성자 이름을 한 번에 조회 (user_id -> name)"""
+    user_ids = {comment.user_id for comment in comments}
+    if not user_ids:
+        return {}
+    return dict(db.query(User.user_id, User.name).filter(User.user_id.in_(user_ids)).all())
@@ -0,0 +1,199 @@
+"""
+공모전 카탈로그 인메모리 캐시
+공모전/태그/필터는 크롤러(jobs/analyzer.py)가 새 공모전을 저장할 때만 바뀌므로
+전체를 메모리에 올려두고 /contests 엔드포인트가 DB 대신 여기서 응답합니다.
+
+- 크롤러는 저장 트랜잭션 안에서 bump_contest_catalog_version()으로 버전을 올립니다.
+- API 서버는 CONTEST_CATALOG_VERSION_CHECK_SECONDS마다 버전만 확인하고,
+  버전이 바뀌었거나 CONTEST_CATALOG_TTL_SECONDS가 지나면 카탈로그를 다시 불러옵니다.
+- 카탈로그를 사용할 수 없으면 None을 반환하고 호출 측은 DB 조회로 처리합니다.
+"""
+import bisect
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.cache_version import CacheVersion
+from models.contest import Contest, Tag, ContestTag, Filter, ContestFilter
+from schemas.contest import Contest as ContestSchema
+from utils.contest_query import decode_cursor
+
+CONTEST_CATALOG_NAME = "contests"
+
+
+def bump_contest_catalog_version(db: Session) -> None:
+    """공모전 카탈로그 버전 증가 (커밋은 호출 측 트랜잭션에서)"""
+    row = db.query(CacheVersion).filter(CacheVersion.name == CONTEST_CATALOG_NAME).with_for_update().first()
+    if row:
+        row.version = (row.version or 0) + 1
+    else:
+        db.add(CacheVersion(name=CONTEST_CATALOG_NAME, version=1))
+
+
+def read_contest_catalog_version(db: Session) -> int:
+    """현재 공모전 카탈로그 버전 (기록이 없으면 0)"""
+    version = db.query(CacheVersion.version).filter(CacheVersion.name == CONTEST_CATALOG_NAME).scalar()
+    return version or 0
+
+
+class ContestCatalogSnapshot:
+    """한 시점의 공모전 카탈로그 (만들어진 뒤에는 변경하지 않음)"""
+
+    def __init__(self, version: int, contests: List[ContestSchema], filters: List[dict],
+                 filter_ids_by_contest: Dict[int, List[int]]):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        # 마감일, ID 오름차순
+        self.contests = contests
+        self.keys = [(contest.due_date, contest.contest_id) for contest in contests]
+        self.contests_by_id = {contest.contest_id: contest for contest in contests}
+        self.filters = filters
+        self.filter_ids = {item["filter_id"] for item in filters}
+        self.filter_ids_by_contest = filter_ids_by_contest
+
+        contest_ids_by_filter = defaultdict(set)
+        for contest_id, filter_ids in filter_ids_by_contest.items():
+            for filter_id in filter_ids:
+                contest_ids_by_filter[filter_id].add(contest_id)
+        self.contest_ids_by_filter = dict(contest_ids_by_filter)
+
+        contest_ids_by_tag = defaultdict(set)
+        for contest in contests:
+            for tag in contest.tags:
+                contest_ids_by_tag[tag.name].add(contest.contest_id)
+        self.contest_ids_by_tag = dict(contest_ids_by_tag)
+
+        # 내용이 같으면 다시 불러와도 같은 ETag
+        content = json.dumps(
+            [[contest.model_dump(mode="json") for contest in contests], filters],
+            ensure_ascii=False, sort_keys=True
+        )
+        self.etag = hashlib.sha1(content.encode("utf-8")).hexdigest()[:20]
+
+    def response_etag(self) -> str:
+        """응답 ETag (마감 여부가 날짜에 따라 바뀌므로 오늘 날짜 포함)"""
+        return f'"{self.etag}-{date.today().isoformat()}"'
+
+    def list_contests(self, filter_id: Optional[int] = None, active_only: bool = False,
+                      tag: Optional[str] = None) -> List[ContestSchema]:
+        """contest_list_query와 같은 조건/순서의 공모전 목록"""
+        contests = self.contests
+        if active_only:
+            # 마감일 오름차순이므로 오늘 이전 마감 공모전은 앞쪽에 모여 있음
+            contests = contests[bisect.bisect_left(self.keys, (date.today(),)):]
+        if filter_id is not None:
+            contest_ids = self.contest_ids_by_filter.get(filter_id, set())
+            contests = [contest for contest in contests if contest.contest_id in contest_ids]
+        if tag:
+            contest_ids = self.contest_ids_by_tag.get(tag, set())
+            contests = [contest for contest in contests if contest.contest_id in contest_ids]
+        return contests
+
+    @staticmethod
+    def after_cursor(contests: List[ContestSchema], cursor: Optional[str]) -> List[ContestSchema]:
+        """커서 이후의 공모전만 (형식이 잘못되면 ValueError)"""
+        if not cursor:
+            return contests
+        cursor_key = decode_cursor(cursor)
+        start = bisect.bisect_right([(contest.due_date, contest.contest_id) for contest in contests], cursor_key)
+        return contests[start:]
+
+
+class ContestCatalog:
+    """버전/TTL 기준으로 갱신되는 공모전 카탈로그 캐시"""
+
+    def __init__(self, enabled: bool = True, ttl: float = 300, version_check_interval: float = 10):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.version_check_interval = version_check_interval
+        self._snapshot: Optional[ContestCatalogSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> Optional[ContestCatalogSnapshot]:
+        """최신 카탈로그 (비활성화되었거나 불러오지 못하면 None)"""
+        if not self.enabled:
+            return None
+
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._checked_at < self.version_check_interval:
+            return snapshot
+
+        with self._lock:
+            # 다른 요청이 먼저 갱신했는지 다시 확인
+            snapshot = self._snapshot
+            now = time.monotonic()
+            if snapshot is not None and now - self._checked_at < self.version_check_interval:
+                return snapshot
+
+            try:
+                version = read_contest_catalog_version(db)
+                if snapshot is None or version != snapshot.version or now - snapshot.loaded_at >= self.ttl:
+                    snapshot = self._load(db, version)
+                    self._snapshot = snapshot
+                self._checked_at = time.monotonic()
+            except Exception as e:
+                print(f"공모전 카탈로그 갱신 실패: {e}")
+                # 이전 카탈로그가 있으면 계속 사용하고 잠시 뒤 다시 시도
+                self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """다음 요청에서 버전을 다시 확인하도록 표시"""
+        self._checked_at = 0.0
+
+    def _load(self, db: Session, version: int) -> ContestCatalogSnapshot:
+        """공모전/태그/필터 전체를 쿼리 4번으로 불러옴"""
+        started = time.perf_counter()
+        contests = db.query(Contest).order_by(Contest.due_date.asc(), Contest.contest_id.asc()).all()
+
+        tags_by_contest = defaultdict(list)
+        for contest_id, tag in db.query(ContestTag.contest_id, Tag)\
+                .join(Tag, ContestTag.tag_id == Tag.tag_id)\
+                .order_by(ContestTag.contest_tag_id)\
+                .all():
+            tags_by_contest[contest_id].append(tag)
+
+        filter_ids_by_contest = defaultdict(list)
+        for contest_id, filter_id in db.query(ContestFilter.contest_id, ContestFilter.filter_id)\
+                .order_by(ContestFilter.contest_filter_id)\
+                .all():
+            filter_ids_by_contest[contest_id].append(filter_id)
+
+        filters = [
+            {"filter_id": filter.filter_id, "name": filter.name}
+            for filter in db.query(Filter).order_by(Filter.filter_id.asc()).all()
+        ]
+
+        items = []
+        for contest in contests:
+            contest.tags = tags_by_contest[contest.contest_id]
+            items.append(ContestSchema.model_validate(contest))
+
+        snapshot = ContestCatalogSnapshot(version, items, filters, dict(filter_ids_by_contest))
+        print(f"공모전 카탈로그 로드 완료: 버전 {version}, {len(items)}개 ({time.perf_counter() - started:.2f}초)")
+        return snapshot
+
+
+contest_catalog = ContestCatalog(
+    enabled=settings.CONTEST_CATALOG_ENABLED,
+    ttl=settings.CONTEST_CATALOG_TTL_SECONDS,
+    version_check_interval=settings.CONTEST_CATALOG_VERSION_CHECK_SECONDS
+)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 포함되어 있는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(
+        (value[2:] if value.startswith("W/") else value) == etag for value in candidates
+    )
@@ -0,0 +1,128 @@
+"""
+공모전 조회 공통 로직
+공모전 목록/상세 조회 시 태그를 공모전마다 따로 조회하지 않고 IN (...) 쿼리 한 번으로 함께 불러옵니다.
+목록은 (due_date, contest_id) 기준 커서 페이지네이션을 지원합니다.
+"""
+import base64
+import json
+from collections import defaultdict
+from datetime import date
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, or_, and_
+from sqlalchemy.orm import Session, Query
+
+from models.contest import Contest, Tag, ContestTag, ContestFilter
+from utils.cache import TTLCache
+
+# 조건별 전체 공모전 수 캐시 (새 공모전은 크롤러가 하루 단위로 추가하므로 짧은 지연 허용)
+COUNT_CACHE_TTL_SECONDS = 60
+_count_cache = TTLCache(maxsize=256, ttl=COUNT_CACHE_TTL_SECONDS)
+
+
+def contest_list_query(
+    db: Session,
+    filter_id: Optional[int] = None,
+    active_only: bool = False,
+    tag: Optional[str] = None
+) -> Query:
+    """
+    마감일 오름차순 공모전 목록 쿼리
+    filter_id: 해당 필터의 공모전만, active_only: 마감되지 않은 공모전만, tag: 해당 태그명이 붙은 공모전만
+    """
+    query = db.query(Contest)
+    if filter_id is not None:
+        query = query.join(ContestFilter, Contest.contest_id == ContestFilter.contest_id)\
+            .filter(ContestFilter.filter_id == filter_id)
+    if active_only:
+        query = query.filter(Contest.due_date >= date.today())
+    if tag:
+        tagged_contest_ids = db.query(ContestTag.contest_id)\
+            .join(Tag, ContestTag.tag_id == Tag.tag_id)\
+            .filter(Tag.name == tag)
+        query = query.filter(Contest.contest_id.in_(tagged_contest_ids))
+    return query.order_by(Contest.due_date.asc(), Contest.contest_id.asc())
+
+
+def count_contests(query: Query, cache_key: Optional[tuple] = None) -> int:
+    """목록 쿼리의 전체 개수 (cache_key가 있으면 짧은 시간 캐시)"""
+    if cache_key is not None:
+        cached = _count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    total_count = query.order_by(None).with_entities(func.count(Contest.contest_id)).scalar()
+    if cache_key is not None:
+        _count_cache.set(cache_key, total_count)
+    return total_count
+
+
+def encode_cursor(contest: Contest) -> str:
+    """마지막 공모전의 (due_date, contest_id)를 불투명한 커서 문자열로 변환"""
+    payload = json.dumps([contest.due_date.isoformat(), contest.contest_id])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """커서 문자열을 (due_date, contest_id)로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        due_date, contest_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return date.fromisoformat(due_date), int(contest_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def apply_cursor(query: Query, cursor: str) -> Query:
+    """커서 이후의 공모전만 조회 (due_date, contest_id) > (커서 값)"""
+    due_date, contest_id = decode_cursor(cursor)
+    return query.filter(or_(
+        Contest.due_date > due_date,
+        and_(Contest.due_date == due_date, Contest.contest_id > contest_id)
+    ))
+
+
+def paginate_contests(db: Session, query: Query, limit: Optional[int], cursor: Optional[str] = None):
+    """
+    커서 페이지네이션으로 공모전을 태그와 함께 조회
+    반환: (공모전 목록, 다음 페이지 커서 또는 None). limit이 없으면 커서 이후 전체를 반환합니다.
+    """
+    if cursor:
+        query = apply_cursor(query, cursor)
+    if limit is None:
+        return load_contests(db, query), None
+
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    contests = query.limit(limit + 1).all()
+    next_cursor = encode_cursor(contests[limit - 1]) if len(contests) > limit else None
+    return attach_tags(db, contests[:limit]), next_cursor
+
+
+def attach_tags(db: Session, contests: List[Contest]) -> List[Contest]:
+    """공모전들의 태그를 한 번에 조회해 tags 가상 속성에 채움"""
+    if not contests:
+        return contests
+
+    tags_by_contest = defaultdict(list)
+    for contest_id, tag in db.query(ContestTag.contest_id, Tag)\
+            .join(Tag, ContestTag.tag_id == Tag.tag_id)\
+            .filter(ContestTag.contest_id.in_({contest.contest_id for contest in contests}))\
+            .order_by(ContestTag.contest_tag_id)\
+            .all():
+        tags_by_contest[contest_id].append(tag)
+
+    for contest in contests:
+        contest.tags = tags_by_contest[contest.contest_id]
+    return contests
+
+
+def load_contests(db: Session, query: Query) -> List[Contest]:
+    """공모전 쿼리 결과를 태그와 함께 반환 (쿼리 2번)"""
+    return attach_tags(db, query.all())
+
+
+def get_contest_with_tags(db: Session, contest_id: int) -> Optional[Contest]:
+    """공모전 한 건을 태그와 함께 조회 (없으면 None)"""
+    contest = db.query(Contest).filter(Contest.contest_id == contest_id).first()
+    if contest:
+        attach_tags(db, [contest])
+    return contest
@@ -0,0 +1,149 @@
+"""
+DB 기반 작업 잠금 (임대 방식)
+여러 uvicorn 워커와 크롤러 프로세스가 같은 작업을 동시에 실행하지 않도록 db_locks 테이블의 행을 잠금으로 사용합니다.
+잠금은 locked_until까지 유효하며, 소유자가 비정상 종료해도 시간이 지나면 다른 프로세스가 가져갈 수 있습니다.
+
+- acquire_lock(): 잠금 획득 또는 (같은 소유자면) 연장
+- release_lock(): 잠금 해제
+잠금 작업은 호출 측 세션을 커밋하지 않도록 잠금 전용 세션을 잠깐 열어 처리합니다.
+- LeaderLease: 주기적으로 잠금을 갱신하며 리더가 되거나 물러날 때 콜백 실행 (스케줄러 리더 선출)
+"""
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.db_lock import DbLock
+
+
+def lock_owner_id() -> str:
+    """이 프로세스의 잠금 소유자 ID (호스트:PID:임의값)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+T = TypeVar("T")
+
+
+def _with_lock_session(fn: Callable[[Session], T]) -> T:
+    """잠금 작업 전용 세션으로 fn 실행 (호출 측 트랜잭션과 분리)"""
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return fn(db)
+    finally:
+        db.close()
+
+
+def acquire_lock(name: str, owner: str, ttl_seconds: int) -> bool:
+    """잠금 획득 (이미 가지고 있으면 연장). 다른 소유자가 유효한 잠금을 가지고 있으면 False"""
+    return _with_lock_session(lambda db: _acquire_lock(db, name, owner, ttl_seconds))
+
+
+def release_lock(name: str, owner: str) -> None:
+    """내가 가진 잠금 해제"""
+    _with_lock_session(lambda db: _release_lock(db, name, owner))
+
+
+def _acquire_lock(db: Session, name: str, owner: str, ttl_seconds: int) -> bool:
+    now = datetime.now()
+    locked_until = now + timedelta(seconds=ttl_seconds)
+
+    # 만료되었거나 내가 가진 잠금이면 조건부 UPDATE로 가져옴 (동시에 시도해도 한 프로세스만 성공)
+    updated = db.query(DbLock).filter(
+        DbLock.name == name,
+        or_(DbLock.locked_until < now, DbLock.owner == owner)
+    ).update({DbLock.owner: owner, DbLock.locked_until: locked_until}, synchronize_session=False)
+    if updated:
+        db.commit()
+        return True
+
+    # 잠금 행이 아직 없으면 생성 (다른 프로세스가 먼저 만들었으면 기본키 충돌)
+    db.add(DbLock(name=name, owner=owner, locked_until=locked_until))
+    try:
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        return False
+
+
+def _release_lock(db: Session, name: str, owner: str) -> None:
+    db.query(DbLock).filter(
+        DbLock.name == name,
+        DbLock.owner == owner
+    ).update({DbLock.locked_until: datetime.now()}, synchronize_session=False)
+    db.commit()
+
+
+class LeaderLease:
+    """
+    잠금을 주기적으로 갱신하는 리더 선출기
+    리더가 되면 on_acquired, 잠금을 잃으면(DB 오류 포함) on_lost를 호출합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: int,
+        on_acquired: Callable[[], None],
+        on_lost: Callable[[], None]
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = lock_owner_id()
+        self.on_acquired = on_acquired
+        self.on_lost = on_lost
+        self.is_leader = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 잠금 획득/갱신 시작 (TTL의 1/3 주기)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"leader-lease-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """갱신 중지 및 잠금 해제 (리더였으면 on_lost 호출)"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        if self.is_leader:
+            self._set_leader(False)
+            try:
+                release_lock(self.name, self.owner)
+            except Exception as e:
+                print(f"리더 잠금 해제 실패 ({self.name}): {e}")
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.tick()
+            self._stop_event.wait(max(1, self.ttl_seconds / 3))
+
+    def tick(self) -> bool:
+        """잠금 획득/갱신을 한 번 시도하고 리더 여부 반환"""
+        try:
+            acquired = acquire_lock(self.name, self.owner, self.ttl_seconds)
+        except Exception as e:
+            print(f"리더 잠금 갱신 실패 ({self.name}): {e}")
+            acquired = False
+        if acquired != self.is_leader:
+            self._set_leader(acquired)
+        return acquired
+
+    def _set_leader(self, is_leader: bool) -> None:
+        self.is_leader = is_leader
+        callback = self.on_acquired if is_leader else self.on_lost
+        try:
+            callback()
+        except Exception as e:
+            print(f"리더 {'선출' if is_leader else '해제'} 처리 중 오류 ({self.name}): {e}")
@@ -0,0 +1,106 @@
+"""
+공모전 마감일 알림 전송 기록 (ledger)
+(사용자, 공모전, 남은 일수)마다 전송 기록을 남겨 같은 알림을 두 번 보내지 않습니다.
+실행 시 대상 전체를 pending으로 기록한 뒤 나눠 보내면서 FCM이 응답한 대상만 sent로 바꾸므로,
+실행이 중단되거나 FCM 요청이 실패해도 같은 날 다시 실행하면 남은 pending 대상에게만 이어서 전송합니다.
+"""
+from datetime import date, datetime, timedelta
+from typing import List, Set, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from models.notification_delivery import DeadlineReminderDelivery
+from utils.deadline_query import DeadlineReminder
+
+# (공모전, 남은 일수) 조건 IN 절 하나에 넣을 최대 개수
+LEDGER_QUERY_CHUNK_SIZE = 500
+# 이 기간이 지난 전송 기록은 정리
+LEDGER_RETENTION_DAYS = 60
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def prepare_deadline_ledger(db: Session, reminders: List[DeadlineReminder], today: date) -> List[DeadlineReminder]:
+    """
+    알림 대상 중 아직 보내지 않은 (FCM 토큰이 있는) 사용자만 남기고, 새 대상은 pending으로 기록 후 커밋
+    반환: 공모전별 남은 전송 대상 (순서 유지, 보낼 대상이 없는 공모전도 포함)
+    """
+    keys = list({(reminder.contest_id, reminder.days_remaining) for reminder in reminders})
+    sent: Set[Tuple[str, int, int]] = set()
+    recorded: Set[Tuple[str, int, int]] = set()
+    for chunk in _chunks(keys, LEDGER_QUERY_CHUNK_SIZE):
+        for user_id, contest_id, days_remaining, status in db.query(
+            DeadlineReminderDelivery.user_id,
+            DeadlineReminderDelivery.contest_id,
+            DeadlineReminderDelivery.days_remaining,
+            DeadlineReminderDelivery.status
+        ).filter(
+            tuple_(DeadlineReminderDelivery.contest_id, DeadlineReminderDelivery.days_remaining).in_(chunk)
+        ):
+            recorded.add((user_id, contest_id, days_remaining))
+            if status == "sent":
+                sent.add((user_id, contest_id, days_remaining))
+
+    new_rows = []
+    remaining = []
+    for reminder in reminders:
+        tokens_by_user = {}
+        for user_id, token in reminder.tokens_by_user.items():
+            key = (user_id, reminder.contest_id, reminder.days_remaining)
+            if not token or key in sent:
+                continue
+            tokens_by_user[user_id] = token
+            if key not in recorded:
+                new_rows.append({
+                    "user_id": user_id,
+                    "contest_id": reminder.contest_id,
+                    "days_remaining": reminder.days_remaining,
+                    "status": "pending",
+                    "run_date": today
+                })
+        remaining.append(reminder._replace(tokens_by_user=tokens_by_user))
+
+    if new_rows:
+        db.bulk_insert_mappings(DeadlineReminderDelivery, new_rows)
+    db.commit()
+    return remaining
+
+
+def mark_deadline_reminders_sent(db: Session, reminders: List[DeadlineReminder], answered_tokens: Set[str]) -> None:
+    """
+    FCM이 응답한 토큰의 수신자만 pending 기록을 sent로 바꾸고 커밋
+    FCM 요청 자체가 실패한 수신자는 pending으로 남겨 다음 실행에서 다시 전송합니다.
+    """
+    keys = [
+        (user_id, reminder.contest_id, reminder.days_remaining)
+        for reminder in reminders
+        for user_id, token in reminder.tokens_by_user.items()
+        if token in answered_tokens
+    ]
+    now = datetime.now()
+    for chunk in _chunks(keys, LEDGER_QUERY_CHUNK_SIZE):
+        db.query(DeadlineReminderDelivery).filter(
+            DeadlineReminderDelivery.status == "pending",
+            tuple_(
+                DeadlineReminderDelivery.user_id,
+                DeadlineReminderDelivery.contest_id,
+                DeadlineReminderDelivery.days_remaining
+            ).in_(chunk)
+        ).update({
+            DeadlineReminderDelivery.status: "sent",
+            DeadlineReminderDelivery.sent_at: now
+        }, synchronize_session=False)
+    db.commit()
+
+
+def purge_deadline_ledger(db: Session, today: date) -> int:
+    """보관 기간이 지난 전송 기록 삭제 (반환: 삭제된 행 수)"""
+    deleted = db.query(DeadlineReminderDelivery).filter(
+        DeadlineReminderDelivery.run_date < today - timedelta(days=LEDGER_RETENTION_DAYS)
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
@@ -0,0 +1,92 @@
+"""
+공모전 마감일 알림 대상 조회
+공모전마다 모집글을, 모집글마다 승인된 지원을 따로 조회하지 않고
+마감일이 오늘+{30,10,5,1,0}일인 공모전의 (수신자, 공모전, 남은 일수)를 쿼리 한 번으로 불러옵니다.
+수신자는 모집글 작성자와 승인된 지원자이며, FCM 토큰도 함께 조회합니다.
+"""
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import union
+from sqlalchemy.orm import Session
+
+from models.contest import Contest
+from models.recruitment import RecruitmentPost, Application, ApplicationStatus
+from models.user import User
+
+# 알림을 보낼 남은 일수들
+REMINDER_DAYS = (30, 10, 5, 1, 0)
+
+
+class DeadlineReminder(NamedTuple):
+    """공모전 하나의 마감일 알림 (수신자별 FCM 토큰 포함, 토큰이 없으면 None)"""
+    contest_id: int
+    contest_name: str
+    due_date: date
+    days_remaining: int
+    tokens_by_user: Dict[str, Optional[str]]
+
+
+def deadline_recipient_rows(db: Session, *contest_conditions) -> List[Tuple]:
+    """
+    조건에 맞는 공모전의 (contest_id, 공모전명, 마감일, user_id, fcm_token) 행 (중복 제거, 쿼리 1번)
+    모집글이 없는 공모전도 user_id가 NULL인 행으로 포함됩니다.
+    """
+    authors = db.query(
+        Contest.contest_id, Contest.name, Contest.due_date, User.user_id, User.fcm_token
+    ).outerjoin(
+        RecruitmentPost, RecruitmentPost.contest_id == Contest.contest_id
+    ).outerjoin(
+        User, User.user_id == RecruitmentPost.user_id
+    ).filter(*contest_conditions)
+
+    accepted_members = db.query(
+        Contest.contest_id, Contest.name, Contest.due_date, User.user_id, User.fcm_token
+    ).join(
+        RecruitmentPost, RecruitmentPost.contest_id == Contest.contest_id
+    ).join(
+        Application, Application.recruitment_post_id == RecruitmentPost.recruitment_post_id
+    ).join(
+        User, User.user_id == Application.user_id
+    ).filter(
+        Application.status == ApplicationStatus.accepted,
+        *contest_conditions
+    )
+
+    # UNION은 중복 행을 제거하므로 작성자이면서 다른 모집글의 참여자인 사용자도 한 번만 포함
+    return db.execute(union(authors.statement, accepted_members.statement)).all()
+
+
+def group_reminders(rows: Iterable[Tuple], days_by_due_date: Dict[date, int]) -> List[DeadlineReminder]:
+    """행을 공모전별 알림으로 묶음 (공모전 ID 순)"""
+    reminders: Dict[int, DeadlineReminder] = {}
+    for contest_id, contest_name, due_date, user_id, fcm_token in rows:
+        reminder = reminders.get(contest_id)
+        if reminder is None:
+            reminder = reminders[contest_id] = DeadlineReminder(
+                contest_id, contest_name, due_date, days_by_due_date[due_date], {}
+            )
+        if user_id is not None:
+            reminder.tokens_by_user[user_id] = fcm_token
+    return [reminders[contest_id] for contest_id in sorted(reminders)]
+
+
+def load_deadline_reminders(
+    db: Session,
+    today: Optional[date] = None,
+    reminder_days: Iterable[int] = REMINDER_DAYS
+) -> List[DeadlineReminder]:
+    """마감일이 오늘+reminder_days일인 공모전들의 알림 대상 (쿼리 1번)"""
+    today = today or date.today()
+    days_by_due_date = {today + timedelta(days=days): days for days in reminder_days}
+    rows = deadline_recipient_rows(db, Contest.due_date.in_(list(days_by_due_date)))
+    return group_reminders(rows, days_by_due_date)
+
+
+def load_contest_reminder(db: Session, contest: Contest, days_remaining: int) -> DeadlineReminder:
+    """특정 공모전의 알림 대상 (남은 일수를 직접 지정, 테스트 알림용)"""
+    rows = deadline_recipient_rows(db, Contest.contest_id == contest.contest_id)
+    reminders = group_reminders(rows, {contest.due_date: days_remaining})
+    if reminders:
+        return reminders[0]
+    return DeadlineReminder(contest.contest_id, contest.name, contest.due_date, days_remaining, {})
@@ -63,7 +63,12 @@ class FCMService:
                 tokens=tokens
             )
             
-            response = messaging.send_multicast(message)
+            # send_multicast(배치 API)는 지원 중단되어 send_each_for_multicast가 있으면 사용
+            send_each_for_multicast = getattr(messaging, "send_each_for_multicast", None)
+            if send_each_for_multicast is not None:
+                response = send_each_for_multicast(message)
+            else:
+                response = messaging.send_multicast(message)
             
             result = {
                 "success_count": response.success_count,
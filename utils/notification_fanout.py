@@ -0,0 +1,241 @@
+"""
+푸시 알림 대량 전송 (fan-out)
+사용자마다 User를 조회해 한 건씩 보내지 않고, FCM 토큰을 한 번에 조회한 뒤
+최대 500개씩 멀티캐스트로 묶어 여러 배치를 동시에(FCM_FANOUT_WORKERS개까지) 전송합니다.
+토큰별 응답에서 앱 삭제 등으로 더 이상 쓸 수 없는 토큰을 찾아 User.fcm_token을 일괄 삭제합니다.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from firebase_admin import messaging
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.user import User
+from utils.fcm_service import FCMService
+
+# FCM 멀티캐스트 한 번에 보낼 수 있는 최대 토큰 수
+MULTICAST_BATCH_SIZE = 500
+# 토큰 조회 IN 절 하나에 넣을 최대 사용자 수
+TOKEN_QUERY_CHUNK_SIZE = 1000
+# 토큰이 더 이상 유효하지 않음을 뜻하는 FCM 오류 코드 (UNREGISTERED는 NOT_FOUND로 전달됨)
+UNREGISTERED_ERROR_CODES = {"UNREGISTERED", "NOT_FOUND"}
+INVALID_ARGUMENT_ERROR_CODE = "INVALID_ARGUMENT"
+
+
+class FanoutStats:
+    """한 번의 실행(대기열 전송, 마감일 알림 등) 동안의 토큰별 전송 결과 합계"""
+
+    def __init__(self):
+        self.delivered = 0
+        self.failed = 0
+        self.pruned = 0
+
+    def add(self, result: Dict[str, Any]) -> None:
+        self.delivered += result["success_count"]
+        self.failed += result["failure_count"]
+        self.pruned += result.get("pruned_count", 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {"delivered": self.delivered, "failed": self.failed, "pruned": self.pruned}
+
+    def __str__(self) -> str:
+        return f"전송 성공 {self.delivered}건, 실패 {self.failed}건, 만료 토큰 정리 {self.pruned}건"
+
+
+def resolve_fcm_tokens(db: Session, user_ids: Iterable[str]) -> Dict[str, str]:
+    """사용자들의 FCM 토큰을 한 번에 조회 (user_id -> fcm_token, 토큰이 없는 사용자는 제외)"""
+    user_ids = list(dict.fromkeys(user_ids))
+    tokens = {}
+    for start in range(0, len(user_ids), TOKEN_QUERY_CHUNK_SIZE):
+        chunk = user_ids[start:start + TOKEN_QUERY_CHUNK_SIZE]
+        tokens.update(
+            db.query(User.user_id, User.fcm_token)
+            .filter(User.user_id.in_(chunk), User.fcm_token.isnot(None), User.fcm_token != "")
+            .all()
+        )
+    return tokens
+
+
+def run_multicast_jobs(jobs: List[Tuple[List[str], str, str, Dict[str, str]]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    (토큰 최대 500개, 제목, 내용, data) 멀티캐스트 요청들을 최대 max_workers개씩 동시에 전송
+    반환: 요청별 FCMService.send_multicast_notification() 결과 (jobs와 같은 순서)
+    """
+    if not jobs:
+        return []
+
+    def send(job) -> Dict[str, Any]:
+        tokens, title, body, data = job
+        return FCMService.send_multicast_notification(tokens=tokens, title=title, body=body, data=data)
+
+    workers = min(max_workers or settings.FCM_FANOUT_WORKERS, len(jobs))
+    if workers <= 1:
+        return [send(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fcm-fanout") as executor:
+        return list(executor.map(send, jobs))
+
+
+def send_multicast_batches(
+    tokens: List[str],
+    title: str,
+    body: str,
+    data: Dict[str, str] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    토큰을 MULTICAST_BATCH_SIZE개씩 나눠 병렬 전송
+    반환: {"success_count", "failure_count", "responses"} (responses는 배치별 응답 목록, tokens와 같은 순서)
+    """
+    jobs = [
+        (tokens[start:start + MULTICAST_BATCH_SIZE], title, body, data)
+        for start in range(0, len(tokens), MULTICAST_BATCH_SIZE)
+    ]
+    results = run_multicast_jobs(jobs, max_workers)
+
+    return {
+        "success_count": sum(result["success_count"] for result in results),
+        "failure_count": sum(result["failure_count"] for result in results),
+        "responses": [result["responses"] for result in results]
+    }
+
+
+def _error_code(exception) -> str:
+    """FCM 예외의 오류 코드 (firebase_admin 예외의 code 속성)"""
+    return str(getattr(exception, "code", "") or "").upper()
+
+
+def find_invalid_tokens(tokens: List[str], batch_responses: List[list]) -> List[str]:
+    """
+    멀티캐스트 토큰별 응답에서 더 이상 유효하지 않은 토큰 찾기
+    - UNREGISTERED(앱 삭제/토큰 만료): 항상 정리
+    - INVALID_ARGUMENT: 같은 배치에서 성공한 토큰이 있을 때만 정리
+      (배치 전체가 실패했다면 토큰이 아니라 메시지 자체의 문제일 수 있음)
+    """
+    unregistered_error = getattr(messaging, "UnregisteredError", None)
+    invalid_tokens = []
+    for start, responses in zip(range(0, len(tokens), MULTICAST_BATCH_SIZE), batch_responses):
+        batch = tokens[start:start + MULTICAST_BATCH_SIZE]
+        any_success = any(response.success for response in responses)
+        for token, response in zip(batch, responses):
+            if response.success or response.exception is None:
+                continue
+            code = _error_code(response.exception)
+            if (unregistered_error is not None and isinstance(response.exception, unregistered_error)) \
+                    or code in UNREGISTERED_ERROR_CODES:
+                invalid_tokens.append(token)
+            elif code == INVALID_ARGUMENT_ERROR_CODE and any_success:
+                invalid_tokens.append(token)
+    return invalid_tokens
+
+
+def prune_fcm_tokens(db: Session, tokens: List[str]) -> int:
+    """유효하지 않은 토큰을 가진 사용자들의 fcm_token을 일괄 삭제하고 커밋 (반환: 정리된 사용자 수)"""
+    pruned = 0
+    for start in range(0, len(tokens), TOKEN_QUERY_CHUNK_SIZE):
+        chunk = tokens[start:start + TOKEN_QUERY_CHUNK_SIZE]
+        pruned += db.query(User).filter(User.fcm_token.in_(chunk)).update(
+            {User.fcm_token: None}, synchronize_session=False
+        )
+    if tokens:
+        db.commit()
+    return pruned
+
+
+def build_notification_data(notification_type: str, related_data: Dict[str, Any] = None) -> Dict[str, str]:
+    """FCM data 페이로드 (값은 모두 문자열)"""
+    return {
+        "type": notification_type,
+        "related_data": json.dumps(related_data) if related_data else ""
+    }
+
+
+def send_to_users(
+    db: Session,
+    user_ids: Iterable[str],
+    notification_type: str,
+    title: str,
+    message: str,
+    related_data: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    여러 사용자에게 같은 알림을 멀티캐스트로 전송하고 유효하지 않은 토큰 정리
+    반환: send_multicast_batches() 결과에 "tokens"(전송한 토큰 목록), "pruned_count"를 더한 dict
+    """
+    tokens_by_user = resolve_fcm_tokens(db, user_ids)
+    # 같은 기기를 여러 계정이 쓰는 경우 한 번만 전송
+    tokens = list(dict.fromkeys(tokens_by_user.values()))
+    result = send_multicast_batches(
+        tokens,
+        title=title,
+        body=message,
+        data=build_notification_data(notification_type, related_data)
+    )
+    result["tokens"] = tokens
+
+    result["pruned_count"] = 0
+    invalid_tokens = find_invalid_tokens(tokens, result["responses"])
+    if invalid_tokens:
+        try:
+            result["pruned_count"] = prune_fcm_tokens(db, invalid_tokens)
+        except Exception as e:
+            db.rollback()
+            print(f"만료된 FCM 토큰 정리 실패: {e}")
+    return result
+
+
+class NotificationGroup(NamedTuple):
+    """같은 내용을 받는 토큰 묶음 (send_notification_groups 입력)"""
+    tokens: List[str]
+    notification_type: str
+    title: str
+    message: str
+    related_data: Optional[Dict[str, Any]] = None
+
+
+def send_notification_groups(
+    db: Session,
+    groups: List[NotificationGroup],
+    stats: Optional[FanoutStats] = None,
+    answered_tokens: Optional[Set[str]] = None
+) -> List[int]:
+    """
+    내용이 서로 다른 여러 알림 묶음을 한 번에 전송
+    모든 묶음의 멀티캐스트 배치를 하나의 스레드 풀로 동시에 보내고, 유효하지 않은 토큰은 마지막에 한 번에 정리합니다.
+    answered_tokens: FCM이 토큰별 응답을 돌려준 배치의 토큰을 모을 집합 (선택, 요청 자체가 실패한 배치는 제외)
+    반환: 묶음별 전송에 성공한 토큰 수 (groups와 같은 순서)
+    """
+    jobs = []
+    owners = []
+    for index, group in enumerate(groups):
+        # 같은 기기를 여러 계정이 쓰는 경우 한 번만 전송
+        tokens = list(dict.fromkeys(token for token in group.tokens if token))
+        data = build_notification_data(group.notification_type, group.related_data)
+        for start in range(0, len(tokens), MULTICAST_BATCH_SIZE):
+            jobs.append((tokens[start:start + MULTICAST_BATCH_SIZE], group.title, group.message, data))
+            owners.append(index)
+
+    results = run_multicast_jobs(jobs)
+
+    sent_counts = [0] * len(groups)
+    total = {"success_count": 0, "failure_count": 0, "pruned_count": 0}
+    invalid_tokens = []
+    for job, owner, result in zip(jobs, owners, results):
+        sent_counts[owner] += result["success_count"]
+        total["success_count"] += result["success_count"]
+        total["failure_count"] += result["failure_count"]
+        invalid_tokens.extend(find_invalid_tokens(job[0], [result["responses"]]))
+        if answered_tokens is not None and result["responses"]:
+            answered_tokens.update(job[0])
+
+    if invalid_tokens:
+        try:
+            total["pruned_count"] = prune_fcm_tokens(db, list(dict.fromkeys(invalid_tokens)))
+        except Exception as e:
+            db.rollback()
+            print(f"만료된 FCM 토큰 정리 실패: {e}")
+
+    if stats is not None:
+        stats.add(total)
+    return sent_counts
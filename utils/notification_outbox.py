@@ -0,0 +1,239 @@
+"""
+푸시 알림 발송 대기열 (outbox)
+요청 처리 중에는 enqueue_notification()으로 알림을 업무 데이터와 같은 트랜잭션에 저장만 하고,
+백그라운드 디스패처(OutboxDispatcher)가 대기열을 배치로 꺼내 전송합니다.
+전송에 실패하면 지수 백오프로 재시도하고, 최대 시도 횟수를 넘기면 failed로 남깁니다.
+
+전송기는 NOTIFICATION_SENDER 설정으로 고릅니다.
+- fcm: Firebase 멀티캐스트 전송 (utils.notification_fanout)
+- fake: 실제 전송 없이 메모리에 기록 (로컬/테스트용)
+"""
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.notification_outbox import NotificationOutbox
+
+# processing 상태로 이 시간 이상 남아 있으면 디스패처가 중단된 것으로 보고 다시 전송
+STALE_CLAIM_SECONDS = 600
+
+# 디스패처 실행 결과 항목 (알림 수: claimed/sent/retried/failed, 토큰 수: delivered/undelivered/pruned)
+DISPATCH_STAT_KEYS = ("claimed", "sent", "retried", "failed", "delivered", "undelivered", "pruned")
+
+
+def enqueue_notification(
+    db: Session,
+    user_ids: Iterable[str],
+    notification_type: str,
+    title: str,
+    message: str,
+    related_data: Dict[str, Any] = None
+) -> Optional[NotificationOutbox]:
+    """알림을 대기열에 추가 (커밋은 호출 측 트랜잭션에서). 수신자가 없으면 None"""
+    user_ids = list(dict.fromkeys(user_id for user_id in user_ids if user_id))
+    if not user_ids:
+        return None
+
+    outbox = NotificationOutbox(
+        notification_type=notification_type,
+        user_ids=user_ids,
+        title=title,
+        message=message,
+        related_data=related_data,
+        status="pending",
+        attempts=0,
+        next_attempt_at=datetime.now()
+    )
+    db.add(outbox)
+    return outbox
+
+
+@contextmanager
+def notification_savepoint(db: Session):
+    """
+    알림 대기열 추가를 세이브포인트 안에서 실행
+    알림 조회/저장 중 오류가 나면 알림만 롤백하고 오류를 기록하므로, 호출 측의 업무 데이터는 그대로 커밋할 수 있습니다.
+    """
+    savepoint = db.begin_nested()
+    try:
+        yield
+        # 대기열 행을 여기서 flush해 저장 오류도 세이브포인트 안에서 처리
+        savepoint.commit()
+    except Exception as e:
+        savepoint.rollback()
+        print(f"알림 대기열 등록 실패 (알림만 취소): {e}")
+
+
+class FCMNotificationSender:
+    """FCM 멀티캐스트 전송기"""
+
+    def send(self, db: Session, outbox: NotificationOutbox) -> Dict[str, int]:
+        """
+        반환: {"delivered", "failed", "pruned"} 토큰 수
+        FCM 요청 자체가 실패하면 예외를 발생시켜 재시도
+        """
+        from utils.notification_fanout import send_to_users
+
+        result = send_to_users(
+            db, outbox.user_ids, outbox.notification_type, outbox.title, outbox.message, outbox.related_data
+        )
+        # 배치 요청이 통째로 실패해(응답 없음) 한 건도 전달되지 않은 경우만 재시도 (일부 성공 시 중복 전송 방지)
+        if result["success_count"] == 0 and any(not responses for responses in result["responses"]):
+            raise RuntimeError(f"FCM 전송 실패: 토큰 {len(result['tokens'])}개")
+        return {
+            "delivered": result["success_count"],
+            "failed": result["failure_count"],
+            "pruned": result["pruned_count"]
+        }
+
+
+class FakeNotificationSender:
+    """실제 전송 없이 보낸 알림을 메모리에 기록하는 전송기 (로컬/테스트용)"""
+
+    def __init__(self):
+        self.sent: List[dict] = []
+        self._lock = threading.Lock()
+
+    def send(self, db: Session, outbox: NotificationOutbox) -> Dict[str, int]:
+        with self._lock:
+            self.sent.append({
+                "notification_type": outbox.notification_type,
+                "user_ids": list(outbox.user_ids),
+                "title": outbox.title,
+                "message": outbox.message,
+                "related_data": outbox.related_data
+            })
+        return {"delivered": len(outbox.user_ids), "failed": 0, "pruned": 0}
+
+
+def create_notification_sender(name: Optional[str] = None):
+    """설정 이름으로 전송기 생성 (fcm | fake)"""
+    name = (name or settings.NOTIFICATION_SENDER).lower()
+    if name == "fake":
+        return FakeNotificationSender()
+    if name == "fcm":
+        return FCMNotificationSender()
+    raise ValueError(f"알 수 없는 NOTIFICATION_SENDER: {name}")
+
+
+class OutboxDispatcher:
+    """대기열의 알림을 배치로 꺼내 전송하고 결과를 기록"""
+
+    def __init__(
+        self,
+        sender=None,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        backoff_seconds: int = 30,
+        max_backoff_seconds: int = 3600
+    ):
+        self.sender = sender or create_notification_sender()
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+    def backoff(self, attempts: int) -> timedelta:
+        """attempts번째 실패 후 다음 시도까지 대기 시간"""
+        seconds = self.backoff_seconds * (2 ** (attempts - 1))
+        return timedelta(seconds=min(seconds, self.max_backoff_seconds))
+
+    def claim_batch(self, db: Session) -> List[NotificationOutbox]:
+        """전송할 알림을 processing으로 바꿔 가져감 (여러 워커가 동시에 실행해도 같은 알림을 가져가지 않음)"""
+        now = datetime.now()
+
+        # 디스패처가 전송 도중 중단되어 processing으로 남은 알림은 다시 대기 상태로
+        db.query(NotificationOutbox).filter(
+            NotificationOutbox.status == "processing",
+            NotificationOutbox.claimed_at < now - timedelta(seconds=STALE_CLAIM_SECONDS)
+        ).update({NotificationOutbox.status: "pending"}, synchronize_session=False)
+
+        outboxes = db.query(NotificationOutbox).filter(
+            NotificationOutbox.status == "pending",
+            NotificationOutbox.next_attempt_at <= now
+        ).order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)\
+            .limit(self.batch_size)\
+            .with_for_update(skip_locked=True)\
+            .all()
+
+        for outbox in outboxes:
+            outbox.status = "processing"
+            outbox.claimed_at = now
+        db.commit()
+        return outboxes
+
+    def dispatch_batch(self, db: Session) -> Dict[str, int]:
+        """
+        한 배치 전송
+        반환: 알림 수 {"claimed", "sent", "retried", "failed"}와 토큰 수 {"delivered", "undelivered", "pruned"}
+        """
+        outboxes = self.claim_batch(db)
+        stats = dict.fromkeys(DISPATCH_STAT_KEYS, 0)
+        stats["claimed"] = len(outboxes)
+
+        for outbox in outboxes:
+            try:
+                result = self.sender.send(db, outbox)
+                stats["delivered"] += result["delivered"]
+                stats["undelivered"] += result["failed"]
+                stats["pruned"] += result["pruned"]
+                outbox.sent_count = result["delivered"]
+                outbox.status = "sent"
+                outbox.sent_at = datetime.now()
+                outbox.last_error = None
+                stats["sent"] += 1
+            except Exception as e:
+                outbox.attempts += 1
+                outbox.last_error = str(e)[:1000]
+                if outbox.attempts >= self.max_attempts:
+                    outbox.status = "failed"
+                    stats["failed"] += 1
+                else:
+                    outbox.status = "pending"
+                    outbox.next_attempt_at = datetime.now() + self.backoff(outbox.attempts)
+                    stats["retried"] += 1
+                print(f"알림 전송 실패 (outbox {outbox.id}, {outbox.attempts}회): {e}")
+            # 전송 결과는 알림마다 바로 기록 (중간에 중단되어도 이미 보낸 알림은 다시 보내지 않음)
+            db.commit()
+
+        return stats
+
+    def dispatch_pending(self, db: Session, max_batches: int = 10) -> Dict[str, int]:
+        """대기열이 빌 때까지(최대 max_batches 배치) 전송"""
+        total = dict.fromkeys(DISPATCH_STAT_KEYS, 0)
+        for _ in range(max_batches):
+            stats = self.dispatch_batch(db)
+            for key, value in stats.items():
+                total[key] += value
+            if stats["claimed"] < self.batch_size:
+                break
+        return total
+
+
+_dispatcher: Optional[OutboxDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """설정으로 만든 프로세스 공용 디스패처"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = OutboxDispatcher(
+                batch_size=settings.NOTIFICATION_OUTBOX_BATCH_SIZE,
+                max_attempts=settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+                backoff_seconds=settings.NOTIFICATION_OUTBOX_BACKOFF_SECONDS,
+                max_backoff_seconds=settings.NOTIFICATION_OUTBOX_MAX_BACKOFF_SECONDS
+            )
+        return _dispatcher
+
+
+def set_outbox_dispatcher(dispatcher: Optional[OutboxDispatcher]) -> None:
+    """디스패처 교체 (테스트에서 FakeNotificationSender를 쓰는 디스패처로 바꿀 때)"""
+    global _dispatcher
+    with _dispatcher_lock:
+        _dispatcher = dispatcher
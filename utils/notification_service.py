@@ -2,12 +2,21 @@ from sqlalchemy.orm import Session
 from models.user import User
 from models.user_skill import UserSkill
 from models.contest import Contest, ContestFilter, ContestTag, Tag
-from models.recruitment import RecruitmentPost, Application, ApplicationStatus
+from models.recruitment import RecruitmentPost
 from models.skill import Skill
-from utils.fcm_service import FCMService
-from typing import List, Dict, Any
-import json
-from datetime import datetime, timedelta
+from utils.notification_fanout import FanoutStats, NotificationGroup, send_notification_groups
+from utils.deadline_query import REMINDER_DAYS, DeadlineReminder, load_deadline_reminders, load_contest_reminder
+from utils.deadline_ledger import prepare_deadline_ledger, mark_deadline_reminders_sent, purge_deadline_ledger
+from utils.db_lock import acquire_lock, release_lock, lock_owner_id
+from config import settings
+from utils.notification_outbox import enqueue_notification
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+
+# 마감일 알림 실행 잠금 이름
+DEADLINE_REMINDER_LOCK = "deadline_reminders"
+# 한 번에 보내고 전송 기록에 반영할 토큰 수
+DEADLINE_REMINDER_SLICE_TOKENS = 2000
 
 class NotificationService:
     """알림 서비스"""
@@ -21,31 +30,20 @@ class NotificationService:
         message: str,
         related_data: Dict[str, Any] = None
     ) -> bool:
-        """FCM 푸시 알림 전송 (데이터베이스 저장 없음)"""
+        """
+        FCM 푸시 알림을 발송 대기열에 추가
+        호출 측 트랜잭션에 함께 저장되며, 커밋 후 백그라운드 디스패처가 전송합니다.
+        """
         try:
-            # 사용자 조회
-            user = db.query(User).filter(User.user_id == user_id).first()
-            if not user or not user.fcm_token:
-                print(f"User not found or no FCM token: {user_id}")
-                return False
-            
-            # FCM 토큰으로 푸시 알림 전송
-            try:
-                FCMService.send_single_notification(
-                    token=user.fcm_token,
-                    title=title,
-                    body=message,
-                    data={
-                        "type": notification_type,
-                        "related_data": json.dumps(related_data) if related_data else ""
-                    }
-                )
-                print(f"FCM 알림 전송 성공: {user_id} - {title}")
-            except Exception as fcm_error:
-                print(f"FCM 전송 실패 (임시로 성공 처리): {fcm_error}")
-                # 임시로 FCM 오류를 무시하고 성공으로 처리
-                print(f"알림 내용: {title} - {message}")
-            
+            enqueue_notification(
+                db,
+                [user_id],
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                related_data=related_data
+            )
+            print(f"알림 대기열 등록: {user_id} - {title}")
             return True
             
         except Exception as e:
@@ -54,7 +52,7 @@ class NotificationService:
     
     @staticmethod
     def notify_new_contest(db: Session, contest: Contest) -> int:
-        """새로운 공모전 알림 전송"""
+        """새로운 공모전 알림을 발송 대기열에 추가 (반환: 수신 대상 사용자 수, 커밋은 호출 측에서)"""
         sent_count = 0
         
         try:
@@ -75,22 +73,20 @@ class NotificationService:
             
             user_ids = [user[0] for user in interested_users]
             
-            # 각 사용자에게 알림 전송
-            for user_id in user_ids:
-                success = NotificationService.create_notification(
-                    db=db,
-                    user_id=user_id,
-                    notification_type="new_contest",
-                    title="새로운 공모전이 등록되었습니다!",
-                    message=f"'{contest.name}' 공모전이 등록되었습니다. 확인해보세요!",
-                    related_data={
-                        "contest_id": contest.contest_id,
-                        "contest_name": contest.name,
-                        "due_date": contest.due_date.isoformat()
-                    }
-                )
-                if success:
-                    sent_count += 1
+            # 수신자 전체를 알림 하나로 대기열에 추가 (디스패처가 멀티캐스트로 전송)
+            if enqueue_notification(
+                db,
+                user_ids,
+                notification_type="new_contest",
+                title="새로운 공모전이 등록되었습니다!",
+                message=f"'{contest.name}' 공모전이 등록되었습니다. 확인해보세요!",
+                related_data={
+                    "contest_id": contest.contest_id,
+                    "contest_name": contest.name,
+                    "due_date": contest.due_date.isoformat()
+                }
+            ):
+                sent_count = len(user_ids)
             
             return sent_count
             
@@ -257,7 +253,7 @@ class NotificationService:
     
     @staticmethod
     def notify_new_contest_with_skill_matching(db: Session, contest: Contest) -> int:
-        """새로운 공모전 태그와 사용자 스킬 매칭 알림 전송"""
+        """새로운 공모전 태그와 사용자 스킬 매칭 알림을 발송 대기열에 추가 (반환: 수신 대상 사용자 수, 커밋은 호출 측에서)"""
         sent_count = 0
         
         try:
@@ -288,23 +284,21 @@ class NotificationService:
             
             print(f"매칭된 사용자 수: {len(user_ids)}")
             
-            # 각 사용자에게 알림 전송
-            for user_id in user_ids:
-                success = NotificationService.create_notification(
-                    db=db,
-                    user_id=user_id,
-                    notification_type="new_contest_skill_match",
-                    title="관련 공모전이 등록되었습니다!",
-                    message=f"'{contest.name}' 공모전이 등록되었습니다. {', '.join(tag_names)}과 관련이 있어요!",
-                    related_data={
-                        "contest_id": contest.contest_id,
-                        "contest_name": contest.name,
-                        "due_date": contest.due_date.isoformat(),
-                        "matching_tags": tag_names
-                    }
-                )
-                if success:
-                    sent_count += 1
+            # 수신자 전체를 알림 하나로 대기열에 추가 (디스패처가 멀티캐스트로 전송)
+            if enqueue_notification(
+                db,
+                user_ids,
+                notification_type="new_contest_skill_match",
+                title="관련 공모전이 등록되었습니다!",
+                message=f"'{contest.name}' 공모전이 등록되었습니다. {', '.join(tag_names)}과 관련이 있어요!",
+                related_data={
+                    "contest_id": contest.contest_id,
+                    "contest_name": contest.name,
+                    "due_date": contest.due_date.isoformat(),
+                    "matching_tags": tag_names
+                }
+            ):
+                sent_count = len(user_ids)
             
             return sent_count
             
@@ -317,60 +311,50 @@ class NotificationService:
 
     
     @staticmethod
-    def notify_contest_deadline_reminder(db: Session, contest: Contest, days_remaining: int) -> int:
-        """공모전 마감일 알림 전송 (특정 일수 남았을 때)"""
+    def deadline_reminder_group(reminder: DeadlineReminder) -> NotificationGroup:
+        """마감일 알림 대상으로 전송할 알림 묶음 생성"""
+        # 일수에 따른 메시지 생성
+        if reminder.days_remaining == 0:
+            title = "공모전 마감일입니다!"
+            message = f"'{reminder.contest_name}' 공모전이 오늘 마감됩니다!"
+        else:
+            title = f"공모전 마감 {reminder.days_remaining}일 전"
+            message = f"'{reminder.contest_name}' 공모전이 {reminder.days_remaining}일 후 마감됩니다!"
+        
+        return NotificationGroup(
+            tokens=[token for token in reminder.tokens_by_user.values() if token],
+            notification_type="contest_deadline_reminder",
+            title=title,
+            message=message,
+            related_data={
+                "contest_id": reminder.contest_id,
+                "contest_name": reminder.contest_name,
+                "due_date": reminder.due_date.isoformat(),
+                "days_remaining": reminder.days_remaining
+            }
+        )
+    
+    @staticmethod
+    def notify_contest_deadline_reminder(
+        db: Session,
+        contest: Contest,
+        days_remaining: int,
+        stats: Optional[FanoutStats] = None
+    ) -> int:
+        """공모전 마감일 알림 전송 (특정 일수 남았을 때, stats에 전송/실패/토큰 정리 수를 합산)"""
         sent_count = 0
         
         try:
-            # 공모전 모집글 작성자와 참여자들(status=accepted) 찾기
-            recruitment_posts = db.query(RecruitmentPost).filter(
-                RecruitmentPost.contest_id == contest.contest_id
-            ).all()
+            # 공모전 모집글 작성자와 참여자들(status=accepted)을 토큰과 함께 한 번에 조회
+            reminder = load_contest_reminder(db, contest, days_remaining)
             
-            target_user_ids = set()
-            
-            for post in recruitment_posts:
-                # 모집글 작성자 추가
-                target_user_ids.add(post.user_id)
-                
-                # 수락된 지원자들 추가
-                accepted_applications = db.query(Application).filter(
-                    Application.recruitment_post_id == post.recruitment_post_id,
-                    Application.status == ApplicationStatus.accepted
-                ).all()
-                
-                for app in accepted_applications:
-                    target_user_ids.add(app.user_id)
-            
-            if not target_user_ids:
+            if not reminder.tokens_by_user:
                 print(f"공모전 {contest.contest_id}에 관련된 사용자가 없습니다.")
                 return sent_count
             
-            # 일수에 따른 메시지 생성
-            if days_remaining == 0:
-                title = "공모전 마감일입니다!"
-                message = f"'{contest.name}' 공모전이 오늘 마감됩니다!"
-            else:
-                title = f"공모전 마감 {days_remaining}일 전"
-                message = f"'{contest.name}' 공모전이 {days_remaining}일 후 마감됩니다!"
-            
-            # 각 사용자에게 알림 전송
-            for user_id in target_user_ids:
-                success = NotificationService.create_notification(
-                    db=db,
-                    user_id=user_id,
-                    notification_type="contest_deadline_reminder",
-                    title=title,
-                    message=message,
-                    related_data={
-                        "contest_id": contest.contest_id,
-                        "contest_name": contest.name,
-                        "due_date": contest.due_date.isoformat(),
-                        "days_remaining": days_remaining
-                    }
-                )
-                if success:
-                    sent_count += 1
+            sent_count = send_notification_groups(
+                db, [NotificationService.deadline_reminder_group(reminder)], stats=stats
+            )[0]
             
             print(f"공모전 마감일 알림 전송 완료: {sent_count}명에게 전송 (마감 {days_remaining}일 전)")
             return sent_count
@@ -383,34 +367,85 @@ class NotificationService:
     
     @staticmethod
     def check_and_send_deadline_reminders(db: Session) -> Dict[str, int]:
-        """모든 공모전의 마감일을 확인하고 알림 전송"""
+        """
+        모든 공모전의 마감일을 확인하고 알림 전송
+        마감 30/10/5/1/0일 전인 공모전의 수신자를 쿼리 한 번으로 조회해 모든 알림을 함께 전송합니다.
+        - DB 잠금으로 여러 워커/크롤러가 동시에 실행하지 않도록 하고 (실행 중이면 빈 결과 반환, 잠금은 별도 세션에서 처리)
+        - 전송 기록(ledger)으로 (사용자, 공모전, 남은 일수)마다 한 번만 전송합니다.
+          FCM이 응답한 수신자만 sent로 기록하므로, 실행이 중단되거나 FCM 요청이 실패한 수신자는
+          같은 날 다시 실행할 때(매시 재시도 작업) 이어서 전송합니다.
+        발송 대기열(outbox)을 거치지 않고 직접 전송합니다. 중복 방지와 재시도는 ledger가 맡고,
+        수천 명 단위 알림을 공모전별 멀티캐스트로 묶어 보내야 하기 때문입니다.
+        반환: {"{contest_id}_{남은 일수}": 이번 실행에서 전송에 성공한 토큰 수}
+        """
+        owner = lock_owner_id()
+        try:
+            if not acquire_lock(DEADLINE_REMINDER_LOCK, owner, settings.DEADLINE_REMINDER_LOCK_TTL_SECONDS):
+                print("다른 프로세스에서 마감일 알림을 실행 중이라 건너뜁니다.")
+                return {}
+        except Exception as e:
+            print(f"마감일 알림 잠금 획득 실패: {e}")
+            return {}
+        
         try:
             today = datetime.now().date()
-            reminder_days = [30, 10, 5, 1, 0]  # 알림을 보낼 일수들
-            total_sent = {}
-            
-            # 마감일이 임박한 공모전들 조회
-            upcoming_contests = db.query(Contest).filter(
-                Contest.due_date >= today
-            ).all()
+            stats = FanoutStats()
+            
+            # 마감일이 임박한 공모전들의 알림 대상 (작성자 + 승인된 지원자, 토큰 포함)
+            reminders = load_deadline_reminders(db, today, REMINDER_DAYS)
+            # 이미 보낸 대상은 제외하고 새 대상은 pending으로 기록
+            reminders = prepare_deadline_ledger(db, reminders, today)
+            
+            total_sent = {f"{reminder.contest_id}_{reminder.days_remaining}": 0 for reminder in reminders}
+            
+            # 토큰 DEADLINE_REMINDER_SLICE_TOKENS개 정도씩 보내고 기록 (중단되어도 보낸 만큼은 다시 보내지 않음)
+            for batch in NotificationService._reminder_slices(reminders):
+                answered_tokens = set()
+                sent_counts = send_notification_groups(
+                    db,
+                    [NotificationService.deadline_reminder_group(reminder) for reminder in batch],
+                    stats=stats,
+                    answered_tokens=answered_tokens
+                )
+                mark_deadline_reminders_sent(db, batch, answered_tokens)
+                for reminder, sent_count in zip(batch, sent_counts):
+                    total_sent[f"{reminder.contest_id}_{reminder.days_remaining}"] = sent_count
+                # 실행이 길어져도 잠금이 만료되지 않도록 연장
+                acquire_lock(DEADLINE_REMINDER_LOCK, owner, settings.DEADLINE_REMINDER_LOCK_TTL_SECONDS)
             
-            for contest in upcoming_contests:
-                days_until_deadline = (contest.due_date - today).days
-                
-                # 알림을 보낼 일수인지 확인
-                if days_until_deadline in reminder_days:
-                    sent_count = NotificationService.notify_contest_deadline_reminder(
-                        db, contest, days_until_deadline
-                    )
-                    total_sent[f"{contest.contest_id}_{days_until_deadline}"] = sent_count
+            purge_deadline_ledger(db, today)
             
+            print(f"마감일 알림 실행 결과: 공모전 {len(reminders)}개, {stats}")
             return total_sent
             
         except Exception as e:
+            db.rollback()
             print(f"Error checking deadline reminders: {e}")
             import traceback
             traceback.print_exc()
             return {}
+        finally:
+            try:
+                release_lock(DEADLINE_REMINDER_LOCK, owner)
+            except Exception as e:
+                print(f"마감일 알림 잠금 해제 실패: {e}")
+    
+    @staticmethod
+    def _reminder_slices(reminders: List[DeadlineReminder]):
+        """공모전 알림을 토큰 수 기준으로 나눔 (공모전 하나는 나누지 않음)"""
+        batch = []
+        token_count = 0
+        for reminder in reminders:
+            if not reminder.tokens_by_user:
+                continue
+            batch.append(reminder)
+            token_count += len(reminder.tokens_by_user)
+            if token_count >= DEADLINE_REMINDER_SLICE_TOKENS:
+                yield batch
+                batch = []
+                token_count = 0
+        if batch:
+            yield batch
     
     @staticmethod
     def update_fcm_token(db: Session, user_id: str, fcm_token: str) -> bool:
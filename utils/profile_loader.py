@@ -0,0 +1,99 @@
+"""
+사용자 프로필(마이페이지) 조회
+스킬/역할/경험을 항목마다 따로 조회하지 않고 조인 쿼리로 한 번에 불러와
+사용자별로 캐시합니다. 프로필 수정 시 invalidate_user_caches()로 무효화됩니다.
+"""
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.user import User
+from models.skill import Skill
+from models.role import Role
+from models.user_skill import UserSkill
+from models.user_role import UserRole
+from models.experience import Experience
+from utils.cache import TTLCache, register_user_invalidator
+
+
+class UserProfile:
+    """마이페이지에 필요한 사용자 프로필 묶음 (캐시에 저장되므로 변경하지 않음)"""
+
+    __slots__ = ("user_id", "name", "email", "is_deleted", "skill_ids", "role_ids", "experiences")
+
+    def __init__(self, user: User, skill_ids: List[int], role_ids: List[int], experiences: List[dict]):
+        self.user_id = user.user_id
+        self.name = user.name
+        self.email = user.email
+        self.is_deleted = user.is_deleted
+        self.skill_ids = tuple(skill_ids)
+        self.role_ids = tuple(role_ids)
+        self.experiences = tuple(experiences)
+
+    def experience_list(self) -> List[dict]:
+        """응답용 경험 목록 (호출 측이 수정해도 캐시에 영향 없도록 복사)"""
+        return [dict(experience) for experience in self.experiences]
+
+
+profile_cache = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE,
+    ttl=settings.PROFILE_CACHE_TTL_SECONDS
+)
+register_user_invalidator(profile_cache.invalidate)
+
+
+def load_user_profile(db: Session, user_id: str, user: Optional[User] = None) -> Optional[UserProfile]:
+    """
+    사용자 프로필 조회 (캐시에 없으면 DB에서 조회 후 캐시)
+    user: 이미 조회한 User가 있으면 전달 (사용자 쿼리 생략). 사용자가 없으면 None
+    """
+    profile = profile_cache.get(user_id)
+    if profile is not None:
+        return profile
+
+    profile = _query_user_profile(db, user_id, user)
+    if profile is not None:
+        profile_cache.set(user_id, profile)
+    return profile
+
+
+def _query_user_profile(db: Session, user_id: str, user: Optional[User] = None) -> Optional[UserProfile]:
+    """DB에서 사용자 프로필 조회 (사용자, 스킬, 역할, 경험 최대 4번의 쿼리)"""
+    if user is None:
+        user = db.query(User).filter(User.user_id == user_id).first()
+        if not user:
+            return None
+
+    # 존재하는 스킬/역할만 (등록 순서 유지)
+    skill_ids = [
+        skill_id for (skill_id,) in db.query(Skill.skill_id)
+        .join(UserSkill, UserSkill.skill_id == Skill.skill_id)
+        .filter(UserSkill.user_id == user_id)
+        .order_by(UserSkill.user_skill_id)
+        .all()
+    ]
+    role_ids = [
+        role_id for (role_id,) in db.query(Role.role_id)
+        .join(UserRole, UserRole.role_id == Role.role_id)
+        .filter(UserRole.user_id == user_id)
+        .order_by(UserRole.user_role_id)
+        .all()
+    ]
+
+    experiences = [
+        {
+            "contest_name": exp.contest_name,
+            "award_date": exp.award_date,
+            "host_organization": exp.host_organization,
+            "award_status": exp.award_status,
+            "description": exp.description,
+            "filter_id": exp.filter_id
+        }
+        for exp in db.query(Experience)
+        .filter(Experience.user_id == user_id)
+        .order_by(Experience.experience_id)
+        .all()
+    ]
+
+    return UserProfile(user, skill_ids, role_ids, experiences)
@@ -0,0 +1,87 @@
+"""
+성향 프로필 매칭
+ProfileRule을 한 번 컴파일해 태그 -> 규칙 역색인을 만들고, 답변과 태그를 공유하는 규칙만 점수를 계산합니다.
+점수 계산과 동점 처리(먼저 나온 규칙 우선)는 기존 전체 규칙 순회 방식과 같습니다.
+"""
+from collections import Counter, defaultdict
+from typing import Dict, Sequence
+
+from sqlalchemy.orm import Session
+
+from models.personality import UserTraitProfile
+from utils.cache import invalidate_user_caches
+
+
+class ProfileMatcher:
+    """프로필 규칙 목록(순서 유지)으로 만든 매칭기"""
+
+    def __init__(self, profile_rules: Sequence):
+        """profile_rules: required_tags(태그 튜플 또는 None), priority 속성을 가진 규칙들"""
+        self.rules = tuple(profile_rules)
+        self.tag_counts = {}
+        # 태그 -> [(규칙 순서, 규칙 안에서 태그가 나온 횟수)]
+        self.index = defaultdict(list)
+        for order, rule in enumerate(self.rules):
+            if not rule.required_tags:
+                continue
+            self.tag_counts[order] = len(rule.required_tags)
+            for tag, multiplicity in Counter(rule.required_tags).items():
+                self.index[tag].append((order, multiplicity))
+        self.index = dict(self.index)
+
+    def best_match(self, traits: Dict[str, str]):
+        """답변 성향(traits)과 가장 잘 맞는 규칙 (일치하는 태그가 없으면 None)"""
+        match_counts = defaultdict(int)
+        for tag in set(traits.values()):
+            for order, multiplicity in self.index.get(tag, ()):
+                match_counts[order] += multiplicity
+
+        best_order = None
+        best_score = -1
+        for order in sorted(match_counts):
+            match_count = match_counts[order]
+            rule = self.rules[order]
+            # 매칭 비율과 우선순위를 고려한 점수 계산 (부분 일치도 고려)
+            match_ratio = match_count / self.tag_counts[order]
+            score = (match_ratio * 1000) - rule.priority + match_count
+            if score > best_score:
+                best_score = score
+                best_order = order
+
+        return self.rules[best_order] if best_order is not None else None
+
+
+def reprofile_all_users(db: Session, matcher: ProfileMatcher, batch_size: int = 1000) -> dict:
+    """
+    모든 사용자의 최신 성향 프로필(UserTraitProfile)의 profile_code를 현재 규칙으로 다시 계산
+    규칙이 바뀐 뒤 실행합니다. 반환: {"checked", "updated", "unmatched"}
+    """
+    # 사용자별 최신 결과만 남김 (created_at, id 순으로 정렬해 마지막 행이 최신)
+    latest = {}
+    for profile_id, user_id, profile_code, traits in db.query(
+        UserTraitProfile.id, UserTraitProfile.user_id, UserTraitProfile.profile_code, UserTraitProfile.traits_json
+    ).order_by(UserTraitProfile.user_id, UserTraitProfile.created_at, UserTraitProfile.id).yield_per(batch_size):
+        latest[user_id] = (profile_id, profile_code, traits)
+
+    updates = []
+    unmatched = 0
+    for user_id, (profile_id, profile_code, traits) in latest.items():
+        rule = matcher.best_match(traits) if isinstance(traits, dict) else None
+        if rule is None:
+            unmatched += 1
+            continue
+        if rule.profile_code != profile_code:
+            updates.append({"id": profile_id, "profile_code": rule.profile_code, "user_id": user_id})
+
+    for start in range(0, len(updates), batch_size):
+        batch = updates[start:start + batch_size]
+        db.bulk_update_mappings(UserTraitProfile, [{"id": item["id"], "profile_code": item["profile_code"]} for item in batch])
+        db.commit()
+
+    # 시너지 분석/마이페이지 등 사용자 캐시 무효화
+    if updates:
+        invalidate_user_caches([item["user_id"] for item in updates])
+
+    print(f"성향 프로필 재계산 완료: {len(latest)}명 확인, {len(updates)}명 변경, {unmatched}명 매칭 실패")
+    return {"checked": len(latest), "updated": len(updates), "unmatched": unmatched}
+
@@ -0,0 +1,41 @@
+"""
+모집 게시글 승인된 지원자 수(accepted_count) 관리
+지원 상태가 바뀌는 트랜잭션 안에서 카운터를 함께 갱신하고,
+어긋난 값은 reconcile_accepted_counts()가 applications 테이블 기준으로 바로잡습니다.
+"""
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from models.recruitment import RecruitmentPost, Application, ApplicationStatus
+
+
+def adjust_accepted_count(db: Session, recruitment_post_id: int, delta: int) -> None:
+    """승인된 지원자 수를 delta만큼 증감 (커밋은 호출 측 트랜잭션에서)"""
+    if not delta:
+        return
+    db.query(RecruitmentPost).filter(
+        RecruitmentPost.recruitment_post_id == recruitment_post_id
+    ).update(
+        {RecruitmentPost.accepted_count: RecruitmentPost.accepted_count + delta},
+        synchronize_session=False
+    )
+
+
+def reconcile_accepted_counts(db: Session) -> int:
+    """
+    모든 게시글의 accepted_count를 실제 승인된 지원 수로 맞춤
+    반환: 값이 달라 수정된 게시글 수
+    """
+    actual_count = select(func.count(Application.application_id)).where(
+        Application.recruitment_post_id == RecruitmentPost.recruitment_post_id,
+        Application.status == ApplicationStatus.accepted
+    ).correlate(RecruitmentPost).scalar_subquery()
+
+    result = db.execute(
+        update(RecruitmentPost)
+        .where(RecruitmentPost.accepted_count != actual_count)
+        .values(accepted_count=actual_count)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,120 @@
+"""
+모집 게시글 조회 공통 로직
+게시글마다 공모전 필터를 따로 조회하지 않고, 그룹 집계 서브쿼리를 조인한 쿼리 한 번으로
+목록/상세 응답에 필요한 값을 함께 불러옵니다. 승인된 지원자 수는 RecruitmentPost.accepted_count를 사용합니다.
+피드는 (created_at, recruitment_post_id) 내림차순 커서 페이지네이션을 지원합니다.
+created_at이 없는 게시글은 커서를 만들 수 없고 응답 스키마에도 맞지 않으므로 피드에서 제외합니다.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import func, or_, and_, not_
+from sqlalchemy.orm import Session, Query
+
+from models.recruitment import RecruitmentPost
+from models.contest import Contest, ContestFilter
+
+FEED_STATUSES = ("open", "closed")
+
+
+def recruitment_post_query(db: Session) -> Query:
+    """
+    (게시글, 마감일, 공모전명, 승인된 지원자 수, 필터 ID) 행을 반환하는 쿼리
+    필터는 공모전당 하나이므로 가장 작은 filter_id를 사용합니다.
+    """
+    contest_filters = db.query(
+        ContestFilter.contest_id.label("contest_id"),
+        func.min(ContestFilter.filter_id).label("filter_id")
+    ).group_by(ContestFilter.contest_id).subquery()
+
+    return db.query(
+        RecruitmentPost,
+        Contest.due_date,
+        Contest.name,
+        RecruitmentPost.accepted_count,
+        contest_filters.c.filter_id
+    ).join(
+        Contest, RecruitmentPost.contest_id == Contest.contest_id
+    ).outerjoin(
+        contest_filters, contest_filters.c.contest_id == RecruitmentPost.contest_id
+    )
+
+
+def recruitment_feed_query(
+    db: Session,
+    filter_id: Optional[int] = None,
+    contest_id: Optional[int] = None,
+    status: Optional[str] = None,
+    author: Optional[str] = None
+) -> Query:
+    """
+    최신순 모집 게시글 피드 쿼리 (created_at이 없는 게시글 제외)
+    status: open(마감 전이고 모집 인원이 남은 게시글) / closed(그 외), author: 작성자 user_id
+    """
+    query = recruitment_post_query(db).filter(RecruitmentPost.created_at.isnot(None))
+    if filter_id is not None:
+        filtered_contest_ids = db.query(ContestFilter.contest_id).filter(ContestFilter.filter_id == filter_id)
+        query = query.filter(RecruitmentPost.contest_id.in_(filtered_contest_ids))
+    if contest_id is not None:
+        query = query.filter(RecruitmentPost.contest_id == contest_id)
+    if author:
+        query = query.filter(RecruitmentPost.user_id == author)
+    if status:
+        if status not in FEED_STATUSES:
+            raise ValueError(f"status는 {', '.join(FEED_STATUSES)} 중 하나여야 합니다.")
+        is_open = and_(Contest.due_date >= date.today(), RecruitmentPost.accepted_count < RecruitmentPost.recruitment_count)
+        query = query.filter(is_open if status == "open" else not_(is_open))
+    return query.order_by(RecruitmentPost.created_at.desc(), RecruitmentPost.recruitment_post_id.desc())
+
+
+def encode_feed_cursor(post: RecruitmentPost) -> str:
+    """마지막 게시글의 (created_at, recruitment_post_id)를 불투명한 커서 문자열로 변환"""
+    payload = json.dumps([post.created_at.isoformat(), post.recruitment_post_id])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_feed_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, recruitment_post_id)로 변환 (형식이 잘못되면 ValueError)"""
+    try:
+        created_at, recruitment_post_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return datetime.fromisoformat(created_at), int(recruitment_post_id)
+    except Exception:
+        raise ValueError("잘못된 커서입니다.")
+
+
+def paginate_feed(query: Query, limit: int, cursor: Optional[str] = None):
+    """
+    커서 이후 (created_at, recruitment_post_id) < (커서 값)인 게시글을 limit개 조회
+    반환: (recruitment_post_query 행 목록, 다음 페이지 커서 또는 None)
+    """
+    if cursor:
+        created_at, recruitment_post_id = decode_feed_cursor(cursor)
+        query = query.filter(or_(
+            RecruitmentPost.created_at < created_at,
+            and_(RecruitmentPost.created_at == created_at, RecruitmentPost.recruitment_post_id < recruitment_post_id)
+        ))
+
+    # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+    rows = query.limit(limit + 1).all()
+    next_cursor = encode_feed_cursor(rows[limit - 1][0]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+def to_post_dict(row) -> dict:
+    """recruitment_post_query 결과 한 행을 RecruitmentPostList/RecruitmentPostResponse 필드로 변환"""
+    post, due_date, contest_name, accepted_count, filter_id = row
+    return {
+        "recruitment_post_id": post.recruitment_post_id,
+        "title": post.title,
+        "content": post.content,
+        "recruitment_count": post.recruitment_count,
+        "contest_id": post.contest_id,
+        "contest_name": contest_name,
+        "user_id": post.user_id,
+        "created_at": post.created_at,
+        "due_date": due_date,
+        "accepted_count": accepted_count,
+        "filter_id": filter_id
+    }
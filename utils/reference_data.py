@@ -0,0 +1,162 @@
+"""
+참조 데이터 캐시
+스킬/역할/필터/성향 질문과 보기/프로필 규칙처럼 거의 바뀌지 않는 테이블을 프로세스 메모리에 올려두고
+라우터에 읽기 전용 맵으로 제공합니다.
+
+- 서버 시작 시 한 번 로드하고, 사용자 정의 스킬/역할이 추가되면 refresh()로 다시 로드합니다.
+- 다른 워커 프로세스에서 추가된 데이터는 REFERENCE_DATA_TTL_SECONDS가 지나면 반영됩니다.
+- POST /reference-data/refresh로 수동 갱신할 수 있습니다.
+"""
+import json
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from models.skill import Skill
+from models.role import Role
+from models.contest import Filter
+from models.personality import Question, Option, ProfileRule
+from utils.profile_matcher import ProfileMatcher
+
+
+class SkillRef(NamedTuple):
+    skill_id: int
+    name: str
+
+
+class RoleRef(NamedTuple):
+    role_id: int
+    name: str
+
+
+class FilterRef(NamedTuple):
+    filter_id: int
+    name: str
+
+
+class OptionRef(NamedTuple):
+    id: int
+    question_id: int
+    code: str
+    text: str
+    trait_tag: str
+    order_no: int
+
+
+class QuestionRef(NamedTuple):
+    id: int
+    order_no: int
+    key_name: str
+    text: str
+    options: Tuple[OptionRef, ...]  # order_no 순
+
+
+class ProfileRuleRef(NamedTuple):
+    id: int
+    profile_code: str
+    display_name: str
+    description: str
+    required_tags: Optional[Tuple[str, ...]]  # 파싱할 수 없는 규칙은 None
+    priority: int
+
+
+def parse_required_tags(required_tags_json) -> Optional[Tuple[str, ...]]:
+    """required_tags_json을 태그 튜플로 변환 (문자열이면 JSON 파싱, 리스트가 아니면 None)"""
+    required_tags = required_tags_json
+    if isinstance(required_tags, str):
+        try:
+            required_tags = json.loads(required_tags)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(required_tags, list):
+        return None
+    return tuple(required_tags)
+
+
+class ReferenceData:
+    """한 시점의 참조 데이터 (모든 맵은 읽기 전용)"""
+
+    def __init__(self, skills, roles, filters, questions, profile_rules):
+        self.loaded_at = time.monotonic()
+        self.skills: Mapping[int, SkillRef] = MappingProxyType({skill.skill_id: skill for skill in skills})
+        self.roles: Mapping[int, RoleRef] = MappingProxyType({role.role_id: role for role in roles})
+        self.filters: Mapping[int, FilterRef] = MappingProxyType({item.filter_id: item for item in filters})
+        self.questions: Mapping[int, QuestionRef] = MappingProxyType({question.id: question for question in questions})
+        self.options: Mapping[int, OptionRef] = MappingProxyType({
+            option.id: option for question in questions for option in question.options
+        })
+        self.profile_rules: Tuple[ProfileRuleRef, ...] = tuple(profile_rules)
+        self.profile_matcher = ProfileMatcher(self.profile_rules)
+
+    def option_by_order(self, question_id: int, order_no: int) -> Optional[OptionRef]:
+        """질문의 order_no번째 보기"""
+        question = self.questions.get(question_id)
+        if not question:
+            return None
+        return next((option for option in question.options if option.order_no == order_no), None)
+
+
+class ReferenceDataCache:
+    """참조 데이터 스냅샷을 보관하고 필요할 때 통째로 교체"""
+
+    def __init__(self, ttl: float = 600):
+        self.ttl = ttl
+        self._data: Optional[ReferenceData] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Optional[Session] = None) -> ReferenceData:
+        """현재 참조 데이터 (아직 로드하지 않았거나 TTL이 지났으면 로드)"""
+        data = self._data
+        if data is not None and time.monotonic() - data.loaded_at < self.ttl:
+            return data
+        return self.refresh(db)
+
+    def refresh(self, db: Optional[Session] = None) -> ReferenceData:
+        """DB에서 다시 로드 (db가 없으면 새 세션 사용)"""
+        with self._lock:
+            if db is not None:
+                self._data = self._load(db)
+            else:
+                from database import SessionLocal
+
+                session = SessionLocal()
+                try:
+                    self._data = self._load(session)
+                finally:
+                    session.close()
+            return self._data
+
+    @staticmethod
+    def _load(db: Session) -> ReferenceData:
+        """스킬, 역할, 필터, 질문, 보기, 프로필 규칙 (쿼리 6번)"""
+        skills = [SkillRef(skill_id, name) for skill_id, name in
+                  db.query(Skill.skill_id, Skill.name).order_by(Skill.skill_id).all()]
+        roles = [RoleRef(role_id, name) for role_id, name in
+                 db.query(Role.role_id, Role.name).order_by(Role.role_id).all()]
+        filters = [FilterRef(filter_id, name) for filter_id, name in
+                   db.query(Filter.filter_id, Filter.name).order_by(Filter.filter_id).all()]
+
+        options_by_question = {}
+        for option in db.query(Option).order_by(Option.question_id, Option.order_no, Option.id).all():
+            options_by_question.setdefault(option.question_id, []).append(OptionRef(
+                option.id, option.question_id, option.code, option.text, option.trait_tag, option.order_no
+            ))
+        questions = [
+            QuestionRef(question.id, question.order_no, question.key_name, question.text,
+                        tuple(options_by_question.get(question.id, ())))
+            for question in db.query(Question).order_by(Question.order_no, Question.id).all()
+        ]
+
+        profile_rules = [
+            ProfileRuleRef(rule.id, rule.profile_code, rule.display_name, rule.description,
+                           parse_required_tags(rule.required_tags_json), rule.priority)
+            for rule in db.query(ProfileRule).order_by(ProfileRule.id).all()
+        ]
+        return ReferenceData(skills, roles, filters, questions, profile_rules)
+
+
+reference_data = ReferenceDataCache(ttl=settings.REFERENCE_DATA_TTL_SECONDS)
@@ -0,0 +1,39 @@
+"""
+성향 프로필 일괄 재계산 (관리 작업)
+프로필 규칙(profile_rules)을 바꾼 뒤 모든 사용자의 최신 성향 프로필을 현재 규칙으로 다시 계산합니다.
+전체 사용자를 수정하는 작업이므로 공개 API로 두지 않고 서버 관리자가 직접 실행합니다.
+    python -m utils.reprofile
+
+다른 워커 프로세스의 참조 데이터/사용자 캐시는 각 캐시의 TTL이 지나면 반영됩니다.
+"""
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (스크립트로 실행할 때)
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+
+from sqlalchemy.orm import Session
+
+from utils.profile_matcher import reprofile_all_users
+from utils.reference_data import reference_data
+
+
+def reprofile(db: Session) -> dict:
+    """최신 프로필 규칙을 다시 로드해 모든 사용자의 성향 프로필 재계산 (반환: {"checked", "updated", "unmatched"})"""
+    references = reference_data.refresh(db)
+    return reprofile_all_users(db, references.profile_matcher)
+
+
+if __name__ == "__main__":
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        reprofile(db)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
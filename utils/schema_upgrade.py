@@ -0,0 +1,87 @@
+"""
+기존 데이터베이스 스키마 보강
+Base.metadata.create_all()은 새 테이블만 만들고 이미 있는 테이블에는 컬럼/인덱스를 추가하지 않으므로,
+이후에 추가된 컬럼과 인덱스를 없을 때만 추가합니다 (여러 번 실행해도 안전).
+
+- recruitment_posts.accepted_count 컬럼 (추가한 경우 승인된 지원 수로 바로 채움)
+- contests / recruitment_posts / applications 조회용 인덱스
+
+서버 시작 시(main.init_database) 자동 실행되며, 직접 실행할 수도 있습니다.
+    python -m utils.schema_upgrade
+"""
+import os
+import sys
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+# 프로젝트 루트를 import 경로에 추가 (스크립트로 실행할 때)
+_BACKEND_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BACKEND_ROOT not in sys.path:
+    sys.path.append(_BACKEND_ROOT)
+
+from models.contest import Contest
+from models.recruitment import RecruitmentPost, Application
+
+# (테이블, 컬럼, 추가 DDL)
+ADDED_COLUMNS = [
+    (
+        "recruitment_posts",
+        "accepted_count",
+        "ALTER TABLE recruitment_posts ADD COLUMN accepted_count INT NOT NULL DEFAULT 0"
+    ),
+]
+
+# 기존 테이블에 나중에 추가된 인덱스
+ADDED_INDEXES = [
+    index
+    for model in (Contest, RecruitmentPost, Application)
+    for index in model.__table__.indexes
+    if index.name and index.name.startswith("ix_")
+]
+
+
+def upgrade_schema(engine: Engine) -> dict:
+    """
+    없는 컬럼/인덱스만 추가
+    반환: {"columns": 추가한 컬럼 목록, "indexes": 추가한 인덱스 목록}
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    added = {"columns": [], "indexes": []}
+
+    with engine.begin() as conn:
+        for table, column, ddl in ADDED_COLUMNS:
+            if table not in tables:
+                continue
+            if column not in {col["name"] for col in inspector.get_columns(table)}:
+                conn.execute(text(ddl))
+                added["columns"].append(f"{table}.{column}")
+
+        for index in ADDED_INDEXES:
+            table = index.table.name
+            if table not in tables:
+                continue
+            if index.name not in {idx["name"] for idx in inspector.get_indexes(table)}:
+                index.create(bind=conn)
+                added["indexes"].append(index.name)
+
+    if "recruitment_posts.accepted_count" in added["columns"]:
+        # 새로 추가된 카운터를 applications 테이블 기준으로 채움
+        from database import SessionLocal
+        from utils.recruitment_counter import reconcile_accepted_counts
+
+        db = SessionLocal()
+        try:
+            reconcile_accepted_counts(db)
+        finally:
+            db.close()
+
+    return added
+
+
+if __name__ == "__main__":
+    from database import engine
+
+    result = upgrade_schema(engine)
+    print(f"스키마 보강 완료: 컬럼 {result['columns'] or '없음'}, 인덱스 {result['indexes'] or '없음'}")
@@ -0,0 +1,193 @@
+"""
+시너지 분석 대상 사용자 일괄 로더
+요청된 모든 사용자의 스킬/역할/경험/성향 정보를 사용자 수와 무관하게 고정된 횟수의 IN (...) 쿼리로 조회합니다.
+조회 결과는 사용자별로 LRU + TTL 캐시에 보관되며, 프로필/성향 변경 시 invalidate_user_caches로 무효화됩니다.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from config import settings
+
+from models.user import User
+from models.user_skill import UserSkill
+from models.user_role import UserRole
+from models.skill import Skill
+from models.role import Role
+from models.experience import Experience
+from models.personality import UserTraitProfile, ProfileRule
+from schemas.synergy import SynergyUser, UserSkill as UserSkillSchema, UserRole as UserRoleSchema, UserTrait, ApplicantData
+from utils.cache import TTLCache, register_user_invalidator
+
+
+class SynergyMember:
+    """시너지 분석용 사용자 데이터 (응답용 SynergyUser + 모델 입력용 ApplicantData)"""
+
+    def __init__(self, user: SynergyUser, applicant: ApplicantData):
+        self.user = user
+        self.applicant = applicant
+        # 전처리기가 파싱한 MemberRecord (처음 예측할 때 채워지고 캐시와 함께 재사용됨)
+        self.record = None
+
+    @property
+    def user_id(self) -> str:
+        return self.user.user_id
+
+
+def map_tags_to_fields(required_tags: List[str]) -> dict:
+    """required_tags_json을 tendency_type, goal, time, problem으로 매핑"""
+    mapping = {
+        'tendency_type': None,
+        'goal': None,
+        'time': None,
+        'problem': None
+    }
+
+    for tag in required_tags:
+        if tag in ['LEADER', 'SUPPORTER']:
+            mapping['tendency_type'] = tag
+        elif tag in ['QUALITY', 'SCHEDULE']:
+            mapping['goal'] = tag
+        elif tag in ['MORNING', 'NIGHT']:
+            mapping['time'] = tag
+        elif tag in ['ANALYTIC', 'ADHOC']:
+            mapping['problem'] = tag
+
+    return mapping
+
+
+# 사용자별 SynergyMember 캐시 (user_id -> SynergyMember)
+synergy_member_cache = TTLCache(
+    maxsize=settings.SYNERGY_MEMBER_CACHE_SIZE,
+    ttl=settings.SYNERGY_MEMBER_CACHE_TTL_SECONDS
+)
+register_user_invalidator(synergy_member_cache.invalidate)
+
+
+def load_synergy_members(db: Session, user_ids: Iterable[str]) -> Dict[str, SynergyMember]:
+    """
+    활성 사용자들의 SynergyMember를 요청 순서대로 user_id -> SynergyMember 딕셔너리로 반환합니다.
+    캐시에 없는 사용자만 DB에서 조회합니다.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    members = {}
+    missing_ids = []
+    for user_id in user_ids:
+        member = synergy_member_cache.get(user_id)
+        if member is None:
+            missing_ids.append(user_id)
+        else:
+            members[user_id] = member
+
+    if missing_ids:
+        for user_id, member in _query_synergy_members(db, missing_ids).items():
+            synergy_member_cache.set(user_id, member)
+            members[user_id] = member
+
+    return {user_id: members[user_id] for user_id in user_ids if user_id in members}
+
+
+def _query_synergy_members(db: Session, user_ids: List[str]) -> Dict[str, SynergyMember]:
+    """DB에서 SynergyMember 일괄 조회 (사용자, 스킬, 역할, 경험, 성향 프로필, 프로필 규칙 총 6번의 쿼리)"""
+    if not user_ids:
+        return {}
+
+    # 요청된 사용자들 조회 (탈퇴 사용자 제외)
+    users = db.query(User.user_id).filter(
+        User.user_id.in_(user_ids),
+        User.is_deleted == False
+    ).all()
+    active_ids = [user_id for (user_id,) in users]
+    if not active_ids:
+        return {}
+
+    skills_by_user = defaultdict(list)
+    for user_id, skill_name in db.query(UserSkill.user_id, Skill.name)\
+            .join(Skill, UserSkill.skill_id == Skill.skill_id)\
+            .filter(UserSkill.user_id.in_(active_ids))\
+            .order_by(UserSkill.user_skill_id)\
+            .all():
+        skills_by_user[user_id].append(skill_name)
+
+    roles_by_user = defaultdict(list)
+    for user_id, role_name in db.query(UserRole.user_id, Role.name)\
+            .join(Role, UserRole.role_id == Role.role_id)\
+            .filter(UserRole.user_id.in_(active_ids))\
+            .order_by(UserRole.user_role_id)\
+            .all():
+        roles_by_user[user_id].append(role_name)
+
+    # 경험은 filter_id:award_status 형식으로 변환
+    experiences_by_user = defaultdict(list)
+    for user_id, filter_id, award_status in db.query(
+            Experience.user_id, Experience.filter_id, Experience.award_status
+    ).filter(Experience.user_id.in_(active_ids)).order_by(Experience.experience_id).all():
+        experiences_by_user[user_id].append(f"{filter_id}:{award_status}")
+
+    # 사용자별 최신 성향 프로필 (최신순으로 정렬해 사용자별 첫 행만 사용)
+    profile_codes = {}
+    for user_id, profile_code in db.query(UserTraitProfile.user_id, UserTraitProfile.profile_code)\
+            .filter(UserTraitProfile.user_id.in_(active_ids))\
+            .order_by(UserTraitProfile.created_at.desc(), UserTraitProfile.id.desc())\
+            .all():
+        profile_codes.setdefault(user_id, profile_code)
+
+    # profile_rules 테이블에서 display_name, required_tags_json 조회
+    rules = {}
+    codes = {code for code in profile_codes.values() if code}
+    if codes:
+        rules = {
+            rule.profile_code: rule
+            for rule in db.query(ProfileRule).filter(ProfileRule.profile_code.in_(codes)).all()
+        }
+
+    return {
+        user_id: build_synergy_member(
+            user_id=user_id,
+            skill_names=skills_by_user[user_id],
+            role_names=roles_by_user[user_id],
+            experience_parts=experiences_by_user[user_id],
+            profile_code=profile_codes.get(user_id),
+            profile_rule=rules.get(profile_codes.get(user_id))
+        )
+        for user_id in active_ids
+    }
+
+
+def build_synergy_member(
+    user_id: str,
+    skill_names: List[str],
+    role_names: List[str],
+    experience_parts: List[str],
+    profile_code: Optional[str],
+    profile_rule: Optional[ProfileRule]
+) -> SynergyMember:
+    """조회한 원본 데이터로 SynergyUser와 ApplicantData를 함께 생성"""
+    traits = None
+    required_tags = []
+    if profile_code:
+        traits = UserTrait(
+            profile_code=profile_code,
+            display_name=profile_rule.display_name if profile_rule else profile_code
+        )
+        required_tags = profile_rule.required_tags_json if profile_rule else []
+
+    tag_mapping = map_tags_to_fields(required_tags)
+
+    user = SynergyUser(
+        user_id=user_id,
+        skills=[UserSkillSchema(skill_name=name) for name in skill_names],
+        roles=[UserRoleSchema(role_name=name) for name in role_names],
+        traits=traits
+    )
+    applicant = ApplicantData(
+        role=", ".join(role_names),
+        skill=", ".join(skill_names),
+        experience=", ".join(experience_parts),
+        tendency_type=tag_mapping['tendency_type'] or "UNKNOWN",
+        goal=tag_mapping['goal'] or "UNKNOWN",
+        time=tag_mapping['time'] or "UNKNOWN",
+        problem=tag_mapping['problem'] or "UNKNOWN"
+    )
+    return SynergyMember(user=user, applicant=applicant)